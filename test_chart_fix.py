@@ -0,0 +1,176 @@
+"""
+チャート操作の動作確認スクリプト
+
+起動中のxlwings-rpcサーバーに対してチャート関連のRPCメソッドを
+実行し、各チャートタイプが正しく設定できることを確認します。
+
+セットアップ呼び出しはデータ依存があるため逐次実行し、互いに独立な
+チャートタイプの設定はkeep-aliveで使い回すHTTP/1.1のコネクション
+プール上で並行に実行します。
+
+使い方:
+    1. xlwings-rpcサーバーを起動する: python -m xlwings_rpc
+    2. このスクリプトを実行する: python test_chart_fix.py
+"""
+import asyncio
+import logging
+
+# ロガーの設定
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("test_chart_fix")
+
+
+def create_request(method, params=None, request_id=1):
+    """
+    JSON-RPC 2.0リクエストオブジェクトを作成します。
+
+    Args:
+        method: メソッド名
+        params: パラメータオブジェクト (オプション)
+        request_id: リクエストID
+
+    Returns:
+        JSON-RPCリクエストの辞書
+    """
+    request = {
+        "jsonrpc": "2.0",
+        "method": method,
+        "id": request_id
+    }
+    if params is not None:
+        request["params"] = params
+    return request
+
+
+async def send_request(client, method, params=None, request_id=1):
+    """
+    JSON-RPCリクエストを送信してレスポンスを返します。
+
+    Args:
+        client: 使用するHTTPクライアント
+        method: メソッド名
+        params: パラメータオブジェクト (オプション)
+        request_id: リクエストID
+
+    Returns:
+        JSON-RPCレスポンスの辞書
+    """
+    payload = create_request(method, params, request_id)
+    response = await client.post("/rpc", json=payload)
+    return response.json()
+
+
+async def test_chart_types():
+    """
+    各チャートタイプを設定して動作を確認します。
+    """
+    # httpxはここで初めて読み込む
+    # (テストコレクタがこのファイルをインポートしてもHTTPスタックを読み込まない)
+    import httpx
+
+    async with httpx.AsyncClient(
+        base_url="http://127.0.0.1:8000",
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        timeout=30.0,
+    ) as client:
+        # Excelアプリケーションの作成
+        response = await send_request(client, "app.create", {"visible": True}, 1)
+        if "error" in response:
+            logger.error(f"Failed to create app: {response['error']}")
+            return
+        pid = response["result"]["id"]
+        logger.info(f"Created Excel app with PID {pid}")
+
+        # ワークブックの作成
+        response = await send_request(client, "book.create", {"pid": pid}, 2)
+        if "error" in response:
+            logger.error(f"Failed to create book: {response['error']}")
+            return
+        book_name = response["result"]["name"]
+        logger.info(f"Created workbook '{book_name}'")
+
+        # テストデータの書き込み
+        data = [["Category", "Value"],
+                ["A", 10], ["B", 25], ["C", 17], ["D", 32]]
+        response = await send_request(client, "range.set_value", {
+            "book": book_name,
+            "sheet": 0,
+            "address": "A1:B5",
+            "value": data,
+            "pid": pid
+        }, 3)
+        if "error" in response:
+            logger.error(f"Failed to set values: {response['error']}")
+            return
+        logger.info("Wrote test data to A1:B5")
+
+        # チャートの作成
+        response = await send_request(client, "chart.add", {
+            "book": book_name,
+            "sheet": 0,
+            "source": "A1:B5",
+            "chart_type": "line",
+            "pid": pid
+        }, 4)
+        if "error" in response:
+            logger.error(f"Failed to add chart: {response['error']}")
+            return
+        chart_name = response["result"]["name"]
+        logger.info(f"Created chart '{chart_name}'")
+
+        # 各チャートタイプの設定は互いに独立なため並行に送信する
+        chart_types = ["line", "bar", "column", "area",
+                       "pie", "scatter", "radar", "doughnut"]
+        responses = await asyncio.gather(*[
+            send_request(client, "chart.set_chart_type", {
+                "book": book_name,
+                "sheet": 0,
+                "chart": chart_name,
+                "chart_type": chart_type,
+                "pid": pid
+            }, 7 + i)
+            for i, chart_type in enumerate(chart_types)
+        ])
+
+        results = {}
+        for chart_type, response in zip(chart_types, responses):
+            results[chart_type] = response
+            if "error" in response:
+                logger.error(f"Failed to set chart type '{chart_type}': {response['error']}")
+            else:
+                logger.info(f"Set chart type '{chart_type}': {response['result']['chart_type']}")
+
+        # チャートのカスタマイズ
+        response = await send_request(client, "chart.customize", {
+            "book": book_name,
+            "sheet": 0,
+            "chart": chart_name,
+            "title": "Test Chart",
+            "has_legend": True,
+            "legend_position": "bottom",
+            "pid": pid
+        }, 20)
+        if "error" in response:
+            logger.error(f"Failed to customize chart: {response['error']}")
+        else:
+            logger.info("Customized chart")
+
+        # 後始末
+        response = await send_request(client, "app.quit", {"pid": pid, "save_changes": False}, 21)
+        if "error" in response:
+            logger.error(f"Failed to quit app: {response['error']}")
+        else:
+            logger.info("Quit Excel app")
+
+        # 結果サマリー
+        succeeded = [t for t, r in results.items() if "error" not in r]
+        failed = [t for t, r in results.items() if "error" in r]
+        logger.info(f"Succeeded: {succeeded}")
+        logger.info(f"Failed: {failed}")
+
+
+if __name__ == "__main__":
+    asyncio.run(test_chart_types())
@@ -0,0 +1,105 @@
+"""
+テスト用Excelファイルの生成
+
+xlwings-rpcのテストで使用するtest_file.xlsxを生成します。
+
+静的な.xlsxを書き出すだけなのでExcelは不要です。openpyxlで直接
+ファイルに書き込むため、クロスプロセス呼び出しは一切発生しません。
+ファイルの内容が前回の生成時から変わっていなければ、既存のファイルを
+そのまま再利用します。
+"""
+import hashlib
+import logging
+import os
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+FILE_NAME = "test_file.xlsx"
+
+# テストデータ (決定的な内容にして内容ハッシュを安定させる)
+HEADERS = ["ID", "Name", "Category", "Date", "Value1",
+           "Value2", "Value3", "Value4", "Value5", "Total"]
+DATA = [
+    [
+        i,
+        f"Item {i}",
+        ["Alpha", "Beta", "Gamma"][i % 3],
+        f"2024-01-{(i % 28) + 1:02d}",
+        i * 10,
+        i * 20,
+        i * 30,
+        i * 40,
+        i * 50,
+        i * 150,
+    ]
+    for i in range(1, 21)
+]
+
+# 全列共通の列幅
+COLUMN_WIDTH = 12
+
+
+def _content_hash() -> str:
+    """
+    テストデータの内容ハッシュを計算します。
+
+    Returns:
+        内容ハッシュ (16文字)
+    """
+    return hashlib.sha256(
+        repr((HEADERS, DATA, COLUMN_WIDTH)).encode()
+    ).hexdigest()[:16]
+
+
+def create_test_excel(file_path: str = None) -> str:
+    """
+    テスト用のExcelファイルを生成します。
+
+    Args:
+        file_path: 出力先パス (デフォルト: このディレクトリのtest_file.xlsx)
+
+    Returns:
+        生成したファイルのパス
+    """
+    if file_path is None:
+        file_path = os.path.join(os.path.dirname(__file__), FILE_NAME)
+    sha_path = file_path + ".sha"
+    content_hash = _content_hash()
+
+    # 内容が変わっていなければExcelを起動せずに既存ファイルを再利用する
+    if os.path.exists(file_path) and os.path.exists(sha_path):
+        try:
+            with open(sha_path) as f:
+                if f.read().strip() == content_hash:
+                    logger.debug(f"Reusing cached test file: {file_path}")
+                    return file_path
+        except OSError:
+            pass
+
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+
+    book = Workbook()
+    sheet = book.active
+    sheet.title = "Sheet1"
+
+    sheet.append(HEADERS)
+    for row in DATA:
+        sheet.append(row)
+
+    for i in range(1, len(HEADERS) + 1):
+        sheet.column_dimensions[get_column_letter(i)].width = COLUMN_WIDTH
+
+    book.save(file_path)
+
+    with open(sha_path, "w") as f:
+        f.write(content_hash)
+
+    logger.info(f"Created test file: {file_path}")
+    return file_path
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(create_test_excel())
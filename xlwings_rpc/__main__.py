@@ -3,9 +3,8 @@ xlwings-rpc メインエントリポイント
 
 コマンドラインからサーバーを起動するためのエントリポイントを提供します。
 """
-import argparse
 import logging
-from xlwings_rpc.server import start_server
+import sys
 
 
 def main():
@@ -17,30 +16,52 @@ def main():
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
-    
+
     logger = logging.getLogger("xlwings-rpc")
-    
-    # コマンドライン引数の解析
-    parser = argparse.ArgumentParser(description="xlwings-rpc server")
-    parser.add_argument("--host", default="127.0.0.1", help="Host address to bind")
-    parser.add_argument("--port", type=int, default=8000, help="Port to bind")
-    parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-                        default="INFO", help="Logging level")
-    
-    args = parser.parse_args()
-    
-    # ログレベルの設定
-    logging.getLogger().setLevel(getattr(logging, args.log_level))
-    
-    logger.info(f"Starting xlwings-rpc server on {args.host}:{args.port}")
-    
+
+    if len(sys.argv) == 1:
+        # 引数なしの場合はargparseを読み込まずにデフォルト設定で起動する
+        host, port, keep_alive, range_cache = "127.0.0.1", 8000, 75, False
+    else:
+        # コマンドライン引数の解析 (必要な場合のみargparseを読み込む)
+        import argparse
+
+        parser = argparse.ArgumentParser(description="xlwings-rpc server")
+        parser.add_argument("--host", default="127.0.0.1", help="Host address to bind")
+        parser.add_argument("--port", type=int, default=8000, help="Port to bind")
+        parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+                            default="INFO", help="Logging level")
+        parser.add_argument("--keep-alive", type=int, default=75,
+                            help="Seconds to keep idle connections open")
+        parser.add_argument("--range-cache", action="store_true",
+                            help="Reuse resolved Range handles across calls "
+                                 "(faster polling, but stale handles are "
+                                 "possible if Excel is edited externally)")
+
+        args = parser.parse_args()
+
+        # ログレベルの設定
+        logging.getLogger().setLevel(getattr(logging, args.log_level))
+        host, port = args.host, args.port
+        keep_alive, range_cache = args.keep_alive, args.range_cache
+
+    logger.info("Starting xlwings-rpc server on %s:%s", host, port)
+
+    # サーバーモジュールは引数解析の後に読み込む
+    # (--helpでFastAPI+xlwingsのインポートコストを払わないようにする)
+    from xlwings_rpc.server import start_server
+
+    if range_cache:
+        from xlwings_rpc.adapters._resolve import enable_range_cache
+        enable_range_cache()
+
     # サーバーの起動
     try:
-        start_server(args.host, args.port)
+        start_server(host, port, keep_alive)
     except Exception as e:
-        logger.error(f"Error starting server: {str(e)}")
+        logger.error("Error starting server: %s", e)
         return 1
-    
+
     return 0
 
 
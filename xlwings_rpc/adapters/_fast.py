@@ -0,0 +1,99 @@
+"""
+Excel高速化コンテキスト
+
+変更系の操作のあいだ再描画・再計算・警告・イベントを止める
+共有コンテキストマネージャを提供します。書き込みのたびに発生する
+再描画・再計算・確認ダイアログはそれぞれクロスプロセスのイベント
+のため、入口でまとめて抑止し、出口で元の状態に戻します。
+"""
+from typing import Any, Dict
+from contextlib import contextmanager
+import logging
+import xlwings as xw
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# アプリケーションごとの画面更新抑止のネスト深度と退避した元の状態
+# (キーはid(app)。同じアプリに対する入れ子の抑止を1回のCOM書き込みに畳む)
+_screen_updating_depth: Dict[int, int] = {}
+_screen_updating_saved: Dict[int, Any] = {}
+
+
+@contextmanager
+def pause_screen_updating(app: xw.App):
+    """
+    ブロック内だけ画面更新を止める再入可能なコンテキストマネージャ。
+
+    同じアプリケーションに対して入れ子で呼ばれた場合、COMへの
+    書き込みは最外周の入口と出口の1往復ずつだけ行い、内側の呼び出しは
+    深度カウンタを増減するだけの no-op にします。連続した操作を
+    まとめた際に状態のフリップが積み上がるのを防ぎます。
+    状態の取得・設定に失敗した場合は何もせずに本体を実行します。
+
+    Args:
+        app: Appハンドル
+    """
+    key = id(app)
+    depth = _screen_updating_depth.get(key, 0)
+    _screen_updating_depth[key] = depth + 1
+    if depth == 0:
+        try:
+            prev = app.screen_updating
+            if prev:
+                app.screen_updating = False
+                _screen_updating_saved[key] = prev
+        except Exception:
+            pass
+    try:
+        yield
+    finally:
+        depth = _screen_updating_depth.get(key, 1) - 1
+        if depth <= 0:
+            _screen_updating_depth.pop(key, None)
+            prev = _screen_updating_saved.pop(key, None)
+            if prev is not None:
+                try:
+                    app.screen_updating = prev
+                except Exception:
+                    pass
+        else:
+            _screen_updating_depth[key] = depth
+
+
+@contextmanager
+def excel_fast(app: xw.App):
+    """
+    ブロック内だけExcelの再描画・再計算・警告・イベントを止めます。
+
+    変更系のアダプターメソッドはすべてこのコンテキストで本体を
+    包みます。画面更新の抑止はpause_screen_updatingに委譲して
+    入れ子でも1往復に畳み、残りの属性は変更が必要なものだけを
+    書き換えて出口で復元します。個々の取得・設定に失敗した項目は
+    スキップします。
+
+    Args:
+        app: Appハンドル
+    """
+    with pause_screen_updating(app):
+        saved = {}
+        for attr, value in (
+            ("display_alerts", False),
+            ("enable_events", False),
+            ("calculation", 'manual'),
+        ):
+            try:
+                prev = getattr(app, attr)
+                if prev != value:
+                    setattr(app, attr, value)
+                    saved[attr] = prev
+            except Exception:
+                pass
+        try:
+            yield
+        finally:
+            for attr, prev in saved.items():
+                try:
+                    setattr(app, attr, prev)
+                except Exception:
+                    pass
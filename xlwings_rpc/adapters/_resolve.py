@@ -0,0 +1,403 @@
+"""
+共有のシート解決ヘルパー
+
+RangeAdapterとSheetAdapterの各メソッドが繰り返していた
+アプリケーション→ブック→シートの解決チェーンを1箇所に集約します。
+解決の各段階はクロスプロセス呼び出しを伴うため、解決済みの
+Sheetハンドルを弱参照でキャッシュし、同じシートへの連続した
+RPC呼び出しでは再解決を省きます。
+"""
+from typing import Any, Dict, Optional, Tuple, Union
+from collections import OrderedDict
+import weakref
+import logging
+import xlwings as xw
+from xlwings_rpc.adapters.book_adapter import _resolve_book, _unpack_book_ref
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# 解決済みSheetハンドルの弱参照キャッシュ
+# (キーは(pid, ブック識別子の種別, ブック識別子の値, シート識別子))
+_SHEET_CACHE: "weakref.WeakValueDictionary[tuple, xw.Sheet]" = weakref.WeakValueDictionary()
+
+# エイリアスキー → 解決済みの同一性 (実際のアプリPID, ブック名, シート名)
+# 同じシートは名前・インデックス・pid指定の有無など複数のエイリアスで
+# キャッシュされるため、無効化はエイリアスではなく同一性を基準に行う
+_ALIAS_IDENTITY: Dict[tuple, tuple] = {}
+
+# ブックの同一性 (実際のアプリPID, ブック名) → そのブックを指した
+# エイリアスプレフィックス(pid, 種別, 値)の集合
+_BOOK_ALIASES: Dict[tuple, set] = {}
+
+# シートごとの変更カウンター
+# (キーは解決済みの同一性 (実際のアプリPID, ブック名, シート名)。
+#  エイリアスをキーにすると、同じシートへの書き込みが別のエイリアス
+#  経由の読み取りを無効化できない)
+# 変更系のアダプターメソッドが書き込みのたびにインクリメントします
+_mutation_counters: Dict[tuple, int] = {}
+
+# used_rangeのキャッシュ (同一性キー → (保存時のカウンター値, シリアライズ済みの範囲情報))
+_used_range_cache: Dict[tuple, Tuple[int, Any]] = {}
+
+# 解決済みRangeハンドルのキャッシュ (キーはシートキー + アドレス)
+# Rangeの構築はA1パースとCOMナビゲーションを伴うため、同じアドレスを
+# ポーリングするクライアント向けに直近の件数だけ強参照で保持する。
+# COMオブジェクトを固定し続けるため、既定では無効 (オプトイン)
+_RANGE_CACHE: "OrderedDict[tuple, xw.Range]" = OrderedDict()
+_RANGE_CACHE_MAX = 512
+_range_cache_enabled = False
+
+
+def enable_range_cache(enabled: bool = True) -> None:
+    """
+    Rangeハンドルのキャッシュを有効・無効にします。
+
+    Excel側でシート構造が外部から変更され得る環境では失効の
+    リスクがあるため、既定では無効です。サーバーの--range-cache
+    フラグから有効化されます。
+
+    Args:
+        enabled: 有効にする場合はTrue
+    """
+    global _range_cache_enabled
+    _range_cache_enabled = enabled
+    if not enabled:
+        _RANGE_CACHE.clear()
+
+
+def resolve_range(
+    book_identifier: Union[str, dict],
+    sheet_identifier: Union[str, int],
+    address: str,
+    pid: Optional[int] = None
+) -> xw.Range:
+    """
+    識別子とアドレスからRangeハンドルを解決します。
+
+    キャッシュが無効 (既定) の場合はシートを解決して毎回Rangeを
+    構築します。有効な場合は直近に解決したハンドルを再利用し、
+    返す前に.rowを読んで生存確認します。
+
+    Args:
+        book_identifier: ワークブック名かフルパス
+        sheet_identifier: シート名かインデックス
+        address: セル範囲のアドレス
+        pid: ExcelアプリケーションのプロセスID (オプション)
+
+    Returns:
+        Rangeハンドル
+    """
+    if not _range_cache_enabled:
+        return resolve_sheet(book_identifier, sheet_identifier, pid).range(address)
+
+    key = _sheet_key(book_identifier, sheet_identifier, pid) + (address,)
+    range_obj = _RANGE_CACHE.get(key)
+    if range_obj is not None:
+        try:
+            # ハンドルの生存確認 (壊れたハンドルはここで例外になる)
+            range_obj.row
+            _RANGE_CACHE.move_to_end(key)
+            return range_obj
+        except Exception:
+            logger.debug("Cached range handle for %s is stale, re-resolving", key)
+            _RANGE_CACHE.pop(key, None)
+
+    range_obj = resolve_sheet(book_identifier, sheet_identifier, pid).range(address)
+    _RANGE_CACHE[key] = range_obj
+    while len(_RANGE_CACHE) > _RANGE_CACHE_MAX:
+        _RANGE_CACHE.popitem(last=False)
+    return range_obj
+
+
+def _sheet_key(
+    book_identifier: Union[str, dict],
+    sheet_identifier: Union[str, int],
+    pid: Optional[int]
+) -> tuple:
+    """キャッシュキーを構築します。"""
+    kind, value = _unpack_book_ref(book_identifier)
+    return (pid, kind, value, str(sheet_identifier))
+
+
+def _book_identity(book: xw.Book, pid: Optional[int]) -> tuple:
+    """解決済みBookハンドルからブックの同一性キーを構築します。"""
+    try:
+        app_pid = book.app.pid if book.app else pid
+    except Exception:
+        app_pid = pid
+    return (app_pid, book.name)
+
+
+def _sheet_identity(
+    book_identifier: Union[str, dict],
+    sheet_identifier: Union[str, int],
+    pid: Optional[int]
+) -> Optional[tuple]:
+    """
+    エイリアスから解決済みのシート同一性キーを引きます。
+
+    未登録のエイリアスは一度解決してから引き直します。解決にも
+    失敗した場合はNoneを返します。
+
+    Args:
+        book_identifier: ワークブック名かフルパス
+        sheet_identifier: シート名かインデックス
+        pid: ExcelアプリケーションのプロセスID (オプション)
+
+    Returns:
+        (実際のアプリPID, ブック名, シート名)、特定できない場合はNone
+    """
+    key = _sheet_key(book_identifier, sheet_identifier, pid)
+    identity = _ALIAS_IDENTITY.get(key)
+    if identity is None:
+        try:
+            resolve_sheet(book_identifier, sheet_identifier, pid)
+        except Exception:
+            return None
+        identity = _ALIAS_IDENTITY.get(key)
+    return identity
+
+
+def _drop_alias(key: tuple) -> None:
+    """1つのエイリアスキーとそのRangeエントリを破棄します。"""
+    _SHEET_CACHE.pop(key, None)
+    _ALIAS_IDENTITY.pop(key, None)
+    for range_key in [k for k in _RANGE_CACHE if k[:4] == key]:
+        _RANGE_CACHE.pop(range_key, None)
+
+
+def resolve_sheet(
+    book_identifier: Union[str, dict],
+    sheet_identifier: Union[str, int],
+    pid: Optional[int] = None
+) -> xw.Sheet:
+    """
+    ブックとシートの識別子からSheetハンドルを解決します。
+
+    キャッシュ済みのハンドルは返す前に.nameを読んで生存確認し、
+    失効していれば破棄して解決し直します。ブックの解決は
+    book_adapterの共有キャッシュに委譲します。
+
+    Args:
+        book_identifier: ワークブック名かフルパス
+        sheet_identifier: シート名かインデックス
+        pid: ExcelアプリケーションのプロセスID (オプション)
+
+    Returns:
+        Sheetハンドル
+
+    Raises:
+        ValueError: 指定されたPIDのアプリケーションが見つからない場合
+    """
+    key = _sheet_key(book_identifier, sheet_identifier, pid)
+    sheet = _SHEET_CACHE.get(key)
+    if sheet is not None:
+        try:
+            # ハンドルの生存確認 (壊れたハンドルはここで例外になる)。
+            # 読み取った名前が登録時の同一性と食い違う場合 (別のエイリアス
+            # 経由で名前変更された場合など) も失効として扱う
+            name = sheet.name
+            identity = _ALIAS_IDENTITY.get(key)
+            if identity is None or identity[2] == name:
+                return sheet
+            logger.debug("Cached sheet handle for %s changed name, re-resolving", key)
+            _drop_alias(key)
+        except Exception:
+            logger.debug("Cached sheet handle for %s is stale, re-resolving", key)
+            _drop_alias(key)
+
+    book = _resolve_book(book_identifier, pid)
+
+    # ミス時はコレクションを1回走査し、全シートを名前とインデックスの
+    # 両方のキーで登録する。同じブックの別シートへの初回アクセスでも
+    # 以降はコレクション走査なしの辞書参照で済む。各エイリアスには
+    # 解決済みの同一性も併記し、無効化がエイリアス横断で行えるようにする
+    kind, value = _unpack_book_ref(book_identifier)
+    prefix = (pid, kind, value)
+    book_key = _book_identity(book, pid)
+    _BOOK_ALIASES.setdefault(book_key, set()).add(prefix)
+    for i, s in enumerate(book.sheets):
+        identity = book_key + (s.name,)
+        for alias in (prefix + (s.name,), prefix + (str(i),)):
+            _SHEET_CACHE[alias] = s
+            _ALIAS_IDENTITY[alias] = identity
+
+    sheet = _SHEET_CACHE.get(key)
+    if sheet is None:
+        # 走査で埋まらなかった識別子はxlwingsに直接解決させる
+        sheet = book.sheets[sheet_identifier]
+        _SHEET_CACHE[key] = sheet
+        _ALIAS_IDENTITY[key] = book_key + (sheet.name,)
+    return sheet
+
+
+def invalidate_sheets(
+    book_identifier: Union[str, dict],
+    pid: Optional[int] = None
+) -> None:
+    """
+    ブックのシートキャッシュエントリをまとめて破棄します。
+
+    シートの追加・削除・名前変更の後に呼び出します。削除や名前変更は
+    他のシートのインデックスや名前キーも無効にするため、ブック単位で
+    破棄します。同じ物理ブックは呼び出し元の指定方法によって複数の
+    エイリアス (pid指定の有無、名前かフルパスか) でキャッシュされて
+    いるため、ブックの同一性に登録された全プレフィックスを破棄します。
+
+    Args:
+        book_identifier: ワークブック名かフルパス
+        pid: ExcelアプリケーションのプロセスID (オプション)
+    """
+    kind, value = _unpack_book_ref(book_identifier)
+    prefix = (pid, kind, value)
+    try:
+        book_key = _book_identity(_resolve_book(book_identifier, pid), pid)
+    except Exception:
+        # ブックの同一性が特定できない場合は安全側に倒して全破棄する
+        logger.debug("Could not resolve book %s for invalidation, clearing all caches", book_identifier)
+        _SHEET_CACHE.clear()
+        _ALIAS_IDENTITY.clear()
+        _BOOK_ALIASES.clear()
+        _RANGE_CACHE.clear()
+        _mutation_counters.clear()
+        _used_range_cache.clear()
+        return
+
+    prefixes = _BOOK_ALIASES.pop(book_key, set()) | {prefix}
+    for p in prefixes:
+        for key in [k for k in _SHEET_CACHE if k[:3] == p]:
+            _SHEET_CACHE.pop(key, None)
+        for cache in (_ALIAS_IDENTITY, _RANGE_CACHE):
+            for key in [k for k in cache if k[:3] == p]:
+                cache.pop(key, None)
+    # カウンターとused_rangeは同一性キーなのでブックの同一性で破棄する
+    for cache in (_mutation_counters, _used_range_cache):
+        for key in [k for k in cache if k[:2] == book_key]:
+            cache.pop(key, None)
+
+
+def rename_cached_sheet(
+    book_identifier: Union[str, dict],
+    old_name: str,
+    new_name: str,
+    pid: Optional[int] = None
+) -> None:
+    """
+    名前変更されたシートのキャッシュエントリを付け替えます。
+
+    名前変更は他のシートのインデックスに影響しないため、ブック単位の
+    破棄ではなく旧名のエントリだけを付け替えます。旧名で引くエイリアス
+    (どのプレフィックスのものも) は破棄し、インデックスなど名前に
+    依存しないエイリアスは新しい同一性に付け替えます。変更カウンターと
+    used_rangeキャッシュも新しいキーへ引き継ぎます。
+
+    Args:
+        book_identifier: ワークブック名かフルパス
+        old_name: 変更前のシート名
+        new_name: 変更後のシート名
+        pid: ExcelアプリケーションのプロセスID (オプション)
+    """
+    kind, value = _unpack_book_ref(book_identifier)
+    prefix = (pid, kind, value)
+    old_key = prefix + (str(old_name),)
+    new_key = prefix + (str(new_name),)
+    identity_old = _ALIAS_IDENTITY.get(old_key)
+    if identity_old is None:
+        # 同一性が分からないエイリアスからの名前変更は安全側に倒して
+        # ブック単位で破棄する
+        invalidate_sheets(book_identifier, pid)
+        return
+
+    identity_new = identity_old[:2] + (str(new_name),)
+    for alias in [k for k, v in _ALIAS_IDENTITY.items() if v == identity_old]:
+        if alias[3] == str(old_name):
+            _drop_alias(alias)
+        else:
+            _ALIAS_IDENTITY[alias] = identity_new
+    # 新名のエイリアスに残っている古いエントリは破棄する
+    # (名前変更されたシート自身は次回の解決で登録される)
+    _drop_alias(new_key)
+    if identity_old in _mutation_counters:
+        _mutation_counters[identity_new] = _mutation_counters.pop(identity_old)
+    if identity_old in _used_range_cache:
+        _used_range_cache[identity_new] = _used_range_cache.pop(identity_old)
+
+
+def note_sheet_mutation(
+    book_identifier: Union[str, dict],
+    sheet_identifier: Union[str, int],
+    pid: Optional[int] = None
+) -> None:
+    """
+    シートへの書き込みを記録します。
+
+    変更カウンターをインクリメントし、そのシートのused_range
+    キャッシュを破棄します。セルの値・数式・クリアなど、使用範囲を
+    変え得る書き込みの後に呼び出します。カウンターは解決済みの
+    同一性をキーにするため、名前とインデックスのどちらのエイリアス
+    経由の書き込みでも同じシートの読み取りキャッシュが無効になります。
+
+    Args:
+        book_identifier: ワークブック名かフルパス
+        sheet_identifier: シート名かインデックス
+        pid: ExcelアプリケーションのプロセスID (オプション)
+    """
+    identity = _sheet_identity(book_identifier, sheet_identifier, pid)
+    if identity is None:
+        # 同一性が特定できない書き込みは安全側に倒して全破棄する
+        _used_range_cache.clear()
+        return
+    _mutation_counters[identity] = _mutation_counters.get(identity, 0) + 1
+    _used_range_cache.pop(identity, None)
+
+
+def get_cached_used_range(
+    book_identifier: Union[str, dict],
+    sheet_identifier: Union[str, int],
+    pid: Optional[int] = None
+) -> Optional[Any]:
+    """
+    キャッシュ済みのused_range情報を返します。
+
+    保存時の変更カウンターが現在の値と一致する場合のみ有効です。
+    一致しない (保存後にシートへの書き込みがあった) 場合はNoneを
+    返し、呼び出し側にCOMからの再読取りを促します。
+
+    Args:
+        book_identifier: ワークブック名かフルパス
+        sheet_identifier: シート名かインデックス
+        pid: ExcelアプリケーションのプロセスID (オプション)
+
+    Returns:
+        シリアライズ済みの範囲情報、キャッシュが無効ならNone
+    """
+    key = _sheet_key(book_identifier, sheet_identifier, pid)
+    identity = _ALIAS_IDENTITY.get(key)
+    if identity is None:
+        return None
+    entry = _used_range_cache.get(identity)
+    if entry is not None and entry[0] == _mutation_counters.get(identity, 0):
+        return entry[1]
+    return None
+
+
+def store_used_range(
+    book_identifier: Union[str, dict],
+    sheet_identifier: Union[str, int],
+    pid: Optional[int],
+    value: Any
+) -> None:
+    """
+    used_range情報を現在の変更カウンターとともにキャッシュします。
+
+    Args:
+        book_identifier: ワークブック名かフルパス
+        sheet_identifier: シート名かインデックス
+        pid: ExcelアプリケーションのプロセスID
+        value: シリアライズ済みの範囲情報
+    """
+    identity = _sheet_identity(book_identifier, sheet_identifier, pid)
+    if identity is None:
+        return
+    _used_range_cache[identity] = (_mutation_counters.get(identity, 0), value)
@@ -2,36 +2,113 @@
 Excel Applicationアダプター
 
 xlwingsのAppオブジェクトとAPI間のインターフェースを提供します。
+
+xlwingsの呼び出しはすべてブロッキングするCOM/AppleScript呼び出しのため、
+公開メソッドはasyncとし、実体はエグゼキュータ上で実行します。
 """
 from typing import Dict, List, Optional, Any, Union
+import sys
+import weakref
 import xlwings as xw
 import logging
-from xlwings_rpc.utils.converters import to_serializable
+from xlwings_rpc.utils.converters import to_serializable, _book_com_read
+from xlwings_rpc.utils.executors import run_in_excel_executor, shutdown_pid_executor
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# PIDごとのAppハンドルのキャッシュ
+# xw.apps[pid]はExcelへのクロスプロセス呼び出しを伴うため、
+# 同じPIDへの連続したRPC呼び出しではハンドルを再利用する
+_APP_CACHE: "weakref.WeakValueDictionary[int, xw.App]" = weakref.WeakValueDictionary()
+
+
+def _get_app(pid: int) -> xw.App:
+    """
+    指定されたPIDのAppハンドルを取得します。
+
+    キャッシュにあればそれを返し、なければxw.appsから解決して
+    キャッシュに登録します。キャッシュ済みのハンドルはExcel側が
+    終了していると壊れていることがあるため、軽い呼び出しで生存確認し、
+    失敗した場合は破棄して再接続します。
+
+    Args:
+        pid: ExcelアプリケーションのプロセスID
+
+    Returns:
+        Appハンドル
+
+    Raises:
+        KeyError: 指定されたPIDのアプリケーションが見つからない場合
+    """
+    app = _APP_CACHE.get(pid)
+    if app is not None:
+        try:
+            # ハンドルの生存確認 (壊れたCOM/AppleScriptハンドルはここで例外になる)
+            app.pid
+            return app
+        except Exception:
+            logger.debug("Cached app handle for PID %s is stale, reconnecting", pid)
+            _APP_CACHE.pop(pid, None)
+
+    app = xw.apps[pid]
+    _APP_CACHE[pid] = app
+    return app
+
+
+# 有効な計算モード
+_VALID_CALC_MODES = frozenset({'automatic', 'manual', 'semiautomatic'})
+
+
+def _bulk_book_info(app: xw.App) -> List[Dict[str, Any]]:
+    """
+    アプリケーション内の全ワークブックを一括で読み取ってシリアライズします。
+
+    Windowsでは、ブックごとにapiハンドルを取り直す代わりにCOMの
+    Workbooksコレクションを1回のトラバースで読み取ります。ブック単位の
+    読み取り自体はconvertersの共有実装に委譲します。
+
+    Args:
+        app: Appハンドル
+
+    Returns:
+        ワークブック情報のリスト
+    """
+    if sys.platform != 'win32':
+        return [to_serializable(book) for book in app.books]
+
+    try:
+        pid = app.pid
+        return [_book_com_read(wb, pid) for wb in app.api.Workbooks]
+    except Exception as e:
+        logger.warning("Bulk book read failed, falling back to per-attribute read: %s", e)
+        return [to_serializable(book) for book in app.books]
+
 
 class AppAdapter:
     """
     xlwingsのAppオブジェクトに対するアダプタークラス
     """
-    
+
     @staticmethod
-    def get_apps() -> List[Dict[str, Any]]:
+    async def get_apps() -> List[Dict[str, Any]]:
         """
         すべての実行中のExcelアプリケーションを取得します。
 
         Returns:
             アプリケーション情報のリスト
         """
-        apps = []
-        for app in xw.apps:
-            apps.append(to_serializable(app))
-        return apps
-    
+        return await run_in_excel_executor(AppAdapter._get_apps_sync)
+
     @staticmethod
-    def get_app(pid: Optional[int] = None) -> Dict[str, Any]:
+    def _get_apps_sync() -> List[Dict[str, Any]]:
+        """get_appsの同期実装。"""
+        # 一括読み取りとフォールバックはto_serializableのApp
+        # シリアライザーが共通で行う
+        return [to_serializable(app) for app in xw.apps]
+
+    @staticmethod
+    async def get_app(pid: Optional[int] = None) -> Dict[str, Any]:
         """
         指定されたPIDまたはアクティブなExcelアプリケーションを取得します。
 
@@ -40,21 +117,26 @@ class AppAdapter:
 
         Returns:
             アプリケーション情報
-        
+
         Raises:
             ValueError: 指定されたPIDのアプリケーションが見つからない場合
         """
+        return await run_in_excel_executor(AppAdapter._get_app_sync, pid, pid=pid)
+
+    @staticmethod
+    def _get_app_sync(pid: Optional[int] = None) -> Dict[str, Any]:
+        """get_appの同期実装。"""
         try:
             if pid is not None:
-                logger.debug(f"Attempting to get Excel app with PID: {pid}")
+                logger.debug("Attempting to get Excel app with PID: %s", pid)
                 try:
                     # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                    app = xw.apps[pid]
+                    app = _get_app(pid)
                 except KeyError:
                     # PIDが見つからない場合
                     raise ValueError(f"No Excel application found with PID {pid}")
                 except Exception as e:
-                    logger.exception(f"Error accessing Excel app with PID {pid}: {str(e)}")
+                    logger.exception("Error accessing Excel app with PID %s: %s", pid, e)
                     raise
             else:
                 # アクティブなアプリケーションを取得、なければ新規作成
@@ -64,28 +146,47 @@ class AppAdapter:
                         raise AttributeError("No active app")
                 except (AttributeError, IndexError):
                     app = xw.App(visible=False)
-            
+
             return to_serializable(app)
         except Exception as e:
             raise ValueError(f"Failed to get Excel application: {str(e)}")
-    
+
     @staticmethod
-    def create_app(visible: bool = True, add_book: bool = True) -> Dict[str, Any]:
+    async def create_app(
+        visible: bool = True,
+        add_book: bool = True,
+        return_state: bool = True
+    ) -> Dict[str, Any]:
         """
         新しいExcelアプリケーションを作成します。
 
         Args:
             visible: アプリケーションを表示するかどうか (デフォルト: True)
             add_book: 新しいブックを追加するかどうか (デフォルト: True)
+            return_state: 完全なアプリケーション情報を返すかどうか
+                (Falseの場合はPIDのみを返し、COMの読み戻しを省略する)
 
         Returns:
             新しいアプリケーション情報
         """
+        return await run_in_excel_executor(
+            AppAdapter._create_app_sync, visible, add_book, return_state
+        )
+
+    @staticmethod
+    def _create_app_sync(
+        visible: bool = True,
+        add_book: bool = True,
+        return_state: bool = True
+    ) -> Dict[str, Any]:
+        """create_appの同期実装。"""
         app = xw.App(visible=visible, add_book=add_book)
+        if not return_state:
+            return {"id": app.pid}
         return to_serializable(app)
-    
+
     @staticmethod
-    def quit_app(pid: int, save_changes: bool = True) -> bool:
+    async def quit_app(pid: int, save_changes: bool = True) -> bool:
         """
         Excelアプリケーションを終了します。
 
@@ -99,44 +200,80 @@ class AppAdapter:
         Raises:
             ValueError: 指定されたPIDのアプリケーションが見つからない場合
         """
+        result = await run_in_excel_executor(
+            AppAdapter._quit_app_sync, pid, save_changes, pid=pid
+        )
+        # 終了したPIDのエグゼキュータを破棄する
+        shutdown_pid_executor(pid)
+        return result
+
+    @staticmethod
+    def _quit_app_sync(pid: int, save_changes: bool = True) -> bool:
+        """quit_appの同期実装。"""
         try:
             # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
             try:
-                app = xw.apps[pid]
+                app = _get_app(pid)
             except KeyError:
                 # PIDが見つからない場合
                 raise ValueError(f"No Excel application found with PID {pid}")
 
             # 変更を保存する場合は、quit()の前に明示的に保存
             if save_changes:
+                # 保存中の再計算と確認ダイアログを抑止する
+                prev_calc = None
+                try:
+                    prev_calc = app.calculation
+                    app.calculation = 'manual'
+                    app.display_alerts = False
+                except Exception as e:
+                    logger.warning("Failed to prepare app for batched save: %s", e)
+
                 try:
                     # 開いているブックをすべて保存
+                    # (1冊の失敗で残りの保存を中断しないようブックごとに処理)
                     for book in app.books:
                         if book.path:  # パスがある（保存済みのブック）の場合
-                            book.save()
-                except Exception as e:
-                    logger.warning(f"Failed to save books before quitting: {str(e)}")
-            
+                            try:
+                                book.save()
+                            except Exception as e:
+                                logger.warning("Failed to save book '%s': %s", book.name, e)
+                finally:
+                    if prev_calc is not None:
+                        try:
+                            app.calculation = prev_calc
+                        except Exception:
+                            pass
+
             # 公式ドキュメントによると、quit()は引数を取らない
             app.quit()  # 引数なしで呼び出し
+            # 終了したAppのハンドルをキャッシュから除去する
+            _APP_CACHE.pop(pid, None)
             return True
         except Exception as e:
             # 終了に失敗した場合、killメソッドを試す
-            logger.warning(f"Failed to quit Excel application: {str(e)}. Trying kill() method...")
+            logger.warning("Failed to quit Excel application: %s. Trying kill() method...", e)
             try:
                 app.kill()
+                _APP_CACHE.pop(pid, None)
                 return True
             except Exception as e2:
                 raise ValueError(f"Failed to quit Excel application: {str(e)}. Kill attempt also failed: {str(e2)}")
-    
+
     @staticmethod
-    def set_calculation(pid: int, calculation_mode: str) -> Dict[str, Any]:
+    async def set_calculation(
+        pid: int,
+        calculation_mode: str,
+        return_state: bool = True
+    ) -> Dict[str, Any]:
         """
         計算モードを設定します。
 
         Args:
             pid: ExcelアプリケーションのプロセスID
             calculation_mode: 計算モード ('automatic', 'manual', 'semiautomatic')
+            return_state: 完全なアプリケーション情報を返すかどうか
+                (Falseの場合はPIDと計算モードのみを返し、COMの読み戻しを省略する)
 
         Returns:
             更新されたアプリケーション情報
@@ -144,25 +281,40 @@ class AppAdapter:
         Raises:
             ValueError: 無効な計算モードまたはPIDが指定された場合
         """
-        valid_modes = {'automatic', 'manual', 'semiautomatic'}
-        if calculation_mode.lower() not in valid_modes:
-            raise ValueError(f"Invalid calculation mode. Valid values are: {', '.join(valid_modes)}")
-        
+        return await run_in_excel_executor(
+            AppAdapter._set_calculation_sync, pid, calculation_mode, return_state, pid=pid
+        )
+
+    @staticmethod
+    def _set_calculation_sync(
+        pid: int,
+        calculation_mode: str,
+        return_state: bool = True
+    ) -> Dict[str, Any]:
+        """set_calculationの同期実装。"""
+        mode = calculation_mode.lower()
+        if mode not in _VALID_CALC_MODES:
+            raise ValueError(f"Invalid calculation mode. Valid values are: {', '.join(sorted(_VALID_CALC_MODES))}")
+
         try:
             try:
                 # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                app = xw.apps[pid]
+                app = _get_app(pid)
             except KeyError:
                 # PIDが見つからない場合
                 raise ValueError(f"No Excel application found with PID {pid}")
-            
-            app.calculation = calculation_mode.lower()
+
+            app.calculation = mode
+            if not return_state:
+                # 呼び出し元が完全なApp状態を必要としない場合は
+                # 属性ごとのCOM読み戻しを省略する
+                return {"id": pid, "calculation": mode}
             return to_serializable(app)
         except Exception as e:
             raise ValueError(f"Failed to set calculation mode: {str(e)}")
-    
+
     @staticmethod
-    def get_calculation(pid: int) -> str:
+    async def get_calculation(pid: int) -> str:
         """
         現在の計算モードを取得します。
 
@@ -175,20 +327,27 @@ class AppAdapter:
         Raises:
             ValueError: 指定されたPIDのアプリケーションが見つからない場合
         """
+        return await run_in_excel_executor(
+            AppAdapter._get_calculation_sync, pid, pid=pid
+        )
+
+    @staticmethod
+    def _get_calculation_sync(pid: int) -> str:
+        """get_calculationの同期実装。"""
         try:
             try:
                 # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                app = xw.apps[pid]
+                app = _get_app(pid)
             except KeyError:
                 # PIDが見つからない場合
                 raise ValueError(f"No Excel application found with PID {pid}")
-            
+
             return str(app.calculation)
         except Exception as e:
             raise ValueError(f"Failed to get calculation mode: {str(e)}")
-    
+
     @staticmethod
-    def get_app_books(pid: int) -> List[Dict[str, Any]]:
+    async def get_app_books(pid: int) -> List[Dict[str, Any]]:
         """
         指定されたアプリケーションで開いているワークブックを取得します。
 
@@ -201,14 +360,21 @@ class AppAdapter:
         Raises:
             ValueError: 指定されたPIDのアプリケーションが見つからない場合
         """
+        return await run_in_excel_executor(
+            AppAdapter._get_app_books_sync, pid, pid=pid
+        )
+
+    @staticmethod
+    def _get_app_books_sync(pid: int) -> List[Dict[str, Any]]:
+        """get_app_booksの同期実装。"""
         try:
             try:
                 # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                app = xw.apps[pid]
+                app = _get_app(pid)
             except KeyError:
                 # PIDが見つからない場合
                 raise ValueError(f"No Excel application found with PID {pid}")
-            
-            return [to_serializable(book) for book in app.books]
+
+            return _bulk_book_info(app)
         except Exception as e:
             raise ValueError(f"Failed to get workbooks: {str(e)}")
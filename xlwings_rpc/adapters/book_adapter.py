@@ -3,15 +3,304 @@ Excel Workbookアダプター
 
 xlwingsのBookオブジェクトとAPI間のインターフェースを提供します。
 """
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterator, List, Optional, Any, Union
 import os
+import sys
+import asyncio
+import atexit
+import weakref
 import logging
 import xlwings as xw
-from xlwings_rpc.utils.converters import to_serializable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from xlwings_rpc.utils.converters import to_serializable, book_snapshot_fast, SheetInfo, _sheet_com_read
+from xlwings_rpc.utils.executors import run_in_excel_executor
+from xlwings_rpc.adapters.app_adapter import _get_app
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# (pid, ブック識別子) -> Book ハンドルのキャッシュ
+# ブックの解決はアプリケーション列挙を伴うクロスプロセス呼び出しのため、
+# 同じブックへの連続したRPC呼び出しではハンドルを再利用する
+_BOOK_CACHE: "weakref.WeakValueDictionary[tuple, xw.Book]" = weakref.WeakValueDictionary()
+
+# pid指定のない識別子 -> (pid, ブック名) の解決結果
+# xw.Book(identifier)は全アプリケーション・全ブックを走査するため、
+# 一度成功した解決は控えておき、次回以降は直接pid経由で引く
+_book_index: Dict[str, tuple] = {}
+
+# pid指定のないリクエストで共有する非表示のExcelアプリケーション
+# (Excelの起動は数百msのCOM初期化を伴うため、リクエストごとに起動しない)
+_default_app: Optional[xw.App] = None
+
+
+def _quit_default_app() -> None:
+    """
+    共有アプリケーションをプロセス終了時に後始末します。
+    """
+    global _default_app
+    if _default_app is not None:
+        try:
+            _default_app.quit()
+        except Exception:
+            pass
+        _default_app = None
+
+
+def _get_default_app() -> xw.App:
+    """
+    pid指定のないリクエスト用の共有Excelアプリケーションを返します。
+
+    初回呼び出し時に非表示のアプリケーションを起動し、以降は再利用します。
+    アクティブなアプリケーションが既にあればそれを優先します。
+
+    Returns:
+        Appハンドル
+    """
+    global _default_app
+
+    # ユーザーが開いているアプリケーションがあればそちらを使う
+    try:
+        app = xw.apps.active
+        if app is not None:
+            return app
+    except (AttributeError, IndexError):
+        pass
+
+    if _default_app is not None:
+        try:
+            # ハンドルの生存確認 (終了済みならここで例外になる)
+            _default_app.pid
+            return _default_app
+        except Exception:
+            logger.debug("Shared default app is gone, restarting")
+            _default_app = None
+
+    _default_app = xw.App(visible=False, add_book=False)
+    _default_app.display_alerts = False
+    _default_app.screen_updating = False
+    try:
+        # ブックが1つも開いていないと設定できないExcelバージョンがある
+        _default_app.calculation = 'manual'
+    except Exception:
+        pass
+    atexit.register(_quit_default_app)
+    return _default_app
+
+
+@contextmanager
+def _suspended_calculation(app: xw.App):
+    """
+    ブロック内だけ計算モードを手動に切り替えるコンテキストマネージャ。
+
+    開く・保存するなどの一括操作中の再計算を抑止し、終了時に
+    元のモードへ戻します。モードの取得・設定に失敗した場合は
+    何もせずに本体を実行します。
+
+    Args:
+        app: Appハンドル
+    """
+    prev = None
+    try:
+        prev = app.calculation
+        if prev != 'manual':
+            app.calculation = 'manual'
+        else:
+            prev = None
+    except Exception:
+        prev = None
+    try:
+        yield
+    finally:
+        if prev is not None:
+            try:
+                app.calculation = prev
+            except Exception:
+                pass
+
+
+def _unpack_book_ref(book_identifier: Union[str, Dict[str, Any]]) -> tuple:
+    """
+    ブック識別子を (種別, 値) に分解します。
+
+    識別子は後方互換のための素の文字列 (名前かフルパス) に加えて、
+    種別付きの辞書 {"kind": "name" | "fullname" | "index", "value": ...}
+    を受け付けます。種別が分かっていれば最も安い検索に直行できます。
+
+    Args:
+        book_identifier: ブック識別子
+
+    Returns:
+        (種別, 値) のタプル (素の文字列の場合の種別はNone)
+
+    Raises:
+        ValueError: 種別が不正な場合
+    """
+    if isinstance(book_identifier, dict):
+        kind = book_identifier.get("kind")
+        if kind not in ("name", "fullname", "index"):
+            raise ValueError(f"Invalid book identifier kind: {kind}")
+        return kind, book_identifier.get("value")
+    return None, book_identifier
+
+
+def _resolve_book(
+    book_identifier: Union[str, Dict[str, Any]],
+    pid: Optional[int] = None
+) -> xw.Book:
+    """
+    ワークブックハンドルを解決します。
+
+    キャッシュにあればそれを返し、なければ識別子の種別に応じた
+    最も安い検索で解決してキャッシュに登録します。
+
+    Args:
+        book_identifier: ワークブック名かフルパス、または種別付きの辞書
+            {"kind": "name" | "fullname" | "index", "value": ...}
+        pid: ExcelアプリケーションのプロセスID (オプション)
+
+    Returns:
+        Bookハンドル
+
+    Raises:
+        ValueError: 指定されたPIDのアプリケーションが見つからない場合
+    """
+    kind, value = _unpack_book_ref(book_identifier)
+
+    key = (pid, value)
+    book = _BOOK_CACHE.get(key)
+    if book is not None:
+        try:
+            # ハンドルの生存確認 (閉じられたブックはここで例外になる)
+            book.name
+            return book
+        except Exception:
+            logger.debug("Cached book handle for '%s' is stale, re-resolving", value)
+            _BOOK_CACHE.pop(key, None)
+
+    if pid is not None:
+        try:
+            app = _get_app(pid)
+        except KeyError:
+            # PIDが見つからない場合
+            raise ValueError(f"No Excel application found with PID {pid}")
+        if kind == "index":
+            book = app.books[int(value)]
+        else:
+            book = app.books[value]
+    elif kind == "index":
+        app = xw.apps.active
+        if app is None:
+            raise ValueError(f"No active Excel application to resolve book index {value}")
+        book = app.books[int(value)]
+    elif kind == "fullname":
+        # フルパスと分かっているので、xw.Bookの名前推測を挟まず直接走査する
+        book = None
+        for app in xw.apps:
+            for candidate in app.books:
+                if candidate.fullname == value:
+                    book = candidate
+                    break
+            if book is not None:
+                break
+        if book is None:
+            raise ValueError(f"No open workbook with fullname '{value}'")
+    else:
+        book = None
+        # 過去に解決した識別子なら全アプリケーション走査を省略する
+        indexed = _book_index.get(value)
+        if indexed is not None:
+            indexed_pid, indexed_name = indexed
+            try:
+                book = _get_app(indexed_pid).books[indexed_name]
+            except Exception:
+                logger.debug("Indexed resolution for '%s' is stale, rescanning", value)
+                _book_index.pop(value, None)
+
+        if book is None:
+            book = xw.Book(value)
+            try:
+                _book_index[value] = (book.app.pid, book.name)
+            except Exception:
+                pass
+
+    _BOOK_CACHE[key] = book
+    return book
+
+
+def _bulk_sheet_info(book: xw.Book) -> List[Dict[str, Any]]:
+    """
+    ワークブック内の全シートを一括で読み取ってシリアライズします。
+
+    to_serializable(sheet)は属性ごとにクロスプロセス呼び出しを行うため、
+    WindowsではCOMのWorksheetsコレクションを1回のトラバースで読み取ります。
+    シート単位の読み取り自体はconvertersの共有実装に委譲します。
+
+    Args:
+        book: Bookハンドル
+
+    Returns:
+        シート情報のリスト
+    """
+    if sys.platform != 'win32':
+        return [SheetInfo.from_sheet(sheet).as_dict() for sheet in book.sheets]
+
+    try:
+        book_name = book.name
+        return [_sheet_com_read(ws, book_name) for ws in book.api.Worksheets]
+    except Exception as e:
+        logger.warning("Bulk sheet read failed, falling back to per-attribute read: %s", e)
+        return [SheetInfo.from_sheet(sheet).as_dict() for sheet in book.sheets]
+
+
+def _batch_open_worker(path: str, read_only: bool = False) -> Dict[str, Any]:
+    """
+    batch_open用のワーカー関数。
+
+    ProcessPoolExecutorからpickle経由で呼ばれるためモジュール直下に置きます。
+    ワーカープロセスごとに専用のExcelアプリケーションを起動し、
+    ブックを開いて情報を読み取ったら閉じます。
+
+    Args:
+        path: ワークブックのパス
+        read_only: 読み取り専用で開くかどうか
+
+    Returns:
+        開いたワークブック情報
+    """
+    if sys.platform == 'win32':
+        # 各ワーカープロセスで個別にCOMを初期化する
+        import pythoncom
+        pythoncom.CoInitialize()
+
+    app = xw.App(visible=False, add_book=False)
+    try:
+        app.display_alerts = False
+        book = app.books.open(path, read_only=read_only)
+        info = book_snapshot_fast(book)
+        book.close(save=False)
+        return info
+    finally:
+        try:
+            app.quit()
+        except Exception:
+            pass
+
+
+def _invalidate_book(book_identifier: Union[str, Dict[str, Any]]) -> None:
+    """
+    指定された識別子のブックハンドルをキャッシュから除去します。
+
+    Args:
+        book_identifier: ワークブック名かフルパス、または種別付きの辞書
+    """
+    _, value = _unpack_book_ref(book_identifier)
+    for key in list(_BOOK_CACHE.keys()):
+        if key[1] == value:
+            _BOOK_CACHE.pop(key, None)
+    _book_index.pop(value, None)
+
 
 class BookAdapter:
     """
@@ -19,39 +308,88 @@ class BookAdapter:
     """
     
     @staticmethod
-    def get_books(pid: Optional[int] = None) -> List[Dict[str, Any]]:
+    async def get_books(pid: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         開いているワークブックを取得します。
 
+        pidがNoneで複数のExcelプロセスが動いている場合は、プロセス
+        ごとの列挙をasyncio.gatherで並行に発行します。各プロセスの
+        COM呼び出しはそのプロセス専用のスレッドで実行されるため、
+        独立したプロセスの列挙は実際に並行して進みます。
+
         Args:
             pid: ExcelアプリケーションのプロセスID (Noneの場合はすべてのアプリケーション)
 
         Returns:
             ワークブック情報のリスト
         """
-        books = []
+        if pid is not None:
+            return await run_in_excel_executor(
+                BookAdapter._get_books_sync, pid, pid=pid
+            )
+
+        pids = await run_in_excel_executor(BookAdapter._list_app_pids_sync)
+        if not pids:
+            return []
+        if len(pids) == 1:
+            return await run_in_excel_executor(
+                BookAdapter._get_books_sync, pids[0], pid=pids[0]
+            )
+
+        results = await asyncio.gather(*(
+            run_in_excel_executor(BookAdapter._get_books_sync, p, pid=p)
+            for p in pids
+        ))
+        return [book for books in results for book in books]
+
+    @staticmethod
+    def _list_app_pids_sync() -> List[int]:
+        """実行中のExcelアプリケーションのPIDを列挙します。"""
+        return list(xw.apps.keys())
+
+    @staticmethod
+    def _get_books_sync(pid: Optional[int] = None) -> List[Dict[str, Any]]:
+        """get_booksの同期実装。"""
         if pid is not None:
             try:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                for book in app.books:
-                    books.append(to_serializable(book))
+                return list(BookAdapter.iter_books(pid))
             except Exception as e:
                 raise ValueError(f"Failed to get books for Excel application (PID {pid}): {str(e)}")
+        return list(BookAdapter.iter_books(pid))
+
+    @staticmethod
+    def iter_books(pid: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        開いているワークブックを遅延列挙します。
+
+        先頭の数件で打ち切る呼び出し側 (ページングなど) のために、
+        各ブックのシリアライズを必要になるまで遅らせます。
+
+        Args:
+            pid: ExcelアプリケーションのプロセスID (Noneの場合はすべてのアプリケーション)
+
+        Yields:
+            ワークブック情報
+
+        Raises:
+            ValueError: 指定されたPIDのアプリケーションが見つからない場合
+        """
+        if pid is not None:
+            try:
+                app = _get_app(pid)
+            except KeyError:
+                # PIDが見つからない場合
+                raise ValueError(f"No Excel application found with PID {pid}")
+
+            for book in app.books:
+                yield book_snapshot_fast(book)
         else:
             for app in xw.apps:
                 for book in app.books:
-                    books.append(to_serializable(book))
-        
-        return books
+                    yield book_snapshot_fast(book)
     
     @staticmethod
-    def get_book(book_identifier: str, pid: Optional[int] = None) -> Dict[str, Any]:
+    async def get_book(book_identifier: str, pid: Optional[int] = None) -> Dict[str, Any]:
         """
         特定のワークブックを取得します。
 
@@ -65,28 +403,25 @@ class BookAdapter:
         Raises:
             ValueError: ワークブックが見つからない場合
         """
+        return await run_in_excel_executor(
+            BookAdapter._get_book_sync, book_identifier, pid, pid=pid
+        )
+
+    @staticmethod
+    def _get_book_sync(book_identifier: str, pid: Optional[int] = None) -> Dict[str, Any]:
+        """get_bookの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
+            book = _resolve_book(book_identifier, pid)
             
-            return to_serializable(book)
+            return book_snapshot_fast(book)
         except Exception as e:
             raise ValueError(f"Failed to get workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def open_book(
-        path: str, 
-        pid: Optional[int] = None, 
-        read_only: bool = False, 
+    async def open_book(
+        path: str,
+        pid: Optional[int] = None,
+        read_only: bool = False,
         password: Optional[str] = None
     ) -> Dict[str, Any]:
         """
@@ -104,36 +439,43 @@ class BookAdapter:
         Raises:
             ValueError: ファイルが見つからないか開けない場合
         """
-        if not os.path.exists(path):
-            raise ValueError(f"File not found: {path}")
-        
+        return await run_in_excel_executor(
+            BookAdapter._open_book_sync, path, pid, read_only, password, pid=pid
+        )
+
+    @staticmethod
+    def _open_book_sync(
+        path: str,
+        pid: Optional[int] = None,
+        read_only: bool = False,
+        password: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """open_bookの同期実装。"""
         try:
             if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
                 try:
-                    app = xw.apps[pid]
+                    app = _get_app(pid)
                 except KeyError:
                     # PIDが見つからない場合
                     raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books.open(path, read_only=read_only, password=password)
             else:
-                # アクティブなアプリケーションを使用するか、新しいアプリケーションを作成
-                try:
-                    app = xw.apps.active
-                    if app is None:
-                        raise AttributeError("No active app")
-                except (AttributeError, IndexError):
-                    app = xw.App(visible=False)
-                
+                # アクティブなアプリケーションか共有の非表示アプリケーションを使用
+                app = _get_default_app()
+
+            # 開いている間の再計算を抑止する
+            with _suspended_calculation(app):
                 book = app.books.open(path, read_only=read_only, password=password)
             
-            return to_serializable(book)
+            return book_snapshot_fast(book)
         except Exception as e:
+            # 成功パスで余計なstatを行わないよう、事前チェックはせず
+            # 失敗したときにのみ存在確認してエラーを翻訳する
+            if isinstance(e, FileNotFoundError) or not os.path.exists(path):
+                raise ValueError(f"File not found: {path}")
             raise ValueError(f"Failed to open workbook '{path}': {str(e)}")
     
     @staticmethod
-    def create_book(pid: Optional[int] = None) -> Dict[str, Any]:
+    async def create_book(pid: Optional[int] = None) -> Dict[str, Any]:
         """
         新しいワークブックを作成します。
 
@@ -143,36 +485,36 @@ class BookAdapter:
         Returns:
             新しいワークブック情報
         """
+        return await run_in_excel_executor(
+            BookAdapter._create_book_sync, pid, pid=pid
+        )
+
+    @staticmethod
+    def _create_book_sync(pid: Optional[int] = None) -> Dict[str, Any]:
+        """create_bookの同期実装。"""
         try:
             if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
                 try:
-                    app = xw.apps[pid]
+                    app = _get_app(pid)
                 except KeyError:
                     # PIDが見つからない場合
                     raise ValueError(f"No Excel application found with PID {pid}")
                 
                 book = app.books.add()
             else:
-                # アクティブなアプリケーションを使用するか、新しいアプリケーションを作成
-                try:
-                    app = xw.apps.active
-                    if app is None:
-                        raise AttributeError("No active app")
-                except (AttributeError, IndexError):
-                    app = xw.App(visible=False)
-                
+                # アクティブなアプリケーションか共有の非表示アプリケーションを使用
+                app = _get_default_app()
                 book = app.books.add()
             
-            return to_serializable(book)
+            return book_snapshot_fast(book)
         except Exception as e:
             raise ValueError(f"Failed to create workbook: {str(e)}")
     
     @staticmethod
-    def close_book(
-        book_identifier: str, 
-        pid: Optional[int] = None, 
-        save: bool = True, 
+    async def close_book(
+        book_identifier: str,
+        pid: Optional[int] = None,
+        save: bool = True,
         path: Optional[str] = None
     ) -> bool:
         """
@@ -190,30 +532,39 @@ class BookAdapter:
         Raises:
             ValueError: ワークブックが見つからないか閉じられない場合
         """
+        return await run_in_excel_executor(
+            BookAdapter._close_book_sync, book_identifier, pid, save, path, pid=pid
+        )
+
+    @staticmethod
+    def _close_book_sync(
+        book_identifier: str,
+        pid: Optional[int] = None,
+        save: bool = True,
+        path: Optional[str] = None
+    ) -> bool:
+        """close_bookの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
+            book = _resolve_book(book_identifier, pid)
             
             if save and path:
+                # 保存はxlwingsに任せる (DisplayAlertsの抑止・相対パスの
+                # 解決・FileFormatの推定を含む)。生のSaveAsは既存ファイル
+                # への上書き確認ダイアログでexecutorスレッドを塞ぐ。
+                # 閉じる際の再保存だけ省く
                 book.save(path=path)
-            book.close(save=save)
+                book.close(save=False)
+            else:
+                book.close(save=save)
+            _invalidate_book(book_identifier)
             return True
         except Exception as e:
             raise ValueError(f"Failed to close workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def save_book(
-        book_identifier: str, 
-        pid: Optional[int] = None, 
+    async def save_book(
+        book_identifier: str,
+        pid: Optional[int] = None,
         path: Optional[str] = None
     ) -> Dict[str, Any]:
         """
@@ -230,40 +581,55 @@ class BookAdapter:
         Raises:
             ValueError: ワークブックが見つからないか保存できない場合
         """
+        return await run_in_excel_executor(
+            BookAdapter._save_book_sync, book_identifier, pid, path, pid=pid
+        )
+
+    @staticmethod
+    def _save_book_sync(
+        book_identifier: str,
+        pid: Optional[int] = None,
+        path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """save_bookの同期実装。"""
         book = None
         try:
             # 1. まずブックを取得する
-            if pid is not None:
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            # 2. ブックを保存する（この時点でブックの情報をシリアル化）
-            book_info = to_serializable(book)
-            
-            # 3. 保存処理を実行
-            logger.debug(f"Saving workbook '{book_identifier}'{' to ' + path if path else ''}")
-            if path:
-                book.save(path=path)
-            else:
-                book.save()
-            
+            book = _resolve_book(book_identifier, pid)
+
+            # 2. ブックの識別情報を1回のトラバースで控えておく
+            #    (to_serializableは属性ごとにCOM呼び出しを行うため使わない)
+            snapshot = {
+                "name": book.name,
+                "fullname": book.fullname,
+                "path": book.fullname,
+                "app_id": book.app.pid if book.app else None,
+                "sheets": [sheet.name for sheet in book.sheets],
+            }
+
+            # 3. 保存処理を実行 (保存中の再計算は抑止する)
+            # DEBUGが無効のときにフォーマットを走らせない遅延スタイルで記録する
+            logger.debug("Saving workbook '%s'%s", book_identifier, f" to {path}" if path else "")
+            with _suspended_calculation(book.app):
+                if path:
+                    book.save(path=path)
+                    # 保存先が変わった場合のみフルパスを読み直す
+                    snapshot["fullname"] = book.fullname
+                    snapshot["path"] = snapshot["fullname"]
+                else:
+                    book.save()
+
             # 4. 保存に成功したブックの情報を返す
-            return book_info
-            
+            return snapshot
+
         except Exception as e:
             error_msg = f"Failed to save workbook '{book_identifier}': {str(e)}"
             logger.error(error_msg)
             raise ValueError(error_msg)
     
     @staticmethod
-    def get_book_sheets(
-        book_identifier: str, 
+    async def get_book_sheets(
+        book_identifier: str,
         pid: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
@@ -279,19 +645,64 @@ class BookAdapter:
         Raises:
             ValueError: ワークブックが見つからない場合
         """
+        return await run_in_excel_executor(
+            BookAdapter._get_book_sheets_sync, book_identifier, pid, pid=pid
+        )
+
+    @staticmethod
+    def _get_book_sheets_sync(
+        book_identifier: str,
+        pid: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """get_book_sheetsの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            return [to_serializable(sheet) for sheet in book.sheets]
+            book = _resolve_book(book_identifier, pid)
+
+            return _bulk_sheet_info(book)
         except Exception as e:
             raise ValueError(f"Failed to get sheets for workbook '{book_identifier}': {str(e)}")
+
+    @staticmethod
+    async def batch_open(
+        paths: List[str],
+        read_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        複数のワークブックを並列に開いて情報を取得します。
+
+        ExcelのCOMオートメーションは1アプリケーションにつき1スレッドでしか
+        駆動できないため、ワークブック数が多い場合はプロセスプールで
+        ワーカーごとに専用のExcelアプリケーションを立てて並列化します。
+
+        Args:
+            paths: ワークブックのパスのリスト
+            read_only: 読み取り専用で開くかどうか
+
+        Returns:
+            ワークブック情報のリスト (pathsと同じ順序)
+
+        Raises:
+            ValueError: いずれかのワークブックが開けない場合
+        """
+        return await run_in_excel_executor(
+            BookAdapter._batch_open_sync, paths, read_only
+        )
+
+    @staticmethod
+    def _batch_open_sync(
+        paths: List[str],
+        read_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """batch_openの同期実装。"""
+        if not paths:
+            return []
+
+        try:
+            with ProcessPoolExecutor(max_workers=min(8, len(paths))) as pool:
+                futures = [
+                    pool.submit(_batch_open_worker, path, read_only)
+                    for path in paths
+                ]
+                return [future.result() for future in futures]
+        except Exception as e:
+            raise ValueError(f"Failed to batch open workbooks: {str(e)}")
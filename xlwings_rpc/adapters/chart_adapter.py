@@ -0,0 +1,808 @@
+"""
+Excel Chartアダプター
+
+xlwingsのChartオブジェクトとAPI間のインターフェースを提供します。
+"""
+from typing import Dict, List, Optional, Any, Union
+import sys
+import types
+import logging
+import weakref
+import xlwings as xw
+from contextlib import contextmanager
+from xlwings_rpc.utils.converters import to_serializable, to_serializable_many
+from xlwings_rpc.adapters.book_adapter import _resolve_book
+from xlwings_rpc.adapters._fast import excel_fast, pause_screen_updating
+from xlwings_rpc.utils.executors import run_in_excel_executor
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# プラットフォーム判定はインポート時に1度だけ行う
+# (チャート操作のたびに文字列比較を繰り返さない)
+_IS_DARWIN = sys.platform == 'darwin'
+
+# 汎用チャートタイプ名からxlwingsのチャートタイプ名へのマッピング
+# (書き換え不可のビューとして公開する)
+CHART_TYPE_MAPPING = types.MappingProxyType({
+    "line": "line",
+    "bar": "bar_clustered",
+    "column": "column_clustered",
+    "area": "area",
+    "pie": "pie",
+    "scatter": "xy_scatter",
+    "radar": "radar",
+    "doughnut": "doughnut",
+})
+
+# get_chart_typesのレスポンスはインポート時に1度だけ構築して使い回す
+_CHART_TYPES_RESPONSE = dict(CHART_TYPE_MAPPING)
+
+# macOSで読み替えが必要なチャートタイプ
+_MAC_CHART_TYPE_MAPPING = {
+    "bar": "bar_clustered",
+    "column": "column_clustered",
+    "scatter": "xy_scatter",
+}
+
+# 凡例位置の変換テーブル (定数なので呼び出しごとに構築しない)
+_MAC_LEGEND_POSITIONS = types.MappingProxyType({
+    'bottom': 'legend_position_bottom',
+    'corner': 'legend_position_corner',
+    'left': 'legend_position_left',
+    'right': 'legend_position_right',
+    'top': 'legend_position_top',
+})
+
+# WindowsのXlLegendPosition定数
+_WIN_LEGEND_POSITIONS = types.MappingProxyType({
+    'bottom': -4107,
+    'corner': 2,
+    'left': -4131,
+    'right': -4152,
+    'top': -4160,
+})
+
+
+def _set_mac_title(api, value: str) -> None:
+    api.chart_title.chart_title_text.set(value)
+
+
+def _set_mac_has_legend(api, value: bool) -> None:
+    api.has_legend.set(value)
+
+
+def _set_mac_legend_position(api, value: str) -> None:
+    if value not in _MAC_LEGEND_POSITIONS:
+        raise ValueError(f"Invalid legend position: {value}")
+    api.legend.position.set(_MAC_LEGEND_POSITIONS[value])
+
+
+def _set_win_title(api, value: str) -> None:
+    api.HasTitle = True
+    api.ChartTitle.Text = value
+
+
+def _set_win_has_legend(api, value: bool) -> None:
+    api.HasLegend = value
+
+
+def _set_win_legend_position(api, value: str) -> None:
+    if value not in _WIN_LEGEND_POSITIONS:
+        raise ValueError(f"Invalid legend position: {value}")
+    # 位置の指定は凡例の表示を含むため、HasLegendは1度だけ書く
+    api.HasLegend = True
+    api.Legend.Position = _WIN_LEGEND_POSITIONS[value]
+
+
+# プロパティ名→設定関数のディスパッチテーブル。
+# プラットフォーム分岐はインポート時に1度だけ解決し、
+# customize_chartはテーブルを引くだけにする。
+_MAC_CUSTOMIZERS = types.MappingProxyType({
+    "title": _set_mac_title,
+    "has_legend": _set_mac_has_legend,
+    "legend_position": _set_mac_legend_position,
+})
+_WIN_CUSTOMIZERS = types.MappingProxyType({
+    "title": _set_win_title,
+    "has_legend": _set_win_has_legend,
+    "legend_position": _set_win_legend_position,
+})
+_CUSTOMIZERS = _MAC_CUSTOMIZERS if _IS_DARWIN else _WIN_CUSTOMIZERS
+
+
+# プラットフォーム分岐は呼び出しごとではなくインポート時に1度だけ解決し、
+# 各プラットフォームには単一の辞書引きだけが残る
+if _IS_DARWIN:
+    def get_platform_chart_type(chart_type: str) -> str:
+        """
+        プラットフォームに応じたチャートタイプ名を取得します (macOS版)。
+
+        Args:
+            chart_type: 汎用チャートタイプ名 (例: "line", "bar")
+
+        Returns:
+            xlwingsに渡すチャートタイプ名
+        """
+        return _MAC_CHART_TYPE_MAPPING.get(chart_type, CHART_TYPE_MAPPING.get(chart_type, chart_type))
+else:
+    def get_platform_chart_type(chart_type: str) -> str:
+        """
+        プラットフォームに応じたチャートタイプ名を取得します。
+
+        macOS以外では汎用名からの読み替えだけを行います。
+
+        Args:
+            chart_type: 汎用チャートタイプ名 (例: "line", "bar")
+
+        Returns:
+            xlwingsに渡すチャートタイプ名
+        """
+        return CHART_TYPE_MAPPING.get(chart_type, chart_type)
+
+
+# 解決済みチャートハンドルの弱参照キャッシュ
+# (キーは(ブック名, シート名, 識別子)。同じチャートへの連続した操作で
+#  COMコレクションの名前走査を繰り返さないために使う)
+_CHART_CACHE: "weakref.WeakValueDictionary[tuple, xw.Chart]" = weakref.WeakValueDictionary()
+
+
+def _lookup_chart(sheet: xw.Sheet, chart_identifier: Union[str, int]) -> xw.Chart:
+    """
+    シートからチャートを解決します。
+
+    キャッシュ済みのハンドルは返す前に.nameを読んで生存確認し、
+    失効していれば破棄してコレクションから解決し直します。
+
+    Args:
+        sheet: Sheetハンドル
+        chart_identifier: チャート名かインデックス
+
+    Returns:
+        Chartハンドル
+
+    Raises:
+        ValueError: チャートが見つからない場合
+    """
+    key = (sheet.book.name, sheet.name, str(chart_identifier))
+    chart = _CHART_CACHE.get(key)
+    if chart is not None:
+        try:
+            chart.name
+            return chart
+        except Exception:
+            _CHART_CACHE.pop(key, None)
+
+    try:
+        chart = sheet.charts[chart_identifier]
+    except (IndexError, KeyError):
+        raise ValueError(f"No chart found with identifier '{chart_identifier}'")
+    _CHART_CACHE[key] = chart
+    return chart
+
+
+def _invalidate_chart(book_name: str, sheet_name: str) -> None:
+    """
+    シートのチャートキャッシュエントリをまとめて破棄します。
+
+    チャートを削除すると残りのチャートのインデックスがずれるため、
+    名前キー・インデックスキーを問わずシート単位で破棄します。
+
+    Args:
+        book_name: ワークブック名
+        sheet_name: シート名
+    """
+    for key in [
+        k for k in _CHART_CACHE
+        if k[0] == book_name and k[1] == sheet_name
+    ]:
+        _CHART_CACHE.pop(key, None)
+
+
+class ChartAdapter:
+    """
+    xlwingsのChartオブジェクトに対するアダプタークラス
+    """
+
+    @staticmethod
+    def _resolve(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        pid: Optional[int] = None
+    ) -> tuple:
+        """
+        アプリケーション・ブック・シートを一度の解決でまとめて取得します。
+
+        以前は各メソッドがSheetAdapter.get_sheetで存在確認だけを行った後、
+        同じアプリケーションとブックを再取得していました。確認のための
+        往復は省き、解決は1回だけ行います。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            sheet_identifier: シート名かインデックス
+            pid: ExcelアプリケーションのプロセスID (オプション)
+
+        Returns:
+            (app, book, sheet) のタプル
+
+        Raises:
+            ValueError: 指定されたPIDのアプリケーションが見つからない場合
+        """
+        book = _resolve_book(book_identifier, pid)
+        sheet = book.sheets[sheet_identifier]
+        return book.app, book, sheet
+
+    @staticmethod
+    def _resolve_chart(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        chart_identifier: Union[str, int],
+        pid: Optional[int] = None
+    ) -> tuple:
+        """
+        _resolveに加えてチャートも解決します。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            sheet_identifier: シート名かインデックス
+            chart_identifier: チャート名かインデックス
+            pid: ExcelアプリケーションのプロセスID (オプション)
+
+        Returns:
+            (app, book, sheet, chart) のタプル
+
+        Raises:
+            ValueError: チャートが見つからない場合
+        """
+        app, book, sheet = ChartAdapter._resolve(
+            book_identifier, sheet_identifier, pid
+        )
+        return app, book, sheet, _lookup_chart(sheet, chart_identifier)
+
+    @staticmethod
+    def _chart_handle(book: xw.Book, sheet: xw.Sheet, chart: xw.Chart) -> Dict[str, Any]:
+        """
+        チャートを再取得するための軽量なハンドルを構築します。
+
+        変更系メソッドの成功確認だけが必要な呼び出し側のために、
+        全プロパティのシリアライズを遅延させます。詳細が必要に
+        なったらchart.getで取得できます。
+
+        Args:
+            book: Bookハンドル
+            sheet: Sheetハンドル
+            chart: Chartハンドル
+
+        Returns:
+            {"book", "sheet", "chart"} の識別子辞書
+        """
+        return {
+            "book": book.name,
+            "sheet": sheet.name,
+            "chart": chart.name,
+        }
+
+    @staticmethod
+    def get_chart_types() -> Dict[str, str]:
+        """
+        利用可能なチャートタイプの一覧を取得します。
+
+        Returns:
+            汎用チャートタイプ名とxlwingsチャートタイプ名のマッピング
+        """
+        return _CHART_TYPES_RESPONSE
+
+    @staticmethod
+    async def get_charts(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        pid: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        シート内のすべてのチャートを取得します。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            sheet_identifier: シート名かインデックス
+            pid: ExcelアプリケーションのプロセスID (オプション)
+
+        Returns:
+            チャート情報のリスト
+
+        Raises:
+            ValueError: ワークブックやシートが見つからない場合
+        """
+        return await run_in_excel_executor(
+            ChartAdapter._get_charts_sync,
+            book_identifier, sheet_identifier, pid,
+            pid=pid
+        )
+
+    @staticmethod
+    def _get_charts_sync(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        pid: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """get_chartsの同期実装。"""
+        try:
+            app, book, sheet = ChartAdapter._resolve(
+                book_identifier, sheet_identifier, pid
+            )
+            return to_serializable_many(sheet.charts, sheet_name=sheet.name)
+        except Exception as e:
+            raise ValueError(f"Failed to get charts for sheet '{sheet_identifier}' in workbook '{book_identifier}': {str(e)}")
+
+    @staticmethod
+    async def get_chart(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        chart_identifier: Union[str, int],
+        pid: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        特定のチャートを取得します。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            sheet_identifier: シート名かインデックス
+            chart_identifier: チャート名かインデックス
+            pid: ExcelアプリケーションのプロセスID (オプション)
+
+        Returns:
+            チャート情報
+
+        Raises:
+            ValueError: ワークブック、シート、チャートが見つからない場合
+        """
+        return await run_in_excel_executor(
+            ChartAdapter._get_chart_sync,
+            book_identifier, sheet_identifier, chart_identifier, pid,
+            pid=pid
+        )
+
+    @staticmethod
+    def _get_chart_sync(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        chart_identifier: Union[str, int],
+        pid: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """get_chartの同期実装。"""
+        try:
+            app, book, sheet, chart = ChartAdapter._resolve_chart(
+                book_identifier, sheet_identifier, chart_identifier, pid
+            )
+
+            return to_serializable(chart)
+        except Exception as e:
+            raise ValueError(f"Failed to get chart '{chart_identifier}' from sheet '{sheet_identifier}' in workbook '{book_identifier}': {str(e)}")
+
+    @staticmethod
+    async def add_chart(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        source_address: str,
+        chart_type: str = "line",
+        left: float = 100,
+        top: float = 100,
+        width: float = 375,
+        height: float = 225,
+        pid: Optional[int] = None,
+        return_details: bool = True
+    ) -> Dict[str, Any]:
+        """
+        新しいチャートを追加します。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            sheet_identifier: シート名かインデックス
+            source_address: データソースのセル範囲 (例: "A1:B10")
+            chart_type: チャートタイプ (デフォルト: "line")
+            left: チャートの左位置 (デフォルト: 100)
+            top: チャートの上位置 (デフォルト: 100)
+            width: チャートの幅 (デフォルト: 375)
+            height: チャートの高さ (デフォルト: 225)
+            pid: ExcelアプリケーションのプロセスID (オプション)
+            return_details: 完全なチャート情報を返すかどうか (デフォルト: True)
+
+        Returns:
+            新しいチャート情報
+
+        Raises:
+            ValueError: ワークブックやシートが見つからないか、チャート追加に失敗した場合
+        """
+        return await run_in_excel_executor(
+            ChartAdapter._add_chart_sync,
+            book_identifier, sheet_identifier, source_address, chart_type, left, top, width, height, pid, return_details,
+            pid=pid
+        )
+
+    @staticmethod
+    def _add_chart_sync(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        source_address: str,
+        chart_type: str = "line",
+        left: float = 100,
+        top: float = 100,
+        width: float = 375,
+        height: float = 225,
+        pid: Optional[int] = None,
+        return_details: bool = True
+    ) -> Dict[str, Any]:
+        """add_chartの同期実装。"""
+        try:
+            app, book, sheet = ChartAdapter._resolve(
+                book_identifier, sheet_identifier, pid
+            )
+            return ChartAdapter._add_chart_on(
+                app, book, sheet, source_address, chart_type,
+                left, top, width, height, return_details
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to add chart to sheet '{sheet_identifier}' in workbook '{book_identifier}': {str(e)}")
+
+    @staticmethod
+    def _add_chart_on(
+        app: xw.App,
+        book: xw.Book,
+        sheet: xw.Sheet,
+        source_address: str,
+        chart_type: str = "line",
+        left: float = 100,
+        top: float = 100,
+        width: float = 375,
+        height: float = 225,
+        return_details: bool = True
+    ) -> Dict[str, Any]:
+        """解決済みハンドルに対するadd_chartの実装。"""
+        # 追加→データソース設定→タイプ変更の3ステップを1つの
+        # 再描画抑止ウィンドウにまとめる
+        with pause_screen_updating(app):
+            chart = sheet.charts.add(left=left, top=top, width=width, height=height)
+            chart.set_source_data(sheet.range(source_address))
+            chart.chart_type = get_platform_chart_type(chart_type)
+
+        if not return_details:
+            return ChartAdapter._chart_handle(book, sheet, chart)
+        return to_serializable(chart)
+
+    @staticmethod
+    async def set_chart_type(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        chart_identifier: Union[str, int],
+        chart_type: str,
+        pid: Optional[int] = None,
+        return_details: bool = True
+    ) -> Dict[str, Any]:
+        """
+        チャートタイプを変更します。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            sheet_identifier: シート名かインデックス
+            chart_identifier: チャート名かインデックス
+            chart_type: 新しいチャートタイプ (例: "line", "bar")
+            pid: ExcelアプリケーションのプロセスID (オプション)
+            return_details: 完全なチャート情報を返すかどうか (デフォルト: True)
+
+        Returns:
+            更新されたチャート情報
+
+        Raises:
+            ValueError: ワークブック、シート、チャートが見つからない場合
+        """
+        return await run_in_excel_executor(
+            ChartAdapter._set_chart_type_sync,
+            book_identifier, sheet_identifier, chart_identifier, chart_type, pid, return_details,
+            pid=pid
+        )
+
+    @staticmethod
+    def _set_chart_type_sync(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        chart_identifier: Union[str, int],
+        chart_type: str,
+        pid: Optional[int] = None,
+        return_details: bool = True
+    ) -> Dict[str, Any]:
+        """set_chart_typeの同期実装。"""
+        try:
+            app, book, sheet, chart = ChartAdapter._resolve_chart(
+                book_identifier, sheet_identifier, chart_identifier, pid
+            )
+            return ChartAdapter._set_chart_type_on(
+                app, book, sheet, chart, chart_type, return_details
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to set chart type for chart '{chart_identifier}' in sheet '{sheet_identifier}' of workbook '{book_identifier}': {str(e)}")
+
+    @staticmethod
+    def _set_chart_type_on(
+        app: xw.App,
+        book: xw.Book,
+        sheet: xw.Sheet,
+        chart: xw.Chart,
+        chart_type: str,
+        return_details: bool = True
+    ) -> Dict[str, Any]:
+        """解決済みハンドルに対するset_chart_typeの実装。"""
+        # 再描画を止めた上で1回だけ設定する
+        # (支配的なコストはクロスプロセス呼び出しであり、
+        #  以前の二重設定と待機は遅延を増やすだけだった)
+        with pause_screen_updating(app):
+            chart.chart_type = get_platform_chart_type(chart_type)
+
+        if not return_details:
+            return ChartAdapter._chart_handle(book, sheet, chart)
+        return to_serializable(chart)
+
+    @staticmethod
+    async def customize_chart(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        chart_identifier: Union[str, int],
+        title: Optional[str] = None,
+        chart_type: Optional[str] = None,
+        has_legend: Optional[bool] = None,
+        legend_position: Optional[str] = None,
+        pid: Optional[int] = None,
+        return_details: bool = True
+    ) -> Dict[str, Any]:
+        """
+        チャートの外観をカスタマイズします。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            sheet_identifier: シート名かインデックス
+            chart_identifier: チャート名かインデックス
+            title: チャートタイトル (オプション)
+            chart_type: チャートタイプ (オプション)
+            has_legend: 凡例を表示するかどうか (オプション)
+            legend_position: 凡例の位置 ('bottom', 'corner', 'left', 'right', 'top') (オプション)
+            pid: ExcelアプリケーションのプロセスID (オプション)
+            return_details: 完全なチャート情報を返すかどうか (デフォルト: True)
+
+        Returns:
+            更新されたチャート情報
+
+        Raises:
+            ValueError: ワークブック、シート、チャートが見つからない場合
+        """
+        return await run_in_excel_executor(
+            ChartAdapter._customize_chart_sync,
+            book_identifier, sheet_identifier, chart_identifier, title, chart_type, has_legend, legend_position, pid, return_details,
+            pid=pid
+        )
+
+    @staticmethod
+    def _customize_chart_sync(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        chart_identifier: Union[str, int],
+        title: Optional[str] = None,
+        chart_type: Optional[str] = None,
+        has_legend: Optional[bool] = None,
+        legend_position: Optional[str] = None,
+        pid: Optional[int] = None,
+        return_details: bool = True
+    ) -> Dict[str, Any]:
+        """customize_chartの同期実装。"""
+        try:
+            app, book, sheet, chart = ChartAdapter._resolve_chart(
+                book_identifier, sheet_identifier, chart_identifier, pid
+            )
+            return ChartAdapter._customize_chart_on(
+                app, book, sheet, chart,
+                title, chart_type, has_legend, legend_position, return_details
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to customize chart '{chart_identifier}' in sheet '{sheet_identifier}' of workbook '{book_identifier}': {str(e)}")
+
+    @staticmethod
+    def _customize_chart_on(
+        app: xw.App,
+        book: xw.Book,
+        sheet: xw.Sheet,
+        chart: xw.Chart,
+        title: Optional[str] = None,
+        chart_type: Optional[str] = None,
+        has_legend: Optional[bool] = None,
+        legend_position: Optional[str] = None,
+        return_details: bool = True
+    ) -> Dict[str, Any]:
+        """解決済みハンドルに対するcustomize_chartの実装。"""
+        # 複数のプロパティ書き込みを1つの抑止ウィンドウにまとめる
+        with excel_fast(app):
+            ChartAdapter._apply_customizations(
+                chart, title, chart_type, has_legend, legend_position
+            )
+
+        if not return_details:
+            return ChartAdapter._chart_handle(book, sheet, chart)
+        return to_serializable(chart)
+
+    @staticmethod
+    def _apply_customizations(
+        chart: xw.Chart,
+        title: Optional[str],
+        chart_type: Optional[str],
+        has_legend: Optional[bool],
+        legend_position: Optional[str]
+    ) -> None:
+        """customize_chartの各プロパティ設定の実装。
+
+        プラットフォームごとの設定関数は_CUSTOMIZERSテーブルで
+        インポート時に解決済みのため、ここでは渡された値を順に
+        引き当てるだけです。
+        """
+        # チャートタイプの変更 (xlwingsレベルのプロパティのため先に処理する)
+        if chart_type is not None:
+            chart.chart_type = get_platform_chart_type(chart_type)
+
+        settings = {
+            "title": title,
+            "has_legend": has_legend,
+            "legend_position": legend_position,
+        }
+        # 位置の指定は凡例の表示を含むため、両方指定された場合は位置を優先する
+        if legend_position is not None:
+            settings["has_legend"] = None
+
+        # COMハンドルは1度だけ取得して使い回す
+        api = chart.api if _IS_DARWIN else chart.api[1]
+        for key, value in settings.items():
+            if value is not None:
+                _CUSTOMIZERS[key](api, value)
+
+    @staticmethod
+    async def delete_chart(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        chart_identifier: Union[str, int],
+        pid: Optional[int] = None
+    ) -> bool:
+        """
+        チャートを削除します。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            sheet_identifier: シート名かインデックス
+            chart_identifier: チャート名かインデックス
+            pid: ExcelアプリケーションのプロセスID (オプション)
+
+        Returns:
+            成功した場合はTrue
+
+        Raises:
+            ValueError: ワークブック、シート、チャートが見つからない場合
+        """
+        return await run_in_excel_executor(
+            ChartAdapter._delete_chart_sync,
+            book_identifier, sheet_identifier, chart_identifier, pid,
+            pid=pid
+        )
+
+    @staticmethod
+    def _delete_chart_sync(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        chart_identifier: Union[str, int],
+        pid: Optional[int] = None
+    ) -> bool:
+        """delete_chartの同期実装。"""
+        try:
+            app, book, sheet, chart = ChartAdapter._resolve_chart(
+                book_identifier, sheet_identifier, chart_identifier, pid
+            )
+
+            chart.delete()
+            _invalidate_chart(book.name, sheet.name)
+            return True
+        except Exception as e:
+            raise ValueError(f"Failed to delete chart '{chart_identifier}' from sheet '{sheet_identifier}' in workbook '{book_identifier}': {str(e)}")
+
+    @staticmethod
+    @contextmanager
+    def session(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        pid: Optional[int] = None
+    ):
+        """
+        同じシートへの連続したチャート操作のためのセッションを開きます。
+
+        各メソッドは呼び出しごとにapp・book・sheetを解決し直しますが、
+        同じチャートに対してadd→set_chart_type→customizeと呼ぶような
+        一連の操作では解決コストが積み上がります。セッションは解決を
+        1度だけ行い、呼び出し間で共有します::
+
+            with ChartAdapter.session(book, sheet, pid) as s:
+                s.set_chart_type("Chart 1", "bar")
+                s.customize_chart("Chart 1", title="Sales")
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            sheet_identifier: シート名かインデックス
+            pid: ExcelアプリケーションのプロセスID (オプション)
+
+        Yields:
+            ChartSession
+        """
+        app, book, sheet = ChartAdapter._resolve(
+            book_identifier, sheet_identifier, pid
+        )
+        yield ChartSession(app, book, sheet)
+
+
+class ChartSession:
+    """
+    解決済みのapp・book・sheetを保持するチャート操作セッション
+
+    ChartAdapter.session経由で取得し、各操作での再解決を省きます。
+    """
+
+    def __init__(self, app: xw.App, book: xw.Book, sheet: xw.Sheet):
+        self.app = app
+        self.book = book
+        self.sheet = sheet
+
+    def _chart(self, chart_identifier: Union[str, int]) -> xw.Chart:
+        """セッションのシートからチャートを解決します。"""
+        return _lookup_chart(self.sheet, chart_identifier)
+
+    def add_chart(
+        self,
+        source_address: str,
+        chart_type: str = "line",
+        left: float = 100,
+        top: float = 100,
+        width: float = 375,
+        height: float = 225,
+        return_details: bool = True
+    ) -> Dict[str, Any]:
+        """add_chartのセッション版。"""
+        return ChartAdapter._add_chart_on(
+            self.app, self.book, self.sheet, source_address, chart_type,
+            left, top, width, height, return_details
+        )
+
+    def get_chart(self, chart_identifier: Union[str, int]) -> Dict[str, Any]:
+        """get_chartのセッション版。"""
+        return to_serializable(self._chart(chart_identifier))
+
+    def set_chart_type(
+        self,
+        chart_identifier: Union[str, int],
+        chart_type: str,
+        return_details: bool = True
+    ) -> Dict[str, Any]:
+        """set_chart_typeのセッション版。"""
+        return ChartAdapter._set_chart_type_on(
+            self.app, self.book, self.sheet, self._chart(chart_identifier),
+            chart_type, return_details
+        )
+
+    def customize_chart(
+        self,
+        chart_identifier: Union[str, int],
+        title: Optional[str] = None,
+        chart_type: Optional[str] = None,
+        has_legend: Optional[bool] = None,
+        legend_position: Optional[str] = None,
+        return_details: bool = True
+    ) -> Dict[str, Any]:
+        """customize_chartのセッション版。"""
+        return ChartAdapter._customize_chart_on(
+            self.app, self.book, self.sheet, self._chart(chart_identifier),
+            title, chart_type, has_legend, legend_position, return_details
+        )
+
+    def delete_chart(self, chart_identifier: Union[str, int]) -> bool:
+        """delete_chartのセッション版。"""
+        self._chart(chart_identifier).delete()
+        _invalidate_chart(self.book.name, self.sheet.name)
+        return True
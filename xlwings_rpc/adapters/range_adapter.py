@@ -3,17 +3,39 @@ Excel Rangeアダプター
 
 xlwingsのRangeオブジェクトとAPI間のインターフェースを提供します。
 """
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Union, Tuple
+import os
+import re
+import sys
 import logging
 import json
 import xlwings as xw
 import pandas as pd
 import numpy as np
-from xlwings_rpc.utils.converters import to_serializable, from_json_value
+from xlwings_rpc.utils.converters import to_serializable, from_json_value, dataframe_payload
+from xlwings_rpc.adapters._resolve import (
+    resolve_sheet, resolve_range, note_sheet_mutation
+)
+from xlwings_rpc.adapters._fast import excel_fast
+from xlwings_rpc.utils.executors import run_in_excel_executor
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# この数を超えるセル数の読み取りは行方向のチャンクに分割する
+# (1回のCOM/AppleScriptマーシャリングが大きすぎるとタイムアウトや
+#  メモリのピークを招くため)
+_CHUNK_CELLS = 100_000
+
+# 単一セルのアドレス (例: "A1", "$B$2") の判定用。インポート時に
+# コンパイルし、読み取りの形状問い合わせを省く判定に使う
+_SINGLE_CELL = re.compile(r"^\$?[A-Za-z]{1,3}\$?[0-9]+$")
+
+_IS_DARWIN = sys.platform == 'darwin'
+
+# Excelの複数エリアRangeに渡すアドレス文字列の上限
+_UNION_ADDRESS_LIMIT = 255
+
 
 class RangeAdapter:
     """
@@ -21,7 +43,7 @@ class RangeAdapter:
     """
     
     @staticmethod
-    def get_range(
+    async def get_range(
         book_identifier: str, 
         sheet_identifier: Union[str, int], 
         address: str,
@@ -42,27 +64,29 @@ class RangeAdapter:
         Raises:
             ValueError: ワークブック、シート、範囲が見つからない場合
         """
+        return await run_in_excel_executor(
+            RangeAdapter._get_range_sync,
+            book_identifier, sheet_identifier, address, pid,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _get_range_sync(
+        book_identifier: str, 
+        sheet_identifier: Union[str, int], 
+        address: str,
+        pid: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """get_rangeの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            sheet = book.sheets[sheet_identifier]
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
             range_obj = sheet.range(address)
             return to_serializable(range_obj)
         except Exception as e:
             raise ValueError(f"Failed to get range '{address}' from sheet '{sheet_identifier}' in workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def get_range_value(
+    async def get_range_value(
         book_identifier: str, 
         sheet_identifier: Union[str, int], 
         address: str,
@@ -83,25 +107,152 @@ class RangeAdapter:
         Raises:
             ValueError: ワークブック、シート、範囲が見つからない場合
         """
+        return await run_in_excel_executor(
+            RangeAdapter._get_range_value_sync,
+            book_identifier, sheet_identifier, address, pid,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _get_range_value_sync(
+        book_identifier: str, 
+        sheet_identifier: Union[str, int], 
+        address: str,
+        pid: Optional[int] = None
+    ) -> Any:
+        """get_range_valueの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
+            range_obj = resolve_range(book_identifier, sheet_identifier, address, pid)
+
+            # 単一セルはスカラーで返るため、形状の問い合わせ
+            # (COM往復2回) とチャンク判定を省いて直接読む
+            if _SINGLE_CELL.match(address):
+                return to_serializable(range_obj.value)
+
+            n_rows, n_cols = range_obj.shape
+            if n_rows * n_cols > _CHUNK_CELLS:
+                value = RangeAdapter._read_chunked(
+                    range_obj.sheet, range_obj, n_rows, n_cols
+                )
             else:
-                book = xw.Book(book_identifier)
-            
-            sheet = book.sheets[sheet_identifier]
-            range_obj = sheet.range(address)
-            return to_serializable(range_obj.value)
+                value = range_obj.value
+
+            return RangeAdapter._serialize_read(value)
         except Exception as e:
             raise ValueError(f"Failed to get value of range '{address}' from sheet '{sheet_identifier}' in workbook '{book_identifier}': {str(e)}")
+
+    @staticmethod
+    def _serialize_read(value: Any) -> Any:
+        """
+        読み取った値をレスポンス用に正規化します。
+
+        2次元リストをセルごとに再帰処理すると大きな数値範囲では
+        読み取り自体より高くつくため、NumPyでNaN→Noneの正規化だけを
+        一括で行います (日付などはjson_encoderが出力時に変換します)。
+
+        Args:
+            value: 読み取った値
+
+        Returns:
+            正規化された値
+        """
+        if isinstance(value, list) and value and isinstance(value[0], list):
+            arr = np.array(value, dtype=object)
+            arr[pd.isna(arr)] = None
+            return arr.tolist()
+        return to_serializable(value)
+
+    @staticmethod
+    def _read_chunked(
+        sheet: xw.Sheet,
+        range_obj: xw.Range,
+        n_rows: int,
+        n_cols: int
+    ) -> List[List[Any]]:
+        """
+        巨大な範囲を行方向のチャンクに分けて読み取ります。
+
+        1回のマーシャリングが_CHUNK_CELLSセル以下に収まるよう
+        行数を区切り、チャンクごとに読み取って連結します。
+
+        Args:
+            sheet: Sheetハンドル
+            range_obj: 読み取る範囲
+            n_rows: 範囲の行数
+            n_cols: 範囲の列数
+
+        Returns:
+            2次元リストの値
+        """
+        first_row = range_obj.row
+        first_col = range_obj.column
+        last_col = first_col + n_cols - 1
+        step = max(1, _CHUNK_CELLS // n_cols)
+
+        values: List[List[Any]] = []
+        for r0 in range(first_row, first_row + n_rows, step):
+            r1 = min(r0 + step - 1, first_row + n_rows - 1)
+            chunk = sheet.range((r0, first_col), (r1, last_col)).value
+            # 1行・1列のチャンクは1次元で返るため2次元に正規化する
+            if not isinstance(chunk, list):
+                chunk = [[chunk]]
+            elif chunk and not isinstance(chunk[0], list):
+                chunk = [[v] for v in chunk] if n_cols == 1 else [chunk]
+            values.extend(chunk)
+        return values
     
+    @staticmethod
+    def _ensure_com_safe(values: List[List[Any]]) -> List[List[Any]]:
+        """
+        書き込み前に2次元リストの値を正規化します。
+
+        NaNはNoneに、numpyスカラーはPythonの組み込み型に変換し、
+        マーシャリングできない値が混ざらないようにします。
+
+        Args:
+            values: 2次元リストの値
+
+        Returns:
+            正規化された2次元リスト
+        """
+        safe = []
+        for row in values:
+            safe_row = []
+            for v in row:
+                if isinstance(v, np.generic):
+                    v = v.item()
+                if isinstance(v, float) and np.isnan(v):
+                    v = None
+                safe_row.append(v)
+            safe.append(safe_row)
+        return safe
+
+    @staticmethod
+    def _minimal_result(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        address: str
+    ) -> Dict[str, Any]:
+        """
+        変更系メソッドの軽量な応答を構築します。
+
+        呼び出し側が既に知っている識別子だけを返し、結果を返すための
+        COM再読取りを省きます。詳細が必要ならrange.getで取得できます。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            sheet_identifier: シート名かインデックス
+            address: セル範囲のアドレス
+
+        Returns:
+            {"book", "sheet", "address"} の識別子辞書
+        """
+        return {
+            "book": book_identifier,
+            "sheet": sheet_identifier,
+            "address": address,
+        }
+
     @staticmethod
     def decode_json_string(value: Any) -> Any:
         """
@@ -117,7 +268,7 @@ class RangeAdapter:
             try:
                 # JSONとして解析を試みる
                 decoded = json.loads(value)
-                logger.error(f"Successfully decoded JSON string: {value[:100]}...")
+                logger.error("Successfully decoded JSON string: %s...", value[:100])
                 return decoded
             except (json.JSONDecodeError, ValueError):
                 # 通常の文字列はそのまま返す
@@ -127,12 +278,13 @@ class RangeAdapter:
         return value
     
     @staticmethod
-    def set_range_value(
+    async def set_range_value(
         book_identifier: str, 
         sheet_identifier: Union[str, int], 
         address: str,
         value: Any,
-        pid: Optional[int] = None
+        pid: Optional[int] = None,
+        return_minimal: bool = False
     ) -> Dict[str, Any]:
         """
         指定された範囲に値を設定します。
@@ -143,6 +295,7 @@ class RangeAdapter:
             address: セル範囲のアドレス
             value: 設定する値
             pid: ExcelアプリケーションのプロセスID (オプション)
+            return_minimal: COMを再読取りせず識別子だけ返すかどうか (デフォルト: False)
 
         Returns:
             更新された範囲情報
@@ -150,33 +303,102 @@ class RangeAdapter:
         Raises:
             ValueError: ワークブック、シート、範囲が見つからない場合
         """
+        return await run_in_excel_executor(
+            RangeAdapter._set_range_value_sync,
+            book_identifier, sheet_identifier, address, value, pid, return_minimal,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _set_range_value_sync(
+        book_identifier: str, 
+        sheet_identifier: Union[str, int], 
+        address: str,
+        value: Any,
+        pid: Optional[int] = None,
+        return_minimal: bool = False
+    ) -> Dict[str, Any]:
+        """set_range_valueの同期実装。"""
         try:
             # 文字列化されたJSONの検出と変換
             value = RangeAdapter.decode_json_string(value)
             
-            logger.error(f"Setting value type: {type(value)}, value: {value}")
+            logger.error("Setting value type: %s, value: %s", type(value), value)
             
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            sheet = book.sheets[sheet_identifier]
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
             range_obj = sheet.range(address)
-            range_obj.value = value
+            with excel_fast(sheet.book.app):
+                range_obj.value = value
+            note_sheet_mutation(book_identifier, sheet_identifier, pid)
+
+            if return_minimal:
+                return RangeAdapter._minimal_result(book_identifier, sheet_identifier, address)
             return to_serializable(range_obj)
         except Exception as e:
             raise ValueError(f"Failed to set value of range '{address}' in sheet '{sheet_identifier}' of workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def get_range_formula(
+    async def set_ranges_bulk(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        writes: List[Dict[str, Any]],
+        pid: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        複数の範囲への書き込みを1回の呼び出しでまとめて実行します。
+
+        セル単位のset_valueをRPC越しに繰り返すと書き込みごとに
+        COM往復と再計算・再描画が発生するため、書き込みのリストを
+        受け取り、全体を再描画・再計算の抑止下で順に適用します。
+        各書き込みの値は2次元リストでもよく、その場合も1回の
+        マーシャリングで転送されます。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            sheet_identifier: シート名かインデックス
+            writes: {"address": アドレス, "value": 値} のリスト
+            pid: ExcelアプリケーションのプロセスID (オプション)
+
+        Returns:
+            {"count": 書き込み件数, "addresses": 書き込んだアドレスのリスト}
+
+        Raises:
+            ValueError: ワークブック、シート、範囲が見つからない場合
+        """
+        return await run_in_excel_executor(
+            RangeAdapter._set_ranges_bulk_sync,
+            book_identifier, sheet_identifier, writes, pid,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _set_ranges_bulk_sync(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        writes: List[Dict[str, Any]],
+        pid: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """set_ranges_bulkの同期実装。"""
+        try:
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
+
+            addresses = []
+            # 書き込み中の再描画・再計算・警告を止め、終了時に元へ戻す
+            with excel_fast(sheet.book.app):
+                for write in writes:
+                    address = write["address"]
+                    sheet.range(address).value = RangeAdapter.decode_json_string(
+                        write["value"]
+                    )
+                    addresses.append(address)
+            note_sheet_mutation(book_identifier, sheet_identifier, pid)
+
+            return {"count": len(addresses), "addresses": addresses}
+        except Exception as e:
+            raise ValueError(f"Failed to bulk-set ranges in sheet '{sheet_identifier}' of workbook '{book_identifier}': {str(e)}")
+
+    @staticmethod
+    async def get_range_formula(
         book_identifier: str, 
         sheet_identifier: Union[str, int], 
         address: str,
@@ -197,32 +419,34 @@ class RangeAdapter:
         Raises:
             ValueError: ワークブック、シート、範囲が見つからない場合
         """
+        return await run_in_excel_executor(
+            RangeAdapter._get_range_formula_sync,
+            book_identifier, sheet_identifier, address, pid,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _get_range_formula_sync(
+        book_identifier: str, 
+        sheet_identifier: Union[str, int], 
+        address: str,
+        pid: Optional[int] = None
+    ) -> Any:
+        """get_range_formulaの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            sheet = book.sheets[sheet_identifier]
-            range_obj = sheet.range(address)
+            range_obj = resolve_range(book_identifier, sheet_identifier, address, pid)
             return to_serializable(range_obj.formula)
         except Exception as e:
             raise ValueError(f"Failed to get formula of range '{address}' from sheet '{sheet_identifier}' in workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def set_range_formula(
+    async def set_range_formula(
         book_identifier: str, 
         sheet_identifier: Union[str, int], 
         address: str,
         formula: Any,
-        pid: Optional[int] = None
+        pid: Optional[int] = None,
+        return_minimal: bool = False
     ) -> Dict[str, Any]:
         """
         指定された範囲に数式を設定します。
@@ -233,6 +457,7 @@ class RangeAdapter:
             address: セル範囲のアドレス
             formula: 設定する数式
             pid: ExcelアプリケーションのプロセスID (オプション)
+            return_minimal: COMを再読取りせず識別子だけ返すかどうか (デフォルト: False)
 
         Returns:
             更新された範囲情報
@@ -240,35 +465,45 @@ class RangeAdapter:
         Raises:
             ValueError: ワークブック、シート、範囲が見つからない場合
         """
+        return await run_in_excel_executor(
+            RangeAdapter._set_range_formula_sync,
+            book_identifier, sheet_identifier, address, formula, pid, return_minimal,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _set_range_formula_sync(
+        book_identifier: str, 
+        sheet_identifier: Union[str, int], 
+        address: str,
+        formula: Any,
+        pid: Optional[int] = None,
+        return_minimal: bool = False
+    ) -> Dict[str, Any]:
+        """set_range_formulaの同期実装。"""
         try:
             # 文字列化されたJSONの検出と変換
             formula = RangeAdapter.decode_json_string(formula)
             
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            sheet = book.sheets[sheet_identifier]
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
             range_obj = sheet.range(address)
-            range_obj.formula = formula
+            with excel_fast(sheet.book.app):
+                range_obj.formula = formula
+            note_sheet_mutation(book_identifier, sheet_identifier, pid)
+
+            if return_minimal:
+                return RangeAdapter._minimal_result(book_identifier, sheet_identifier, address)
             return to_serializable(range_obj)
         except Exception as e:
             raise ValueError(f"Failed to set formula of range '{address}' in sheet '{sheet_identifier}' of workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def clear_range(
+    async def clear_range(
         book_identifier: str, 
         sheet_identifier: Union[str, int], 
         address: str,
-        pid: Optional[int] = None
+        pid: Optional[int] = None,
+        return_minimal: bool = False
     ) -> Dict[str, Any]:
         """
         指定された範囲をクリアします。
@@ -278,6 +513,7 @@ class RangeAdapter:
             sheet_identifier: シート名かインデックス
             address: セル範囲のアドレス
             pid: ExcelアプリケーションのプロセスID (オプション)
+            return_minimal: COMを再読取りせず識別子だけ返すかどうか (デフォルト: False)
 
         Returns:
             クリアされた範囲情報
@@ -285,33 +521,42 @@ class RangeAdapter:
         Raises:
             ValueError: ワークブック、シート、範囲が見つからない場合
         """
+        return await run_in_excel_executor(
+            RangeAdapter._clear_range_sync,
+            book_identifier, sheet_identifier, address, pid, return_minimal,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _clear_range_sync(
+        book_identifier: str, 
+        sheet_identifier: Union[str, int], 
+        address: str,
+        pid: Optional[int] = None,
+        return_minimal: bool = False
+    ) -> Dict[str, Any]:
+        """clear_rangeの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            sheet = book.sheets[sheet_identifier]
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
             range_obj = sheet.range(address)
-            range_obj.clear()
+            with excel_fast(sheet.book.app):
+                range_obj.clear()
+            note_sheet_mutation(book_identifier, sheet_identifier, pid)
+
+            if return_minimal:
+                return RangeAdapter._minimal_result(book_identifier, sheet_identifier, address)
             return to_serializable(range_obj)
         except Exception as e:
             raise ValueError(f"Failed to clear range '{address}' in sheet '{sheet_identifier}' of workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def get_range_as_dataframe(
-        book_identifier: str, 
-        sheet_identifier: Union[str, int], 
+    async def get_range_as_dataframe(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
         address: str,
         header: bool = True,
         index: bool = False,
+        compact_index: bool = False,
         pid: Optional[int] = None
     ) -> Dict[str, Any]:
         """
@@ -323,6 +568,7 @@ class RangeAdapter:
             address: セル範囲のアドレス
             header: 最初の行をヘッダーとして使用するかどうか
             index: 最初の列をインデックスとして使用するかどうか
+            compact_index: 既定のRangeIndexを記述子として返すかどうか
             pid: ExcelアプリケーションのプロセスID (オプション)
 
         Returns:
@@ -331,39 +577,70 @@ class RangeAdapter:
         Raises:
             ValueError: ワークブック、シート、範囲が見つからない場合
         """
+        return await run_in_excel_executor(
+            RangeAdapter._get_range_as_dataframe_sync,
+            book_identifier, sheet_identifier, address, header, index,
+            compact_index, pid,
+            pid=pid
+        )
+
+    @staticmethod
+    def _get_range_as_dataframe_sync(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        address: str,
+        header: bool = True,
+        index: bool = False,
+        compact_index: bool = False,
+        pid: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """get_range_as_dataframeの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            sheet = book.sheets[sheet_identifier]
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
             range_obj = sheet.range(address)
-            df = range_obj.options(pd.DataFrame, header=header, index=index).value
-            return to_serializable(df)
+
+            # xlwingsのDataFrameコンバーターはセルごとに型変換を行うため、
+            # 値を1回のマーシャリングで2次元リストとして取得し、
+            # DataFrameの組み立てはプロセス内で行う
+            raw = range_obj.value
+            if not isinstance(raw, list):
+                raw = [[raw]]
+            elif raw and not isinstance(raw[0], list):
+                raw = [raw]
+
+            cols = raw[0] if header else None
+            data = [list(row) for row in (raw[1:] if header else raw)]
+            idx = None
+            if index and data and data[0]:
+                idx = [row.pop(0) for row in data]
+                if cols:
+                    # ヘッダー行の先頭セルはインデックス名のため列から外す
+                    cols = cols[1:]
+
+            df = pd.DataFrame(data, columns=cols, index=idx).infer_objects()
+            return dataframe_payload(df, compact_index=compact_index)
         except Exception as e:
             raise ValueError(f"Failed to get range '{address}' as DataFrame from sheet '{sheet_identifier}' in workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def set_dataframe(
+    async def set_dataframe(
         book_identifier: str, 
         sheet_identifier: Union[str, int], 
         address: str,
         dataframe: Dict[str, Any],
         header: bool = True,
         index: bool = False,
-        pid: Optional[int] = None
+        pid: Optional[int] = None,
+        return_minimal: bool = False,
+        force_com: bool = False
     ) -> Dict[str, Any]:
         """
         指定された範囲にDataFrameを設定します。
 
+        対象のワークブックがどのExcelインスタンスでも開かれていない
+        オンディスクのファイルの場合、Excelを介さずopenpyxlで直接
+        書き込みます (force_com=Trueで無効化できます)。
+
         Args:
             book_identifier: ワークブック名かフルパス
             sheet_identifier: シート名かインデックス
@@ -372,40 +649,476 @@ class RangeAdapter:
             header: ヘッダーを含めるかどうか
             index: インデックスを含めるかどうか
             pid: ExcelアプリケーションのプロセスID (オプション)
+            return_minimal: COMを再読取りせず識別子だけ返すかどうか (デフォルト: False)
+            force_com: 直接書き込みを使わず常にCOM経由で書くかどうか (デフォルト: False)
 
         Returns:
             更新された範囲情報
+            (直接書き込みの場合は識別子だけの軽量な応答)
 
         Raises:
             ValueError: ワークブック、シート、範囲が見つからない場合
         """
+        return await run_in_excel_executor(
+            RangeAdapter._set_dataframe_sync,
+            book_identifier, sheet_identifier, address, dataframe, header, index, pid, return_minimal, force_com,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _set_dataframe_sync(
+        book_identifier: str, 
+        sheet_identifier: Union[str, int], 
+        address: str,
+        dataframe: Dict[str, Any],
+        header: bool = True,
+        index: bool = False,
+        pid: Optional[int] = None,
+        return_minimal: bool = False,
+        force_com: bool = False
+    ) -> Dict[str, Any]:
+        """set_dataframeの同期実装。"""
         try:
             # 文字列化されたJSONの検出と変換
             dataframe = RangeAdapter.decode_json_string(dataframe)
-            
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            sheet = book.sheets[sheet_identifier]
+
+            # pandasのコンバーターはセルごとに型変換をやり直すため、
+            # DataFrameを復元せず、ヘッダーとインデックスを連結した
+            # 2次元リストを1回のマーシャリングで書き込む
+            data = dataframe["data"]
+            idx = dataframe["index"]
+            cols = dataframe["columns"]
+
+            values = []
+            if header:
+                values.append(([""] + list(cols)) if index else list(cols))
+            for i, row in enumerate(data):
+                values.append(([idx[i]] + list(row)) if index else list(row))
+            values = RangeAdapter._ensure_com_safe(values)
+
+            # 閉じているオンディスクのワークブックへの大きな書き込みは
+            # Excelを介さずファイルへ直接行う方が桁違いに速い
+            if (
+                not force_com
+                and pid is None
+                and RangeAdapter._closed_workbook_path(book_identifier)
+                and RangeAdapter._set_dataframe_direct(
+                    book_identifier, sheet_identifier, address, values
+                )
+            ):
+                return RangeAdapter._minimal_result(
+                    book_identifier, sheet_identifier, address
+                )
+
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
             range_obj = sheet.range(address)
-            
-            # シリアライズされたDataFrameを復元
-            df = pd.DataFrame(
-                data=dataframe["data"],
-                index=dataframe["index"],
-                columns=dataframe["columns"]
-            )
-            
-            range_obj.options(pd.DataFrame, header=header, index=index).value = df
+
+            with excel_fast(sheet.book.app):
+                range_obj.value = values
+            note_sheet_mutation(book_identifier, sheet_identifier, pid)
+
+            if return_minimal:
+                return RangeAdapter._minimal_result(book_identifier, sheet_identifier, address)
             return to_serializable(range_obj)
         except Exception as e:
             raise ValueError(f"Failed to set DataFrame to range '{address}' in sheet '{sheet_identifier}' of workbook '{book_identifier}': {str(e)}")
+
+    @staticmethod
+    def _closed_workbook_path(book_identifier: Any) -> bool:
+        """
+        識別子が「どのExcelでも開かれていないオンディスクのファイル」を
+        指しているかを判定します。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+
+        Returns:
+            直接書き込みの対象にできる場合はTrue
+        """
+        if not isinstance(book_identifier, str) or not os.path.isfile(book_identifier):
+            return False
+        name = os.path.basename(book_identifier)
+        try:
+            for app in xw.apps:
+                for book in app.books:
+                    if book.name == name:
+                        return False
+        except Exception:
+            # Excelが起動していなければ開かれているブックもない
+            pass
+        return True
+
+    @staticmethod
+    def _set_dataframe_direct(
+        path: str,
+        sheet_identifier: Union[str, int],
+        address: str,
+        values: List[List[Any]]
+    ) -> bool:
+        """
+        閉じているワークブックにopenpyxlで直接書き込みます。
+
+        COMとExcelの再計算エンジンを完全にバイパスするため、
+        大きなDataFrameの書き込みで大幅に速くなります。
+
+        Args:
+            path: ワークブックのファイルパス
+            sheet_identifier: シート名かインデックス
+            address: 書き込み開始位置を含むセル範囲のアドレス
+            values: 書き込む2次元リスト
+
+        Returns:
+            書き込んだ場合はTrue、openpyxlが使えない場合はFalse
+            (呼び出し側はCOM経由にフォールバックする)
+        """
+        try:
+            import openpyxl
+            from openpyxl.utils.cell import coordinate_to_tuple
+        except ImportError:
+            logger.debug("openpyxl not available, falling back to COM write")
+            return False
+
+        workbook = openpyxl.load_workbook(
+            path, keep_vba=path.lower().endswith(".xlsm")
+        )
+        try:
+            if isinstance(sheet_identifier, int):
+                worksheet = workbook.worksheets[sheet_identifier]
+            else:
+                worksheet = workbook[sheet_identifier]
+
+            first_cell = address.split(":")[0].replace("$", "")
+            first_row, first_col = coordinate_to_tuple(first_cell)
+            for i, row in enumerate(values):
+                for j, value in enumerate(row):
+                    worksheet.cell(
+                        row=first_row + i, column=first_col + j, value=value
+                    )
+            workbook.save(path)
+        finally:
+            workbook.close()
+        return True
+
+    @staticmethod
+    async def set_ranges_multi(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        addresses: List[str],
+        value: Any,
+        kind: str = "value",
+        pid: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        飛び飛びの複数アドレスに同じ値または数式を設定します。
+
+        Windowsでは複数エリアのRangeオブジェクト
+        ("A1, C3, E5"のようなUnionアドレス) を使い、N個のセルへの
+        書き込みを少数のCOM呼び出しにまとめます。アドレス文字列が
+        Excelの上限 (255文字) を超える場合は分割します。macOSでは
+        アドレスごとの書き込みにフォールバックします。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            sheet_identifier: シート名かインデックス
+            addresses: セル範囲のアドレスのリスト
+            value: 全アドレスに設定する値または数式
+            kind: "value"か"formula" (デフォルト: "value")
+            pid: ExcelアプリケーションのプロセスID (オプション)
+
+        Returns:
+            {"count": アドレス数, "addresses": アドレスのリスト}
+
+        Raises:
+            ValueError: ワークブック、シート、範囲が見つからない場合、
+                kindが不正な場合
+        """
+        return await run_in_excel_executor(
+            RangeAdapter._set_ranges_multi_sync,
+            book_identifier, sheet_identifier, addresses, value, kind, pid,
+            pid=pid
+        )
+
+    @staticmethod
+    def _set_ranges_multi_sync(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        addresses: List[str],
+        value: Any,
+        kind: str = "value",
+        pid: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """set_ranges_multiの同期実装。"""
+        try:
+            if kind not in ("value", "formula"):
+                raise ValueError(f"Unsupported kind '{kind}' (expected 'value' or 'formula')")
+
+            value = RangeAdapter.decode_json_string(value)
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
+
+            with excel_fast(sheet.book.app):
+                if not _IS_DARWIN:
+                    # Unionアドレスで複数エリアをまとめて1回のCOM呼び出しで書く
+                    for union_address in RangeAdapter._union_address_chunks(addresses):
+                        area = sheet.api.Range(union_address)
+                        if kind == "value":
+                            area.Value = value
+                        else:
+                            area.Formula = value
+                else:
+                    # AppleScript側にUnionアドレスはないためアドレスごとに書く
+                    for address in addresses:
+                        range_obj = sheet.range(address)
+                        if kind == "value":
+                            range_obj.value = value
+                        else:
+                            range_obj.formula = value
+            note_sheet_mutation(book_identifier, sheet_identifier, pid)
+
+            return {"count": len(addresses), "addresses": addresses}
+        except Exception as e:
+            raise ValueError(f"Failed to multi-set ranges in sheet '{sheet_identifier}' of workbook '{book_identifier}': {str(e)}")
+
+    @staticmethod
+    def _union_address_chunks(addresses: List[str]) -> Iterator[str]:
+        """
+        アドレスのリストをUnionアドレス文字列に連結します。
+
+        Excelが1つのRange参照に受け付けるのは255文字までのため、
+        上限に収まる単位で区切って返します。
+
+        Args:
+            addresses: セル範囲のアドレスのリスト
+
+        Yields:
+            "A1, C3, E5" 形式のUnionアドレス文字列
+        """
+        chunk: List[str] = []
+        length = 0
+        for address in addresses:
+            extra = len(address) + (2 if chunk else 0)
+            if chunk and length + extra > _UNION_ADDRESS_LIMIT:
+                yield ", ".join(chunk)
+                chunk = []
+                length = 0
+                extra = len(address)
+            chunk.append(address)
+            length += extra
+        if chunk:
+            yield ", ".join(chunk)
+
+    @staticmethod
+    async def batch_get_values(
+        book_identifier: str,
+        items: List[Dict[str, Any]],
+        pid: Optional[int] = None
+    ) -> List[Any]:
+        """
+        同じワークブック内の複数範囲の値を1回の呼び出しで読み取ります。
+
+        range.get_manyが読み取りごとにタスクを立てるのに対し、こちらは
+        全読み取りを1回のエグゼキューター呼び出しの中でループし、
+        呼び出しあたりのオーバーヘッドを1回分に抑えます。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            items: {"sheet": シート名かインデックス, "address": アドレス} のリスト
+            pid: ExcelアプリケーションのプロセスID (オプション)
+
+        Returns:
+            各読み取りの値のリスト (itemsと同じ順序)
+
+        Raises:
+            ValueError: ワークブック、シート、範囲が見つからない場合
+        """
+        return await run_in_excel_executor(
+            RangeAdapter._batch_get_values_sync, book_identifier, items, pid,
+            pid=pid
+        )
+
+    @staticmethod
+    def _batch_get_values_sync(
+        book_identifier: str,
+        items: List[Dict[str, Any]],
+        pid: Optional[int] = None
+    ) -> List[Any]:
+        """batch_get_valuesの同期実装。"""
+        try:
+            results = []
+            for item in items:
+                sheet = resolve_sheet(book_identifier, item["sheet"], pid)
+                value = sheet.range(item["address"]).value
+                results.append(RangeAdapter._serialize_read(value))
+            return results
+        except Exception as e:
+            raise ValueError(f"Failed to batch-get ranges in workbook '{book_identifier}': {str(e)}")
+
+    @staticmethod
+    async def batch_set_values(
+        book_identifier: str,
+        writes: List[Dict[str, Any]],
+        pid: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        同じワークブック内の複数範囲への書き込みを1回の呼び出しで実行します。
+
+        set_ranges_bulkの複数シート版です。全書き込みを1つの
+        再描画・再計算の抑止ウィンドウの中で順に適用します。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            writes: {"sheet": シート名かインデックス, "address": アドレス,
+                "value": 値} のリスト
+            pid: ExcelアプリケーションのプロセスID (オプション)
+
+        Returns:
+            {"count": 書き込み件数, "addresses": 書き込んだアドレスのリスト}
+
+        Raises:
+            ValueError: ワークブック、シート、範囲が見つからない場合
+        """
+        return await run_in_excel_executor(
+            RangeAdapter._batch_set_values_sync, book_identifier, writes, pid,
+            pid=pid
+        )
+
+    @staticmethod
+    def _batch_set_values_sync(
+        book_identifier: str,
+        writes: List[Dict[str, Any]],
+        pid: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """batch_set_valuesの同期実装。"""
+        try:
+            if not writes:
+                return {"count": 0, "addresses": []}
+
+            addresses = []
+            touched: Dict[str, Union[str, int]] = {}
+            first_sheet = resolve_sheet(book_identifier, writes[0]["sheet"], pid)
+            with excel_fast(first_sheet.book.app):
+                for write in writes:
+                    sheet = resolve_sheet(book_identifier, write["sheet"], pid)
+                    sheet.range(write["address"]).value = (
+                        RangeAdapter.decode_json_string(write["value"])
+                    )
+                    addresses.append(write["address"])
+                    touched[str(write["sheet"])] = write["sheet"]
+            for sheet_identifier in touched.values():
+                note_sheet_mutation(book_identifier, sheet_identifier, pid)
+
+            return {"count": len(addresses), "addresses": addresses}
+        except Exception as e:
+            raise ValueError(f"Failed to batch-set ranges in workbook '{book_identifier}': {str(e)}")
+
+    @staticmethod
+    async def get_range_shape(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        address: str,
+        pid: Optional[int] = None
+    ) -> Tuple[int, int, int, int]:
+        """
+        指定された範囲の位置と大きさを取得します。
+
+        ストリーミング読み取りが行チャンクのアドレスを組み立てるために
+        使います。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            sheet_identifier: シート名かインデックス
+            address: セル範囲のアドレス
+            pid: ExcelアプリケーションのプロセスID (オプション)
+
+        Returns:
+            (先頭行, 先頭列, 行数, 列数) のタプル
+
+        Raises:
+            ValueError: ワークブック、シート、範囲が見つからない場合
+        """
+        return await run_in_excel_executor(
+            RangeAdapter._get_range_shape_sync,
+            book_identifier, sheet_identifier, address, pid,
+            pid=pid
+        )
+
+    @staticmethod
+    def _get_range_shape_sync(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        address: str,
+        pid: Optional[int] = None
+    ) -> Tuple[int, int, int, int]:
+        """get_range_shapeの同期実装。"""
+        try:
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
+            range_obj = sheet.range(address)
+            n_rows, n_cols = range_obj.shape
+            return (range_obj.row, range_obj.column, n_rows, n_cols)
+        except Exception as e:
+            raise ValueError(f"Failed to get shape of range '{address}' from sheet '{sheet_identifier}' in workbook '{book_identifier}': {str(e)}")
+
+    @staticmethod
+    async def iter_range_rows(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        address: str,
+        pid: Optional[int] = None
+    ):
+        """
+        指定された範囲の値を行単位で順に返す非同期ジェネレーターです。
+
+        範囲全体を一度にメモリへ展開する代わりに、_CHUNK_CELLSセル
+        以下の行ブロックごとに読み取って1行ずつ返します。巨大な範囲
+        でもピークメモリがチャンク1つ分に抑えられ、呼び出し側は
+        最初のチャンクが届いた時点で処理を始められます。
+
+        Args:
+            book_identifier: ワークブック名かフルパス
+            sheet_identifier: シート名かインデックス
+            address: セル範囲のアドレス
+            pid: ExcelアプリケーションのプロセスID (オプション)
+
+        Yields:
+            各行の値のリスト
+
+        Raises:
+            ValueError: ワークブック、シート、範囲が見つからない場合
+        """
+        first_row, first_col, n_rows, n_cols = await RangeAdapter.get_range_shape(
+            book_identifier, sheet_identifier, address, pid
+        )
+        last_col = first_col + n_cols - 1
+        step = max(1, _CHUNK_CELLS // n_cols)
+
+        for r0 in range(first_row, first_row + n_rows, step):
+            r1 = min(r0 + step - 1, first_row + n_rows - 1)
+            rows = await run_in_excel_executor(
+                RangeAdapter._read_rows_block_sync,
+                book_identifier, sheet_identifier,
+                (r0, first_col), (r1, last_col), pid,
+                pid=pid
+            )
+            for row in rows:
+                yield row
+
+    @staticmethod
+    def _read_rows_block_sync(
+        book_identifier: str,
+        sheet_identifier: Union[str, int],
+        top_left: Tuple[int, int],
+        bottom_right: Tuple[int, int],
+        pid: Optional[int] = None
+    ) -> List[List[Any]]:
+        """iter_range_rowsの行ブロック読み取りの同期実装。"""
+        try:
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
+            chunk = sheet.range(top_left, bottom_right).value
+            n_cols = bottom_right[1] - top_left[1] + 1
+            # 1行・1列のブロックは1次元で返るため2次元に正規化する
+            if not isinstance(chunk, list):
+                chunk = [[chunk]]
+            elif chunk and not isinstance(chunk[0], list):
+                chunk = [[v] for v in chunk] if n_cols == 1 else [chunk]
+            return RangeAdapter._serialize_read(chunk)
+        except Exception as e:
+            raise ValueError(f"Failed to read rows from sheet '{sheet_identifier}' in workbook '{book_identifier}': {str(e)}")
@@ -7,6 +7,13 @@ from typing import Dict, List, Optional, Any, Union
 import logging
 import xlwings as xw
 from xlwings_rpc.utils.converters import to_serializable
+from xlwings_rpc.adapters.book_adapter import _resolve_book
+from xlwings_rpc.adapters._resolve import (
+    resolve_sheet, invalidate_sheets, note_sheet_mutation,
+    rename_cached_sheet, get_cached_used_range, store_used_range
+)
+from xlwings_rpc.adapters._fast import excel_fast
+from xlwings_rpc.utils.executors import run_in_excel_executor
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
@@ -18,39 +25,61 @@ class SheetAdapter:
     """
     
     @staticmethod
-    def get_sheets(book_identifier: str, pid: Optional[int] = None) -> List[Dict[str, Any]]:
+    async def get_sheets(
+        book_identifier: str,
+        pid: Optional[int] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         ワークブック内のすべてのシートを取得します。
 
         Args:
             book_identifier: ワークブック名かフルパス
             pid: ExcelアプリケーションのプロセスID (オプション)
+            fields: 返す属性の指定 ("name", "index", "visible"のみ)。
+                指定するとシートごとにその属性だけを読み、完全な
+                シリアライズによるCOM読み取りを省きます (オプション)
 
         Returns:
             シート情報のリスト
-        
+
         Raises:
             ValueError: ワークブックが見つからない場合
         """
+        return await run_in_excel_executor(
+            SheetAdapter._get_sheets_sync, book_identifier, pid, fields, pid=pid
+        )
+
+    @staticmethod
+    def _get_sheets_sync(
+        book_identifier: str,
+        pid: Optional[int] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """get_sheetsの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
+            book = _resolve_book(book_identifier, pid)
+
+            # 件数を1回のCOM呼び出しで取り、結果リストを事前確保して
+            # 伸長時の再確保を避ける
+            sheets = book.sheets
+            result: List[Dict[str, Any]] = [None] * sheets.count
+
+            if fields is not None:
+                unknown = set(fields) - {"name", "index", "visible"}
+                if unknown:
+                    raise ValueError(f"Unsupported sheet fields: {sorted(unknown)}")
+                for i, sheet in enumerate(sheets):
+                    result[i] = {field: getattr(sheet, field) for field in fields}
             else:
-                book = xw.Book(book_identifier)
-            
-            return [to_serializable(sheet) for sheet in book.sheets]
+                for i, sheet in enumerate(sheets):
+                    result[i] = to_serializable(sheet)
+            return result
         except Exception as e:
             raise ValueError(f"Failed to get sheets for workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def get_sheet(
+    async def get_sheet(
         book_identifier: str, 
         sheet_identifier: Union[str, int], 
         pid: Optional[int] = None
@@ -69,31 +98,33 @@ class SheetAdapter:
         Raises:
             ValueError: ワークブックやシートが見つからない場合
         """
+        return await run_in_excel_executor(
+            SheetAdapter._get_sheet_sync,
+            book_identifier, sheet_identifier, pid,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _get_sheet_sync(
+        book_identifier: str, 
+        sheet_identifier: Union[str, int], 
+        pid: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """get_sheetの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            sheet = book.sheets[sheet_identifier]
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
             return to_serializable(sheet)
         except Exception as e:
             raise ValueError(f"Failed to get sheet '{sheet_identifier}' from workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def add_sheet(
+    async def add_sheet(
         book_identifier: str, 
         name: Optional[str] = None, 
         before: Optional[Union[str, int]] = None, 
         after: Optional[Union[str, int]] = None,
-        pid: Optional[int] = None
+        pid: Optional[int] = None,
+        return_minimal: bool = False
     ) -> Dict[str, Any]:
         """
         新しいシートを追加します。
@@ -104,6 +135,7 @@ class SheetAdapter:
             before: この前に追加 (オプション)
             after: この後に追加 (オプション)
             pid: ExcelアプリケーションのプロセスID (オプション)
+            return_minimal: COMを再読取りせず識別子だけ返すかどうか (デフォルト: False)
 
         Returns:
             新しいシート情報
@@ -111,32 +143,44 @@ class SheetAdapter:
         Raises:
             ValueError: ワークブックが見つからないか、シート追加に失敗した場合
         """
+        return await run_in_excel_executor(
+            SheetAdapter._add_sheet_sync,
+            book_identifier, name, before, after, pid, return_minimal,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _add_sheet_sync(
+        book_identifier: str, 
+        name: Optional[str] = None, 
+        before: Optional[Union[str, int]] = None, 
+        after: Optional[Union[str, int]] = None,
+        pid: Optional[int] = None,
+        return_minimal: bool = False
+    ) -> Dict[str, Any]:
+        """add_sheetの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            if before is not None:
-                sheet = book.sheets.add(name=name, before=book.sheets[before])
-            elif after is not None:
-                sheet = book.sheets.add(name=name, after=book.sheets[after])
-            else:
-                sheet = book.sheets.add(name=name)
+            book = _resolve_book(book_identifier, pid)
             
+            with excel_fast(book.app):
+                if before is not None:
+                    sheet = book.sheets.add(name=name, before=book.sheets[before])
+                elif after is not None:
+                    sheet = book.sheets.add(name=name, after=book.sheets[after])
+                else:
+                    sheet = book.sheets.add(name=name)
+
+            # 追加で他のシートのインデックスがずれるためキャッシュを破棄する
+            invalidate_sheets(book_identifier, pid)
+
+            if return_minimal:
+                return {"book": book_identifier, "sheet": sheet.name}
             return to_serializable(sheet)
         except Exception as e:
             raise ValueError(f"Failed to add sheet to workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def delete_sheet(
+    async def delete_sheet(
         book_identifier: str, 
         sheet_identifier: Union[str, int], 
         pid: Optional[int] = None
@@ -155,31 +199,36 @@ class SheetAdapter:
         Raises:
             ValueError: ワークブックやシートが見つからない場合
         """
+        return await run_in_excel_executor(
+            SheetAdapter._delete_sheet_sync,
+            book_identifier, sheet_identifier, pid,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _delete_sheet_sync(
+        book_identifier: str, 
+        sheet_identifier: Union[str, int], 
+        pid: Optional[int] = None
+    ) -> bool:
+        """delete_sheetの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            sheet = book.sheets[sheet_identifier]
-            sheet.delete()
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
+            # display_alertsの抑止で削除時の確認ダイアログも止まる
+            with excel_fast(sheet.book.app):
+                sheet.delete()
+            invalidate_sheets(book_identifier, pid)
             return True
         except Exception as e:
             raise ValueError(f"Failed to delete sheet '{sheet_identifier}' from workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def rename_sheet(
+    async def rename_sheet(
         book_identifier: str, 
         sheet_identifier: Union[str, int], 
         new_name: str,
-        pid: Optional[int] = None
+        pid: Optional[int] = None,
+        return_minimal: bool = False
     ) -> Dict[str, Any]:
         """
         シート名を変更します。
@@ -189,6 +238,7 @@ class SheetAdapter:
             sheet_identifier: シート名かインデックス
             new_name: 新しいシート名
             pid: ExcelアプリケーションのプロセスID (オプション)
+            return_minimal: COMを再読取りせず識別子だけ返すかどうか (デフォルト: False)
 
         Returns:
             更新されたシート情報
@@ -196,30 +246,42 @@ class SheetAdapter:
         Raises:
             ValueError: ワークブックやシートが見つからない場合
         """
+        return await run_in_excel_executor(
+            SheetAdapter._rename_sheet_sync,
+            book_identifier, sheet_identifier, new_name, pid, return_minimal,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _rename_sheet_sync(
+        book_identifier: str, 
+        sheet_identifier: Union[str, int], 
+        new_name: str,
+        pid: Optional[int] = None,
+        return_minimal: bool = False
+    ) -> Dict[str, Any]:
+        """rename_sheetの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            sheet = book.sheets[sheet_identifier]
-            sheet.name = new_name
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
+            old_name = sheet.name
+            with excel_fast(sheet.book.app):
+                sheet.name = new_name
+            # 名前変更はインデックスを変えないため、旧名のエントリだけ
+            # 新名のキーへ付け替える (ブック単位の破棄は不要)
+            rename_cached_sheet(book_identifier, old_name, new_name, pid)
+
+            if return_minimal:
+                return {"book": book_identifier, "sheet": new_name}
             return to_serializable(sheet)
         except Exception as e:
             raise ValueError(f"Failed to rename sheet '{sheet_identifier}' in workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def clear_sheet(
+    async def clear_sheet(
         book_identifier: str, 
         sheet_identifier: Union[str, int], 
-        pid: Optional[int] = None
+        pid: Optional[int] = None,
+        return_minimal: bool = False
     ) -> Dict[str, Any]:
         """
         シートの内容をクリアします。
@@ -228,6 +290,7 @@ class SheetAdapter:
             book_identifier: ワークブック名かフルパス
             sheet_identifier: シート名かインデックス
             pid: ExcelアプリケーションのプロセスID (オプション)
+            return_minimal: COMを再読取りせず識別子だけ返すかどうか (デフォルト: False)
 
         Returns:
             更新されたシート情報
@@ -235,27 +298,34 @@ class SheetAdapter:
         Raises:
             ValueError: ワークブックやシートが見つからない場合
         """
+        return await run_in_excel_executor(
+            SheetAdapter._clear_sheet_sync,
+            book_identifier, sheet_identifier, pid, return_minimal,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _clear_sheet_sync(
+        book_identifier: str, 
+        sheet_identifier: Union[str, int], 
+        pid: Optional[int] = None,
+        return_minimal: bool = False
+    ) -> Dict[str, Any]:
+        """clear_sheetの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            sheet = book.sheets[sheet_identifier]
-            sheet.clear()
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
+            with excel_fast(sheet.book.app):
+                sheet.clear()
+            note_sheet_mutation(book_identifier, sheet_identifier, pid)
+
+            if return_minimal:
+                return {"book": book_identifier, "sheet": sheet_identifier}
             return to_serializable(sheet)
         except Exception as e:
             raise ValueError(f"Failed to clear sheet '{sheet_identifier}' in workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def get_used_range(
+    async def get_used_range(
         book_identifier: str, 
         sheet_identifier: Union[str, int], 
         pid: Optional[int] = None
@@ -274,27 +344,35 @@ class SheetAdapter:
         Raises:
             ValueError: ワークブックやシートが見つからない場合
         """
+        return await run_in_excel_executor(
+            SheetAdapter._get_used_range_sync,
+            book_identifier, sheet_identifier, pid,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _get_used_range_sync(
+        book_identifier: str, 
+        sheet_identifier: Union[str, int], 
+        pid: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """get_used_rangeの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            sheet = book.sheets[sheet_identifier]
+            # 前回の読み取り以降に書き込みがなければキャッシュを返す
+            cached = get_cached_used_range(book_identifier, sheet_identifier, pid)
+            if cached is not None:
+                return cached
+
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
             used_range = sheet.used_range
-            return to_serializable(used_range)
+            result = to_serializable(used_range)
+            store_used_range(book_identifier, sheet_identifier, pid, result)
+            return result
         except Exception as e:
             raise ValueError(f"Failed to get used range for sheet '{sheet_identifier}' in workbook '{book_identifier}': {str(e)}")
     
     @staticmethod
-    def activate_sheet(
+    async def activate_sheet(
         book_identifier: str, 
         sheet_identifier: Union[str, int], 
         pid: Optional[int] = None
@@ -313,20 +391,21 @@ class SheetAdapter:
         Raises:
             ValueError: ワークブックやシートが見つからない場合
         """
+        return await run_in_excel_executor(
+            SheetAdapter._activate_sheet_sync,
+            book_identifier, sheet_identifier, pid,
+            pid=pid
+        )
+    
+    @staticmethod
+    def _activate_sheet_sync(
+        book_identifier: str, 
+        sheet_identifier: Union[str, int], 
+        pid: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """activate_sheetの同期実装。"""
         try:
-            if pid is not None:
-                # 最新のxlwingsのAPIでは、appsコレクションから直接アクセスする
-                try:
-                    app = xw.apps[pid]
-                except KeyError:
-                    # PIDが見つからない場合
-                    raise ValueError(f"No Excel application found with PID {pid}")
-                
-                book = app.books[book_identifier]
-            else:
-                book = xw.Book(book_identifier)
-            
-            sheet = book.sheets[sheet_identifier]
+            sheet = resolve_sheet(book_identifier, sheet_identifier, pid)
             sheet.activate()
             return to_serializable(sheet)
         except Exception as e:
@@ -0,0 +1,104 @@
+"""
+読み取り系RPCメソッドの短命レスポンスキャッシュ
+
+UIクライアントはbook.listやsheet.listのような読み取りを数百ミリ秒
+おきに再発行することが多く、そのたびにCOMのコレクション走査が
+発生します。ここでは正規化したパラメータをキーに結果を短時間
+(デフォルト250ミリ秒) だけ保持し、バースト的な重複読み取りを
+1回のCOM走査にまとめます。変更系メソッドはinvalidate_readsで
+キャッシュ全体を破棄します。
+"""
+from __future__ import annotations
+
+from typing import Any
+from collections import OrderedDict
+import functools
+import time
+import orjson
+
+from xlwings_rpc.utils.converters import clear_request_memo
+
+# キャッシュの生存時間 (秒)。UIの再ポーリング間隔より短く、
+# 変更が反映されるまでの遅延として許容できる長さにする
+_TTL_SECONDS = 0.25
+
+# エントリ数の上限 (超えた分は古いものから捨てる)
+_MAX_ENTRIES = 512
+
+# (メソッド名, 正規化済みパラメータ) → (失効時刻, 結果)
+_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
+def cached_read(fn):
+    """
+    読み取り系RPCメソッドの結果を短時間キャッシュするデコレーター。
+
+    キーはメソッドの修飾名とキー順を正規化したパラメータのJSONです。
+    TTL内の同一呼び出しはCOMに触れずキャッシュから返します。
+
+    Args:
+        fn: ラップする非同期RPCメソッド
+
+    Returns:
+        キャッシュ付きのラッパー
+    """
+    @functools.wraps(fn)
+    async def wrapper(params: dict[str, Any] | None = None):
+        key = (
+            fn.__qualname__,
+            orjson.dumps(params, option=orjson.OPT_SORT_KEYS) if params else b""
+        )
+        now = time.monotonic()
+        entry = _cache.get(key)
+        if entry is not None and now < entry[0]:
+            _cache.move_to_end(key)
+            return entry[1]
+
+        result = await fn(params) if params is not None else await fn()
+
+        _cache[key] = (now + _TTL_SECONDS, result)
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
+        return result
+    return wrapper
+
+
+def invalidates_reads(fn):
+    """
+    変更系RPCメソッドの前後で読み取りキャッシュを破棄するデコレーター。
+
+    実行前の破棄だけでは、書き込みが進行中の間に並行の読み取りが
+    キャッシュを書き込み前の内容で埋め直し、変更の応答を受け取った
+    クライアントがその後の読み取りで古い状態を受け取り得ます。
+    完了後にもう一度破棄することで、変更後の読み取りが必ずCOMまで
+    届くようにします。
+
+    Args:
+        fn: ラップする非同期RPCメソッド
+
+    Returns:
+        キャッシュ破棄付きのラッパー
+    """
+    @functools.wraps(fn)
+    async def wrapper(params: dict[str, Any] | None = None):
+        invalidate_reads()
+        try:
+            return await (fn(params) if params is not None else fn())
+        finally:
+            invalidate_reads()
+    return wrapper
+
+
+def invalidate_reads() -> None:
+    """
+    読み取りキャッシュ全体を破棄します。
+
+    変更系メソッドの先頭で呼び出します。TTLが短いため、対象を
+    絞った破棄よりも全破棄の方が単純で、取りこぼしもありません。
+    リクエスト単位のシリアライズメモも同時に破棄し、同じバッチ内の
+    後続の読み取りが書き込み前のスナップショットを返さないように
+    します。
+    """
+    _cache.clear()
+    clear_request_memo()
@@ -3,7 +3,9 @@
 
 Excel Applicationに関連するJSON-RPCメソッドを実装します。
 """
-from typing import Dict, List, Optional, Any, Union
+from __future__ import annotations
+
+from typing import Any
 from xlwings_rpc.adapters.app_adapter import AppAdapter
 
 
@@ -13,17 +15,17 @@ class AppMethods:
     """
     
     @staticmethod
-    async def list() -> List[Dict[str, Any]]:
+    async def list() -> list[dict[str, Any]]:
         """
         app.list: すべての実行中のExcelアプリケーションを取得します。
 
         Returns:
             アプリケーション情報のリスト
         """
-        return AppAdapter.get_apps()
+        return await AppAdapter.get_apps()
     
     @staticmethod
-    async def get(params: Dict[str, Any]) -> Dict[str, Any]:
+    async def get(params: dict[str, Any]) -> dict[str, Any]:
         """
         app.get: 指定されたPIDまたはアクティブなExcelアプリケーションを取得します。
 
@@ -35,10 +37,10 @@ class AppMethods:
             アプリケーション情報
         """
         pid = params.get("pid")
-        return AppAdapter.get_app(pid)
+        return await AppAdapter.get_app(pid)
     
     @staticmethod
-    async def create(params: Dict[str, Any]) -> Dict[str, Any]:
+    async def create(params: dict[str, Any]) -> dict[str, Any]:
         """
         app.create: 新しいExcelアプリケーションを作成します。
 
@@ -46,16 +48,20 @@ class AppMethods:
             params: パラメータオブジェクト
                 - visible (Optional[bool]): アプリケーションを表示するかどうか
                 - add_book (Optional[bool]): 新しいブックを追加するかどうか
+                - return_state (Optional[bool]): 完全なアプリケーション情報を返すかどうか
 
         Returns:
             新しいアプリケーション情報
         """
         visible = params.get("visible", True)
         add_book = params.get("add_book", True)
-        return AppAdapter.create_app(visible=visible, add_book=add_book)
+        return_state = params.get("return_state", True)
+        return await AppAdapter.create_app(
+            visible=visible, add_book=add_book, return_state=return_state
+        )
     
     @staticmethod
-    async def quit(params: Dict[str, Any]) -> bool:
+    async def quit(params: dict[str, Any]) -> bool:
         """
         app.quit: Excelアプリケーションを終了します。
 
@@ -69,10 +75,10 @@ class AppMethods:
         """
         pid = params["pid"]
         save_changes = params.get("save_changes", True)
-        return AppAdapter.quit_app(pid=pid, save_changes=save_changes)
+        return await AppAdapter.quit_app(pid=pid, save_changes=save_changes)
     
     @staticmethod
-    async def set_calculation(params: Dict[str, Any]) -> Dict[str, Any]:
+    async def set_calculation(params: dict[str, Any]) -> dict[str, Any]:
         """
         app.set_calculation: 計算モードを設定します。
 
@@ -80,16 +86,20 @@ class AppMethods:
             params: パラメータオブジェクト
                 - pid (int): ExcelアプリケーションのプロセスID
                 - mode (str): 計算モード ('automatic', 'manual', 'semiautomatic')
+                - return_state (Optional[bool]): 完全なアプリケーション情報を返すかどうか
 
         Returns:
             更新されたアプリケーション情報
         """
         pid = params["pid"]
         mode = params["mode"]
-        return AppAdapter.set_calculation(pid=pid, calculation_mode=mode)
+        return_state = params.get("return_state", True)
+        return await AppAdapter.set_calculation(
+            pid=pid, calculation_mode=mode, return_state=return_state
+        )
     
     @staticmethod
-    async def get_calculation(params: Dict[str, Any]) -> str:
+    async def get_calculation(params: dict[str, Any]) -> str:
         """
         app.get_calculation: 現在の計算モードを取得します。
 
@@ -101,10 +111,10 @@ class AppMethods:
             計算モード
         """
         pid = params["pid"]
-        return AppAdapter.get_calculation(pid=pid)
+        return await AppAdapter.get_calculation(pid=pid)
     
     @staticmethod
-    async def get_books(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def get_books(params: dict[str, Any]) -> list[dict[str, Any]]:
         """
         app.get_books: 指定されたアプリケーションで開いているワークブックを取得します。
 
@@ -116,4 +126,19 @@ class AppMethods:
             ワークブック情報のリスト
         """
         pid = params["pid"]
-        return AppAdapter.get_app_books(pid=pid)
+        return await AppAdapter.get_app_books(pid=pid)
+
+
+# メソッド名→ハンドラの登録テーブル
+# サーバーはこのテーブルを1回走査して"app."プレフィックス付きで登録する。
+# ディスパッチは辞書引き1回と直接呼び出しのままで、メソッドを追加しても
+# server.py側の列挙は増えない。
+APP_METHODS = {
+    "list": AppMethods.list,
+    "get": AppMethods.get,
+    "create": AppMethods.create,
+    "quit": AppMethods.quit,
+    "set_calculation": AppMethods.set_calculation,
+    "get_calculation": AppMethods.get_calculation,
+    "get_books": AppMethods.get_books,
+}
@@ -3,8 +3,11 @@
 
 Excel Workbookに関連するJSON-RPCメソッドを実装します。
 """
-from typing import Dict, List, Optional, Any, Union
+from __future__ import annotations
+
+from typing import Any
 from xlwings_rpc.adapters.book_adapter import BookAdapter
+from xlwings_rpc.methods._cache import cached_read, invalidates_reads
 
 
 class BookMethods:
@@ -13,7 +16,8 @@ class BookMethods:
     """
     
     @staticmethod
-    async def list(params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    @cached_read
+    async def list(params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """
         book.list: 開いているワークブックを取得します。
 
@@ -25,10 +29,10 @@ class BookMethods:
             ワークブック情報のリスト
         """
         pid = params.get("pid") if params else None
-        return BookAdapter.get_books(pid=pid)
+        return await BookAdapter.get_books(pid=pid)
     
     @staticmethod
-    async def get(params: Dict[str, Any]) -> Dict[str, Any]:
+    async def get(params: dict[str, Any]) -> dict[str, Any]:
         """
         book.get: 特定のワークブックを取得します。
 
@@ -42,10 +46,11 @@ class BookMethods:
         """
         book_identifier = params["name"]
         pid = params.get("pid")
-        return BookAdapter.get_book(book_identifier=book_identifier, pid=pid)
+        return await BookAdapter.get_book(book_identifier=book_identifier, pid=pid)
     
     @staticmethod
-    async def open(params: Dict[str, Any]) -> Dict[str, Any]:
+    @invalidates_reads
+    async def open(params: dict[str, Any]) -> dict[str, Any]:
         """
         book.open: ワークブックを開きます。
 
@@ -63,12 +68,13 @@ class BookMethods:
         pid = params.get("pid")
         read_only = params.get("read_only", False)
         password = params.get("password")
-        return BookAdapter.open_book(
+        return await BookAdapter.open_book(
             path=path, pid=pid, read_only=read_only, password=password
         )
     
     @staticmethod
-    async def create(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    @invalidates_reads
+    async def create(params: dict[str, Any] | None = None) -> dict[str, Any]:
         """
         book.create: 新しいワークブックを作成します。
 
@@ -80,10 +86,11 @@ class BookMethods:
             新しいワークブック情報
         """
         pid = params.get("pid") if params else None
-        return BookAdapter.create_book(pid=pid)
+        return await BookAdapter.create_book(pid=pid)
     
     @staticmethod
-    async def close(params: Dict[str, Any]) -> bool:
+    @invalidates_reads
+    async def close(params: dict[str, Any]) -> bool:
         """
         book.close: ワークブックを閉じます。
 
@@ -101,12 +108,13 @@ class BookMethods:
         pid = params.get("pid")
         save = params.get("save", True)
         path = params.get("path")
-        return BookAdapter.close_book(
+        return await BookAdapter.close_book(
             book_identifier=book_identifier, pid=pid, save=save, path=path
         )
     
     @staticmethod
-    async def save(params: Dict[str, Any]) -> Dict[str, Any]:
+    @invalidates_reads
+    async def save(params: dict[str, Any]) -> dict[str, Any]:
         """
         book.save: ワークブックを保存します。
 
@@ -122,12 +130,13 @@ class BookMethods:
         book_identifier = params["name"]
         pid = params.get("pid")
         path = params.get("path")
-        return BookAdapter.save_book(
+        return await BookAdapter.save_book(
             book_identifier=book_identifier, pid=pid, path=path
         )
     
     @staticmethod
-    async def get_sheets(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    @cached_read
+    async def get_sheets(params: dict[str, Any]) -> list[dict[str, Any]]:
         """
         book.get_sheets: ワークブック内のシートを取得します。
 
@@ -141,6 +150,24 @@ class BookMethods:
         """
         book_identifier = params["name"]
         pid = params.get("pid")
-        return BookAdapter.get_book_sheets(
+        return await BookAdapter.get_book_sheets(
             book_identifier=book_identifier, pid=pid
         )
+
+    @staticmethod
+    @invalidates_reads
+    async def batch_open(params: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        book.batch_open: 複数のワークブックを並列に開いて情報を取得します。
+
+        Args:
+            params: パラメータオブジェクト
+                - paths (List[str]): ワークブックのパスのリスト
+                - read_only (Optional[bool]): 読み取り専用で開くかどうか
+
+        Returns:
+            ワークブック情報のリスト (pathsと同じ順序)
+        """
+        paths = params["paths"]
+        read_only = params.get("read_only", False)
+        return await BookAdapter.batch_open(paths=paths, read_only=read_only)
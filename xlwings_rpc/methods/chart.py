@@ -0,0 +1,223 @@
+"""
+チャート関連のRPCメソッド
+
+Excel Chartに関連するJSON-RPCメソッドを実装します。
+"""
+from __future__ import annotations
+
+from typing import Any
+from xlwings_rpc.adapters.chart_adapter import ChartAdapter
+from xlwings_rpc.methods._cache import cached_read, invalidates_reads
+
+
+class ChartMethods:
+    """
+    chart.* 名前空間のRPCメソッド実装
+    """
+
+    @staticmethod
+    async def get_chart_types() -> dict[str, str]:
+        """
+        chart.get_chart_types: 利用可能なチャートタイプの一覧を取得します。
+
+        Returns:
+            汎用チャートタイプ名とxlwingsチャートタイプ名のマッピング
+        """
+        return ChartAdapter.get_chart_types()
+
+    @staticmethod
+    @cached_read
+    async def list(params: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        chart.list: シート内のすべてのチャートを取得します。
+
+        Args:
+            params: パラメータオブジェクト
+                - book (str): ワークブック名かフルパス
+                - sheet (Union[str, int]): シート名かインデックス
+                - pid (Optional[int]): ExcelアプリケーションのプロセスID
+
+        Returns:
+            チャート情報のリスト
+        """
+        book_identifier = params["book"]
+        sheet_identifier = params["sheet"]
+        pid = params.get("pid")
+        return await ChartAdapter.get_charts(
+            book_identifier=book_identifier,
+            sheet_identifier=sheet_identifier,
+            pid=pid
+        )
+
+    @staticmethod
+    async def get(params: dict[str, Any]) -> dict[str, Any]:
+        """
+        chart.get: 特定のチャートを取得します。
+
+        Args:
+            params: パラメータオブジェクト
+                - book (str): ワークブック名かフルパス
+                - sheet (Union[str, int]): シート名かインデックス
+                - chart (Union[str, int]): チャート名かインデックス
+                - pid (Optional[int]): ExcelアプリケーションのプロセスID
+
+        Returns:
+            チャート情報
+        """
+        book_identifier = params["book"]
+        sheet_identifier = params["sheet"]
+        chart_identifier = params["chart"]
+        pid = params.get("pid")
+        return await ChartAdapter.get_chart(
+            book_identifier=book_identifier,
+            sheet_identifier=sheet_identifier,
+            chart_identifier=chart_identifier,
+            pid=pid
+        )
+
+    @staticmethod
+    @invalidates_reads
+    async def add(params: dict[str, Any]) -> dict[str, Any]:
+        """
+        chart.add: 新しいチャートを追加します。
+
+        Args:
+            params: パラメータオブジェクト
+                - book (str): ワークブック名かフルパス
+                - sheet (Union[str, int]): シート名かインデックス
+                - source (str): データソースのセル範囲 (例: "A1:B10")
+                - chart_type (Optional[str]): チャートタイプ
+                - left (Optional[float]): チャートの左位置
+                - top (Optional[float]): チャートの上位置
+                - width (Optional[float]): チャートの幅
+                - height (Optional[float]): チャートの高さ
+                - pid (Optional[int]): ExcelアプリケーションのプロセスID
+                - return_details (Optional[bool]): 完全なチャート情報を返すかどうか
+
+        Returns:
+            新しいチャート情報
+        """
+        book_identifier = params["book"]
+        sheet_identifier = params["sheet"]
+        source_address = params["source"]
+        chart_type = params.get("chart_type", "line")
+        left = params.get("left", 100)
+        top = params.get("top", 100)
+        width = params.get("width", 375)
+        height = params.get("height", 225)
+        pid = params.get("pid")
+        return_details = params.get("return_details", True)
+        return await ChartAdapter.add_chart(
+            book_identifier=book_identifier,
+            sheet_identifier=sheet_identifier,
+            source_address=source_address,
+            chart_type=chart_type,
+            left=left,
+            top=top,
+            width=width,
+            height=height,
+            pid=pid,
+            return_details=return_details
+        )
+
+    @staticmethod
+    @invalidates_reads
+    async def set_chart_type(params: dict[str, Any]) -> dict[str, Any]:
+        """
+        chart.set_chart_type: チャートタイプを変更します。
+
+        Args:
+            params: パラメータオブジェクト
+                - book (str): ワークブック名かフルパス
+                - sheet (Union[str, int]): シート名かインデックス
+                - chart (Union[str, int]): チャート名かインデックス
+                - chart_type (str): 新しいチャートタイプ (例: "line", "bar")
+                - pid (Optional[int]): ExcelアプリケーションのプロセスID
+                - return_details (Optional[bool]): 完全なチャート情報を返すかどうか
+
+        Returns:
+            更新されたチャート情報
+        """
+        book_identifier = params["book"]
+        sheet_identifier = params["sheet"]
+        chart_identifier = params["chart"]
+        chart_type = params["chart_type"]
+        pid = params.get("pid")
+        return_details = params.get("return_details", True)
+        return await ChartAdapter.set_chart_type(
+            book_identifier=book_identifier,
+            sheet_identifier=sheet_identifier,
+            chart_identifier=chart_identifier,
+            chart_type=chart_type,
+            pid=pid,
+            return_details=return_details
+        )
+
+    @staticmethod
+    @invalidates_reads
+    async def customize(params: dict[str, Any]) -> dict[str, Any]:
+        """
+        chart.customize: チャートの外観をカスタマイズします。
+
+        Args:
+            params: パラメータオブジェクト
+                - book (str): ワークブック名かフルパス
+                - sheet (Union[str, int]): シート名かインデックス
+                - chart (Union[str, int]): チャート名かインデックス
+                - title (Optional[str]): チャートタイトル
+                - chart_type (Optional[str]): チャートタイプ
+                - has_legend (Optional[bool]): 凡例を表示するかどうか
+                - legend_position (Optional[str]): 凡例の位置
+                - pid (Optional[int]): ExcelアプリケーションのプロセスID
+                - return_details (Optional[bool]): 完全なチャート情報を返すかどうか
+
+        Returns:
+            更新されたチャート情報
+        """
+        book_identifier = params["book"]
+        sheet_identifier = params["sheet"]
+        chart_identifier = params["chart"]
+        title = params.get("title")
+        chart_type = params.get("chart_type")
+        has_legend = params.get("has_legend")
+        legend_position = params.get("legend_position")
+        pid = params.get("pid")
+        return_details = params.get("return_details", True)
+        return await ChartAdapter.customize_chart(
+            book_identifier=book_identifier,
+            sheet_identifier=sheet_identifier,
+            chart_identifier=chart_identifier,
+            title=title,
+            chart_type=chart_type,
+            has_legend=has_legend,
+            legend_position=legend_position,
+            pid=pid,
+            return_details=return_details
+        )
+
+    @staticmethod
+    @invalidates_reads
+    async def delete(params: dict[str, Any]) -> bool:
+        """
+        chart.delete: チャートを削除します。
+
+        Args:
+            params: パラメータオブジェクト
+                - book (str): ワークブック名かフルパス
+                - sheet (Union[str, int]): シート名かインデックス
+                - chart (Union[str, int]): チャート名かインデックス
+                - pid (Optional[int]): ExcelアプリケーションのプロセスID
+
+        Returns:
+            成功した場合はTrue
+        """
+        book_identifier = params["book"]
+        sheet_identifier = params["sheet"]
+        chart_identifier = params["chart"]
+        pid = params.get("pid")
+        return await ChartAdapter.delete_chart(
+            book_identifier=book_identifier,
+            sheet_identifier=sheet_identifier,
+            chart_identifier=chart_identifier,
+            pid=pid
+        )
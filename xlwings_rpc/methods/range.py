@@ -3,8 +3,12 @@
 
 Excel Rangeに関連するJSON-RPCメソッドを実装します。
 """
-from typing import Dict, List, Optional, Any, Union
+from __future__ import annotations
+
+from typing import Any
+import asyncio
 from xlwings_rpc.adapters.range_adapter import RangeAdapter
+from xlwings_rpc.methods._cache import invalidates_reads
 
 
 class RangeMethods:
@@ -13,7 +17,7 @@ class RangeMethods:
     """
     
     @staticmethod
-    async def get(params: Dict[str, Any]) -> Dict[str, Any]:
+    async def get(params: dict[str, Any]) -> dict[str, Any]:
         """
         range.get: 指定された範囲を取得します。
 
@@ -31,7 +35,7 @@ class RangeMethods:
         sheet_identifier = params["sheet"]
         address = params["address"]
         pid = params.get("pid")
-        return RangeAdapter.get_range(
+        return await RangeAdapter.get_range(
             book_identifier=book_identifier,
             sheet_identifier=sheet_identifier,
             address=address,
@@ -39,7 +43,7 @@ class RangeMethods:
         )
     
     @staticmethod
-    async def get_value(params: Dict[str, Any]) -> Any:
+    async def get_value(params: dict[str, Any]) -> Any:
         """
         range.get_value: 指定された範囲の値を取得します。
 
@@ -57,7 +61,7 @@ class RangeMethods:
         sheet_identifier = params["sheet"]
         address = params["address"]
         pid = params.get("pid")
-        return RangeAdapter.get_range_value(
+        return await RangeAdapter.get_range_value(
             book_identifier=book_identifier,
             sheet_identifier=sheet_identifier,
             address=address,
@@ -65,7 +69,8 @@ class RangeMethods:
         )
     
     @staticmethod
-    async def set_value(params: Dict[str, Any]) -> Dict[str, Any]:
+    @invalidates_reads
+    async def set_value(params: dict[str, Any]) -> dict[str, Any]:
         """
         range.set_value: 指定された範囲に値を設定します。
 
@@ -76,6 +81,7 @@ class RangeMethods:
                 - address (str): セル範囲のアドレス
                 - value (Any): 設定する値
                 - pid (Optional[int]): ExcelアプリケーションのプロセスID
+                - return_minimal (Optional[bool]): 識別子だけの軽量な応答を返すかどうか
 
         Returns:
             更新された範囲情報
@@ -85,16 +91,208 @@ class RangeMethods:
         address = params["address"]
         value = params["value"]
         pid = params.get("pid")
-        return RangeAdapter.set_range_value(
+        return_minimal = params.get("return_minimal", False)
+        return await RangeAdapter.set_range_value(
             book_identifier=book_identifier,
             sheet_identifier=sheet_identifier,
             address=address,
             value=value,
-            pid=pid
+            pid=pid,
+            return_minimal=return_minimal
         )
     
     @staticmethod
-    async def get_formula(params: Dict[str, Any]) -> Any:
+    def iter_value(params: dict[str, Any]):
+        """
+        range.get_value_stream: 範囲の値を行単位で順に返します。
+
+        range.get_valueが範囲全体を1つのレスポンスにまとめるのに対し、
+        こちらは行チャンクごとに読み取りながら返す非同期ジェネレーター
+        です。巨大な範囲のストリーミングエンドポイントから使われます。
+
+        Args:
+            params: パラメータオブジェクト
+                - book (str): ワークブック名かフルパス
+                - sheet (Union[str, int]): シート名かインデックス
+                - address (str): セル範囲のアドレス
+                - pid (Optional[int]): ExcelアプリケーションのプロセスID
+
+        Returns:
+            各行の値のリストを返す非同期ジェネレーター
+        """
+        return RangeAdapter.iter_range_rows(
+            book_identifier=params["book"],
+            sheet_identifier=params["sheet"],
+            address=params["address"],
+            pid=params.get("pid")
+        )
+
+    @staticmethod
+    async def get_many(params: dict[str, Any]) -> list[Any]:
+        """
+        range.get_many: 複数の範囲の値をまとめて取得します。
+
+        各読み取りはasyncio.gatherで並行に発行されます。同じExcel
+        プロセスへのCOM呼び出しはそのプロセス専用スレッドで順に
+        実行されますが、RPC往復とPython側の処理は重なり合うため、
+        読み取りごとに往復していたクライアントの待ち時間を
+        短縮できます。
+
+        Args:
+            params: パラメータオブジェクト
+                - reads (List[Dict]): {"book", "sheet", "address", "pid"}
+                  のリスト (book/sheet/pidは省略可)
+                - book (Optional[str]): 各読み取り共通のワークブック
+                - sheet (Optional[Union[str, int]]): 各読み取り共通のシート
+                - pid (Optional[int]): 各読み取り共通のプロセスID
+
+        Returns:
+            各読み取りの値のリスト (readsと同じ順序)
+        """
+        defaults = {
+            key: params[key]
+            for key in ("book", "sheet", "pid")
+            if key in params
+        }
+        tasks = []
+        for i, read in enumerate(params["reads"]):
+            merged = {**defaults, **read}
+            # 共通パラメータで補っても埋まらない項目はInvalid Paramsで
+            # 弾く (ValueErrorはINVALID_PARAMSに変換される)
+            missing = [
+                key for key in ("book", "sheet", "address")
+                if key not in merged
+            ]
+            if missing:
+                raise ValueError(
+                    f"Missing required params in reads[{i}]: {', '.join(missing)}"
+                )
+            tasks.append(RangeAdapter.get_range_value(
+                book_identifier=merged["book"],
+                sheet_identifier=merged["sheet"],
+                address=merged["address"],
+                pid=merged.get("pid")
+            ))
+        return await asyncio.gather(*tasks)
+
+    @staticmethod
+    async def batch_get_values(params: dict[str, Any]) -> list[Any]:
+        """
+        range.batch_get_values: 同じワークブックの複数範囲を1回で読み取ります。
+
+        全読み取りを1回のRPCと1回のエグゼキューター呼び出しにまとめ、
+        読み取りごとの往復オーバーヘッドを省きます。
+
+        Args:
+            params: パラメータオブジェクト
+                - book (str): ワークブック名かフルパス
+                - items (List[Dict]): {"sheet", "address"} のリスト
+                - pid (Optional[int]): ExcelアプリケーションのプロセスID
+
+        Returns:
+            各読み取りの値のリスト (itemsと同じ順序)
+        """
+        book_identifier = params["book"]
+        items = params["items"]
+        pid = params.get("pid")
+        return await RangeAdapter.batch_get_values(
+            book_identifier=book_identifier,
+            items=items,
+            pid=pid
+        )
+
+    @staticmethod
+    @invalidates_reads
+    async def batch_set_values(params: dict[str, Any]) -> dict[str, Any]:
+        """
+        range.batch_set_values: 同じワークブックの複数範囲へ1回で書き込みます。
+
+        全書き込みを1つの再描画・再計算の抑止ウィンドウで適用します。
+        シートをまたぐ書き込みにも対応します。
+
+        Args:
+            params: パラメータオブジェクト
+                - book (str): ワークブック名かフルパス
+                - writes (List[Dict]): {"sheet", "address", "value"} のリスト
+                - pid (Optional[int]): ExcelアプリケーションのプロセスID
+
+        Returns:
+            書き込み件数とアドレスのリスト
+        """
+        book_identifier = params["book"]
+        writes = params["writes"]
+        pid = params.get("pid")
+        return await RangeAdapter.batch_set_values(
+            book_identifier=book_identifier,
+            writes=writes,
+            pid=pid
+        )
+
+    @staticmethod
+    @invalidates_reads
+    async def set_bulk(params: dict[str, Any]) -> dict[str, Any]:
+        """
+        range.set_bulk: 複数の範囲への書き込みをまとめて実行します。
+
+        Args:
+            params: パラメータオブジェクト
+                - book (str): ワークブック名かフルパス
+                - sheet (Union[str, int]): シート名かインデックス
+                - writes (List[Dict]): {"address", "value"} のリスト
+                - pid (Optional[int]): ExcelアプリケーションのプロセスID
+
+        Returns:
+            書き込み件数とアドレスのリスト
+        """
+        book_identifier = params["book"]
+        sheet_identifier = params["sheet"]
+        writes = params["writes"]
+        pid = params.get("pid")
+        return await RangeAdapter.set_ranges_bulk(
+            book_identifier=book_identifier,
+            sheet_identifier=sheet_identifier,
+            writes=writes,
+            pid=pid
+        )
+
+    @staticmethod
+    @invalidates_reads
+    async def set_multi(params: dict[str, Any]) -> dict[str, Any]:
+        """
+        range.set_multi: 飛び飛びの複数アドレスに同じ値か数式を設定します。
+
+        WindowsではUnionアドレスの複数エリアRangeを使い、セルごとの
+        COM往復を1回の書き込みにまとめます。
+
+        Args:
+            params: パラメータオブジェクト
+                - book (str): ワークブック名かフルパス
+                - sheet (Union[str, int]): シート名かインデックス
+                - addresses (List[str]): セル範囲のアドレスのリスト
+                - value (Any): 全アドレスに設定する値または数式
+                - kind (Optional[str]): "value"か"formula" (デフォルト: "value")
+                - pid (Optional[int]): ExcelアプリケーションのプロセスID
+
+        Returns:
+            書き込み件数とアドレスのリスト
+        """
+        book_identifier = params["book"]
+        sheet_identifier = params["sheet"]
+        addresses = params["addresses"]
+        value = params["value"]
+        kind = params.get("kind", "value")
+        pid = params.get("pid")
+        return await RangeAdapter.set_ranges_multi(
+            book_identifier=book_identifier,
+            sheet_identifier=sheet_identifier,
+            addresses=addresses,
+            value=value,
+            kind=kind,
+            pid=pid
+        )
+
+    @staticmethod
+    async def get_formula(params: dict[str, Any]) -> Any:
         """
         range.get_formula: 指定された範囲の数式を取得します。
 
@@ -112,7 +310,7 @@ class RangeMethods:
         sheet_identifier = params["sheet"]
         address = params["address"]
         pid = params.get("pid")
-        return RangeAdapter.get_range_formula(
+        return await RangeAdapter.get_range_formula(
             book_identifier=book_identifier,
             sheet_identifier=sheet_identifier,
             address=address,
@@ -120,7 +318,8 @@ class RangeMethods:
         )
     
     @staticmethod
-    async def set_formula(params: Dict[str, Any]) -> Dict[str, Any]:
+    @invalidates_reads
+    async def set_formula(params: dict[str, Any]) -> dict[str, Any]:
         """
         range.set_formula: 指定された範囲に数式を設定します。
 
@@ -131,6 +330,7 @@ class RangeMethods:
                 - address (str): セル範囲のアドレス
                 - formula (Any): 設定する数式
                 - pid (Optional[int]): ExcelアプリケーションのプロセスID
+                - return_minimal (Optional[bool]): 識別子だけの軽量な応答を返すかどうか
 
         Returns:
             更新された範囲情報
@@ -140,16 +340,19 @@ class RangeMethods:
         address = params["address"]
         formula = params["formula"]
         pid = params.get("pid")
-        return RangeAdapter.set_range_formula(
+        return_minimal = params.get("return_minimal", False)
+        return await RangeAdapter.set_range_formula(
             book_identifier=book_identifier,
             sheet_identifier=sheet_identifier,
             address=address,
             formula=formula,
-            pid=pid
+            pid=pid,
+            return_minimal=return_minimal
         )
     
     @staticmethod
-    async def clear(params: Dict[str, Any]) -> Dict[str, Any]:
+    @invalidates_reads
+    async def clear(params: dict[str, Any]) -> dict[str, Any]:
         """
         range.clear: 指定された範囲をクリアします。
 
@@ -159,6 +362,7 @@ class RangeMethods:
                 - sheet (Union[str, int]): シート名かインデックス
                 - address (str): セル範囲のアドレス
                 - pid (Optional[int]): ExcelアプリケーションのプロセスID
+                - return_minimal (Optional[bool]): 識別子だけの軽量な応答を返すかどうか
 
         Returns:
             クリアされた範囲情報
@@ -167,15 +371,17 @@ class RangeMethods:
         sheet_identifier = params["sheet"]
         address = params["address"]
         pid = params.get("pid")
-        return RangeAdapter.clear_range(
+        return_minimal = params.get("return_minimal", False)
+        return await RangeAdapter.clear_range(
             book_identifier=book_identifier,
             sheet_identifier=sheet_identifier,
             address=address,
-            pid=pid
+            pid=pid,
+            return_minimal=return_minimal
         )
     
     @staticmethod
-    async def get_as_dataframe(params: Dict[str, Any]) -> Dict[str, Any]:
+    async def get_as_dataframe(params: dict[str, Any]) -> dict[str, Any]:
         """
         range.get_as_dataframe: 指定された範囲をDataFrameとして取得します。
 
@@ -186,6 +392,8 @@ class RangeMethods:
                 - address (str): セル範囲のアドレス
                 - header (Optional[bool]): 最初の行をヘッダーとして使用するかどうか
                 - index (Optional[bool]): 最初の列をインデックスとして使用するかどうか
+                - compact_index (Optional[bool]): 既定のRangeIndexを
+                  {"_range": [start, stop, step]}記述子として返すかどうか
                 - pid (Optional[int]): ExcelアプリケーションのプロセスID
 
         Returns:
@@ -196,18 +404,21 @@ class RangeMethods:
         address = params["address"]
         header = params.get("header", True)
         index = params.get("index", False)
+        compact_index = params.get("compact_index", False)
         pid = params.get("pid")
-        return RangeAdapter.get_range_as_dataframe(
+        return await RangeAdapter.get_range_as_dataframe(
             book_identifier=book_identifier,
             sheet_identifier=sheet_identifier,
             address=address,
             header=header,
             index=index,
+            compact_index=compact_index,
             pid=pid
         )
     
     @staticmethod
-    async def set_dataframe(params: Dict[str, Any]) -> Dict[str, Any]:
+    @invalidates_reads
+    async def set_dataframe(params: dict[str, Any]) -> dict[str, Any]:
         """
         range.set_dataframe: 指定された範囲にDataFrameを設定します。
 
@@ -220,6 +431,9 @@ class RangeMethods:
                 - header (Optional[bool]): ヘッダーを含めるかどうか
                 - index (Optional[bool]): インデックスを含めるかどうか
                 - pid (Optional[int]): ExcelアプリケーションのプロセスID
+                - return_minimal (Optional[bool]): 識別子だけの軽量な応答を返すかどうか
+                - force_com (Optional[bool]): 閉じているブックへの直接書き込みを
+                  使わず常にCOM経由で書くかどうか
 
         Returns:
             更新された範囲情報
@@ -231,12 +445,16 @@ class RangeMethods:
         header = params.get("header", True)
         index = params.get("index", False)
         pid = params.get("pid")
-        return RangeAdapter.set_dataframe(
+        return_minimal = params.get("return_minimal", False)
+        force_com = params.get("force_com", False)
+        return await RangeAdapter.set_dataframe(
             book_identifier=book_identifier,
             sheet_identifier=sheet_identifier,
             address=address,
             dataframe=dataframe,
             header=header,
             index=index,
-            pid=pid
+            pid=pid,
+            return_minimal=return_minimal,
+            force_com=force_com
         )
@@ -3,8 +3,11 @@
 
 Excel Sheetに関連するJSON-RPCメソッドを実装します。
 """
-from typing import Dict, List, Optional, Any, Union
+from __future__ import annotations
+
+from typing import Any
 from xlwings_rpc.adapters.sheet_adapter import SheetAdapter
+from xlwings_rpc.methods._cache import cached_read, invalidates_reads
 
 
 class SheetMethods:
@@ -13,7 +16,8 @@ class SheetMethods:
     """
     
     @staticmethod
-    async def list(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    @cached_read
+    async def list(params: dict[str, Any]) -> list[dict[str, Any]]:
         """
         sheet.list: ワークブック内のすべてのシートを取得します。
 
@@ -21,16 +25,23 @@ class SheetMethods:
             params: パラメータオブジェクト
                 - book (str): ワークブック名かフルパス
                 - pid (Optional[int]): ExcelアプリケーションのプロセスID
+                - fields (Optional[List[str]]): 返す属性の指定
+                  ("name", "index", "visible"のみ)。指定すると
+                  その属性だけを読む軽量な応答になります
 
         Returns:
             シート情報のリスト
         """
         book_identifier = params["book"]
         pid = params.get("pid")
-        return SheetAdapter.get_sheets(book_identifier=book_identifier, pid=pid)
+        fields = params.get("fields")
+        return await SheetAdapter.get_sheets(
+            book_identifier=book_identifier, pid=pid, fields=fields
+        )
     
     @staticmethod
-    async def get(params: Dict[str, Any]) -> Dict[str, Any]:
+    @cached_read
+    async def get(params: dict[str, Any]) -> dict[str, Any]:
         """
         sheet.get: 特定のシートを取得します。
 
@@ -46,14 +57,15 @@ class SheetMethods:
         book_identifier = params["book"]
         sheet_identifier = params["sheet"]
         pid = params.get("pid")
-        return SheetAdapter.get_sheet(
+        return await SheetAdapter.get_sheet(
             book_identifier=book_identifier,
             sheet_identifier=sheet_identifier,
             pid=pid
         )
     
     @staticmethod
-    async def add(params: Dict[str, Any]) -> Dict[str, Any]:
+    @invalidates_reads
+    async def add(params: dict[str, Any]) -> dict[str, Any]:
         """
         sheet.add: 新しいシートを追加します。
 
@@ -64,6 +76,7 @@ class SheetMethods:
                 - before (Optional[Union[str, int]]): この前に追加
                 - after (Optional[Union[str, int]]): この後に追加
                 - pid (Optional[int]): ExcelアプリケーションのプロセスID
+                - return_minimal (Optional[bool]): 識別子だけの軽量な応答を返すかどうか
 
         Returns:
             新しいシート情報
@@ -73,16 +86,19 @@ class SheetMethods:
         before = params.get("before")
         after = params.get("after")
         pid = params.get("pid")
-        return SheetAdapter.add_sheet(
+        return_minimal = params.get("return_minimal", False)
+        return await SheetAdapter.add_sheet(
             book_identifier=book_identifier,
             name=name,
             before=before,
             after=after,
-            pid=pid
+            pid=pid,
+            return_minimal=return_minimal
         )
     
     @staticmethod
-    async def delete(params: Dict[str, Any]) -> bool:
+    @invalidates_reads
+    async def delete(params: dict[str, Any]) -> bool:
         """
         sheet.delete: シートを削除します。
 
@@ -98,14 +114,15 @@ class SheetMethods:
         book_identifier = params["book"]
         sheet_identifier = params["sheet"]
         pid = params.get("pid")
-        return SheetAdapter.delete_sheet(
+        return await SheetAdapter.delete_sheet(
             book_identifier=book_identifier,
             sheet_identifier=sheet_identifier,
             pid=pid
         )
     
     @staticmethod
-    async def rename(params: Dict[str, Any]) -> Dict[str, Any]:
+    @invalidates_reads
+    async def rename(params: dict[str, Any]) -> dict[str, Any]:
         """
         sheet.rename: シート名を変更します。
 
@@ -115,6 +132,7 @@ class SheetMethods:
                 - sheet (Union[str, int]): シート名かインデックス
                 - new_name (str): 新しいシート名
                 - pid (Optional[int]): ExcelアプリケーションのプロセスID
+                - return_minimal (Optional[bool]): 識別子だけの軽量な応答を返すかどうか
 
         Returns:
             更新されたシート情報
@@ -123,15 +141,18 @@ class SheetMethods:
         sheet_identifier = params["sheet"]
         new_name = params["new_name"]
         pid = params.get("pid")
-        return SheetAdapter.rename_sheet(
+        return_minimal = params.get("return_minimal", False)
+        return await SheetAdapter.rename_sheet(
             book_identifier=book_identifier,
             sheet_identifier=sheet_identifier,
             new_name=new_name,
-            pid=pid
+            pid=pid,
+            return_minimal=return_minimal
         )
     
     @staticmethod
-    async def clear(params: Dict[str, Any]) -> Dict[str, Any]:
+    @invalidates_reads
+    async def clear(params: dict[str, Any]) -> dict[str, Any]:
         """
         sheet.clear: シートの内容をクリアします。
 
@@ -140,6 +161,7 @@ class SheetMethods:
                 - book (str): ワークブック名かフルパス
                 - sheet (Union[str, int]): シート名かインデックス
                 - pid (Optional[int]): ExcelアプリケーションのプロセスID
+                - return_minimal (Optional[bool]): 識別子だけの軽量な応答を返すかどうか
 
         Returns:
             更新されたシート情報
@@ -147,14 +169,17 @@ class SheetMethods:
         book_identifier = params["book"]
         sheet_identifier = params["sheet"]
         pid = params.get("pid")
-        return SheetAdapter.clear_sheet(
+        return_minimal = params.get("return_minimal", False)
+        return await SheetAdapter.clear_sheet(
             book_identifier=book_identifier,
             sheet_identifier=sheet_identifier,
-            pid=pid
+            pid=pid,
+            return_minimal=return_minimal
         )
     
     @staticmethod
-    async def get_used_range(params: Dict[str, Any]) -> Dict[str, Any]:
+    @cached_read
+    async def get_used_range(params: dict[str, Any]) -> dict[str, Any]:
         """
         sheet.get_used_range: シートの使用範囲を取得します。
 
@@ -170,14 +195,14 @@ class SheetMethods:
         book_identifier = params["book"]
         sheet_identifier = params["sheet"]
         pid = params.get("pid")
-        return SheetAdapter.get_used_range(
+        return await SheetAdapter.get_used_range(
             book_identifier=book_identifier,
             sheet_identifier=sheet_identifier,
             pid=pid
         )
     
     @staticmethod
-    async def activate(params: Dict[str, Any]) -> Dict[str, Any]:
+    async def activate(params: dict[str, Any]) -> dict[str, Any]:
         """
         sheet.activate: シートをアクティブにします。
 
@@ -193,7 +218,7 @@ class SheetMethods:
         book_identifier = params["book"]
         sheet_identifier = params["sheet"]
         pid = params.get("pid")
-        return SheetAdapter.activate_sheet(
+        return await SheetAdapter.activate_sheet(
             book_identifier=book_identifier,
             sheet_identifier=sheet_identifier,
             pid=pid
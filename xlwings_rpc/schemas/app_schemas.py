@@ -31,6 +31,7 @@ class AppCreateRequest(BaseModel):
     """app.createリクエストパラメータ"""
     visible: bool = True
     add_book: bool = True
+    return_state: bool = True
 
 
 class AppQuitRequest(BaseModel):
@@ -43,6 +44,7 @@ class AppSetCalculationRequest(BaseModel):
     """app.set_calculationリクエストパラメータ"""
     pid: int
     mode: str = Field(..., description="計算モード ('automatic', 'manual', 'semiautomatic')")
+    return_state: bool = True
 
 
 class AppGetCalculationRequest(BaseModel):
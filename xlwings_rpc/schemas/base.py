@@ -3,13 +3,13 @@ JSON-RPC 2.0 基本スキーマ
 
 JSON-RPC 2.0プロトコルのリクエストとレスポンスのスキーマを定義します。
 """
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional, Union
+from pydantic import BaseModel
 
 
 class JsonRpcRequest(BaseModel):
     """JSON-RPC 2.0リクエスト"""
-    jsonrpc: str = Field("2.0", const=True)
+    jsonrpc: Literal["2.0"] = "2.0"
     method: str
     params: Optional[Union[Dict[str, Any], List[Any]]] = None
     id: Optional[Union[str, int]] = None
@@ -17,7 +17,7 @@ class JsonRpcRequest(BaseModel):
 
 class JsonRpcNotification(BaseModel):
     """JSON-RPC 2.0通知（ID無しのリクエスト）"""
-    jsonrpc: str = Field("2.0", const=True)
+    jsonrpc: Literal["2.0"] = "2.0"
     method: str
     params: Optional[Union[Dict[str, Any], List[Any]]] = None
 
@@ -31,7 +31,7 @@ class JsonRpcError(BaseModel):
 
 class JsonRpcResponse(BaseModel):
     """JSON-RPC 2.0レスポンス"""
-    jsonrpc: str = Field("2.0", const=True)
+    jsonrpc: Literal["2.0"] = "2.0"
     result: Optional[Any] = None
     error: Optional[JsonRpcError] = None
     id: Optional[Union[str, int]] = None
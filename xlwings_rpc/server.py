@@ -5,30 +5,49 @@ FastAPIを使用したJSON-RPC 2.0サーバーの実装を提供します。
 """
 from typing import Dict, Any, List, Union, Optional
 import asyncio
+import os
+import sys
+import types
 import logging
-from fastapi import FastAPI, Request, Response, HTTPException
+from fastapi import FastAPI, Request, Response, HTTPException, WebSocket
+from starlette.websockets import WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 import uvicorn
 
 from xlwings_rpc.utils.errors import (
-    PARSE_ERROR, INVALID_REQUEST, METHOD_NOT_FOUND,
+    PARSE_ERROR, INVALID_REQUEST, METHOD_NOT_FOUND, INVALID_PARAMS,
     create_error_response, handle_exception
 )
-from xlwings_rpc.utils.json_encoder import json_dumps  # 新しいインポート
-from xlwings_rpc.methods.app import AppMethods
+from xlwings_rpc.utils.json_encoder import (
+    json_dumps, json_loads, msgpack_available, msgpack_dumps
+)
+from xlwings_rpc.utils.converters import begin_request_memo, end_request_memo
+from xlwings_rpc.methods.app import APP_METHODS
 from xlwings_rpc.methods.book import BookMethods
 from xlwings_rpc.methods.sheet import SheetMethods
 from xlwings_rpc.methods.range import RangeMethods
+from xlwings_rpc.methods.chart import ChartMethods
 
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# エラーレスポンスにトレースバックを含めるかどうか
+# traceback.format_exc()は全フレームを文字列整形するため、クライアント
+# 起因のエラーも通る経路では既定で無効にし、デバッグ時のみ
+# XLWINGS_RPC_DEBUG=1で有効化する
+_DEBUG = os.environ.get("XLWINGS_RPC_DEBUG", "").lower() in ("1", "true", "yes")
+
 # FastAPIアプリケーションの作成
+# /rpcは_encode_responseで直接orjsonエンコードするため影響しないが、
+# それ以外のルート (/healthなど) も標準ライブラリのjsonではなく
+# orjsonでシリアライズする
 app = FastAPI(
     title="xlwings-rpc",
     description="JSON-RPC 2.0 API for xlwings",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS設定
@@ -42,15 +61,6 @@ app.add_middleware(
 
 # メソッドディスパッチャー
 method_dispatcher = {
-    # App メソッド
-    "app.list": AppMethods.list,
-    "app.get": AppMethods.get,
-    "app.create": AppMethods.create,
-    "app.quit": AppMethods.quit,
-    "app.set_calculation": AppMethods.set_calculation,
-    "app.get_calculation": AppMethods.get_calculation,
-    "app.get_books": AppMethods.get_books,
-    
     # Book メソッド
     "book.list": BookMethods.list,
     "book.get": BookMethods.get,
@@ -59,6 +69,7 @@ method_dispatcher = {
     "book.close": BookMethods.close,
     "book.save": BookMethods.save,
     "book.get_sheets": BookMethods.get_sheets,
+    "book.batch_open": BookMethods.batch_open,
     
     # Sheet メソッド
     "sheet.list": SheetMethods.list,
@@ -73,14 +84,142 @@ method_dispatcher = {
     # Range メソッド
     "range.get": RangeMethods.get,
     "range.get_value": RangeMethods.get_value,
+    "range.get_many": RangeMethods.get_many,
     "range.set_value": RangeMethods.set_value,
+    "range.set_bulk": RangeMethods.set_bulk,
+    "range.set_multi": RangeMethods.set_multi,
+    "range.batch_get_values": RangeMethods.batch_get_values,
+    "range.batch_set_values": RangeMethods.batch_set_values,
     "range.get_formula": RangeMethods.get_formula,
     "range.set_formula": RangeMethods.set_formula,
     "range.clear": RangeMethods.clear,
     "range.get_as_dataframe": RangeMethods.get_as_dataframe,
     "range.set_dataframe": RangeMethods.set_dataframe,
+
+    # Chart メソッド
+    "chart.get_chart_types": ChartMethods.get_chart_types,
+    "chart.list": ChartMethods.list,
+    "chart.get": ChartMethods.get,
+    "chart.add": ChartMethods.add,
+    "chart.set_chart_type": ChartMethods.set_chart_type,
+    "chart.customize": ChartMethods.customize,
+    "chart.delete": ChartMethods.delete,
 }
 
+# App メソッドは登録テーブルから一括で組み込む
+method_dispatcher.update(
+    {f"app.{name}": handler for name, handler in APP_METHODS.items()}
+)
+
+
+async def _app_batch(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    app.batch: 同じ操作対象に対する複数のメソッドをまとめて実行します。
+
+    クライアントが同じ (pid, book, sheet, chart) に対する一連の呼び出しを
+    1回のRPCで送れるようにします。共通コンテキストは各操作のパラメータに
+    マージされ、操作は順番に実行されます。
+
+    Args:
+        params: パラメータオブジェクト
+            - pid (Optional[int]): ExcelアプリケーションのプロセスID
+            - book (Optional[str]): ワークブック名かフルパス
+            - sheet (Optional[Union[str, int]]): シート名かインデックス
+            - chart (Optional[Union[str, int]]): チャート名かインデックス
+            - ops (List[Dict]): 実行する操作のリスト
+              (各要素は {"method": メソッド名, "params": パラメータ})
+
+    Returns:
+        各操作の結果のリスト
+        (成功した操作は {"result": ...}、失敗した操作は {"error": ...})
+    """
+    # 共通コンテキストの抽出
+    context = {
+        key: params[key]
+        for key in ("pid", "book", "sheet", "chart")
+        if key in params
+    }
+
+    results = []
+    for op in params.get("ops", []):
+        method = op.get("method")
+        handler = (
+            method_dispatcher.get(method)
+            if method is not None and method != "app.batch" else None
+        )
+        if handler is None:
+            results.append({
+                "error": create_error_response(METHOD_NOT_FOUND, id=None)["error"]
+            })
+            continue
+
+        # 共通コンテキストに操作ごとのパラメータを上書きマージ
+        op_params = {**context, **(op.get("params") or {})}
+        try:
+            result = await handler(op_params) if op_params else await handler()
+            results.append({"result": result})
+        except Exception as e:
+            logger.exception("Error processing batch op %s: %s", method, e)
+            results.append({"error": handle_exception(e)["error"]})
+
+    return results
+
+
+method_dispatcher["app.batch"] = _app_batch
+
+# 全メソッドの登録が終わったら読み取り専用のビューに差し替える
+# (以降はディスパッチが辞書引き1回で済むことを保証し、実行時の
+#  書き換えも防ぐ)。キーはインターンし、orjsonが返すリクエストの
+# メソッド名との比較がポインタ一致の高速パスに乗るようにする
+method_dispatcher = types.MappingProxyType(
+    {sys.intern(k): v for k, v in method_dispatcher.items()}
+)
+
+# メソッドごとの必須パラメータ
+# ハンドラーのコルーチンを生成する前に同期的に検証し、必須項目の
+# 欠けたリクエストがイベントループを余分に回さないようにする
+# (バッチリクエストに不正な項目が混ざる場合に効く)。
+# 表にないメソッドは従来どおりハンドラー内で検証する
+REQUIRED_PARAMS = types.MappingProxyType({
+    "app.quit": ("pid",),
+    "app.set_calculation": ("pid", "mode"),
+    "app.get_calculation": ("pid",),
+    "app.get_books": ("pid",),
+    "book.get": ("name",),
+    "book.open": ("path",),
+    "book.close": ("name",),
+    "book.save": ("name",),
+    "book.get_sheets": ("name",),
+    "book.batch_open": ("paths",),
+    "sheet.list": ("book",),
+    "sheet.get": ("book", "sheet"),
+    "sheet.add": ("book",),
+    "sheet.delete": ("book", "sheet"),
+    "sheet.rename": ("book", "sheet", "new_name"),
+    "sheet.clear": ("book", "sheet"),
+    "sheet.get_used_range": ("book", "sheet"),
+    "sheet.activate": ("book", "sheet"),
+    "range.get": ("book", "sheet", "address"),
+    "range.get_value": ("book", "sheet", "address"),
+    "range.get_many": ("reads",),
+    "range.set_value": ("book", "sheet", "address", "value"),
+    "range.set_bulk": ("book", "sheet", "writes"),
+    "range.set_multi": ("book", "sheet", "addresses", "value"),
+    "range.batch_get_values": ("book", "items"),
+    "range.batch_set_values": ("book", "writes"),
+    "range.get_formula": ("book", "sheet", "address"),
+    "range.set_formula": ("book", "sheet", "address", "formula"),
+    "range.clear": ("book", "sheet", "address"),
+    "range.get_as_dataframe": ("book", "sheet", "address"),
+    "range.set_dataframe": ("book", "sheet", "address", "dataframe"),
+    "chart.list": ("book", "sheet"),
+    "chart.get": ("book", "sheet", "chart"),
+    "chart.add": ("book", "sheet", "source"),
+    "chart.set_chart_type": ("book", "sheet", "chart", "chart_type"),
+    "chart.customize": ("book", "sheet", "chart"),
+    "chart.delete": ("book", "sheet", "chart"),
+})
+
 
 async def process_request(request_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -105,19 +244,32 @@ async def process_request(request_data: Dict[str, Any]) -> Dict[str, Any]:
     method = request_data["method"]
     params = request_data.get("params", {})
     
-    # メソッドの存在確認
-    if method not in method_dispatcher:
+    # メソッドの存在確認と引き当てを辞書引き1回で済ませる
+    handler = method_dispatcher.get(method)
+    if handler is None:
         return create_error_response(METHOD_NOT_FOUND, id=request_id)
-    
-    # メソッドの実行
+
+    # 必須パラメータの事前検証 (コルーチン生成前に同期的に弾く)
+    missing = [
+        key for key in REQUIRED_PARAMS.get(method, ())
+        if key not in params
+    ]
+    if missing:
+        return create_error_response(
+            INVALID_PARAMS,
+            data=f"Missing required params: {', '.join(missing)}",
+            id=request_id
+        )
+
+    # メソッドの実行 (バッチの一部でなければシリアライズメモを開始)
+    memo_token = begin_request_memo()
     try:
-        handler = method_dispatcher[method]
         result = await handler(params) if params else await handler()
-        
+
         # 通知の場合はレスポンスを返さない
         if request_id is None:
             return None
-        
+
         # 正常レスポンスの作成
         return {
             "jsonrpc": "2.0",
@@ -126,8 +278,10 @@ async def process_request(request_data: Dict[str, Any]) -> Dict[str, Any]:
         }
     except Exception as e:
         # エラーをJSON-RPC形式に変換
-        logger.exception(f"Error processing method {method}: {str(e)}")
-        return handle_exception(e, request_id, include_traceback=True)
+        logger.exception("Error processing method %s: %s", method, e)
+        return handle_exception(e, request_id, include_traceback=_DEBUG)
+    finally:
+        end_request_memo(memo_token)
 
 
 async def process_batch_request(batch_request: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -140,14 +294,34 @@ async def process_batch_request(batch_request: List[Dict[str, Any]]) -> List[Dic
     Returns:
         JSON-RPCレスポンスオブジェクトのリスト
     """
-    # 並列処理のためのタスク作成
-    tasks = [process_request(req) for req in batch_request]
-    
-    # 全タスクを実行
-    responses = await asyncio.gather(*tasks)
-    
-    # Noneの応答（通知）を除去
-    return [r for r in responses if r is not None]
+    # 通知 (idなしの正しい形のリクエスト) は応答を生成しない唯一の
+    # ケースのため、先に振り分けてまとめて末尾に並べる。gatherは
+    # 1回で全コルーチンを実行し、応答リストはNoneの後段フィルタ
+    # なしで先頭からのスライス1回で得られる
+    # バッチ全体で共有するシリアライズメモをここで開始する。gatherの
+    # 各タスクは現在のコンテキストを複製するため、同じ辞書への参照が
+    # 全リクエストに行き渡り、同一Book/Sheetの重複シリアライズが
+    # バッチにつき1回のCOM読み取りに収まる
+    memo_token = begin_request_memo()
+    try:
+        response_coros = []
+        notification_coros = []
+        for req in batch_request:
+            coro = process_request(req)
+            if (
+                isinstance(req, dict)
+                and req.get("jsonrpc") == "2.0"
+                and "method" in req
+                and req.get("id") is None
+            ):
+                notification_coros.append(coro)
+            else:
+                response_coros.append(coro)
+
+        responses = await asyncio.gather(*response_coros, *notification_coros)
+        return responses[:len(response_coros)]
+    finally:
+        end_request_memo(memo_token)
 
 
 @app.post("/rpc")
@@ -162,8 +336,8 @@ async def handle_rpc(request: Request) -> Response:
         JSON-RPCレスポンス
     """
     try:
-        # リクエストボディのパース
-        request_data = await request.json()
+        # リクエストボディのパース (stdlib jsonではなくorjsonでデコードする)
+        request_data = json_loads(await request.body())
         
         # リクエストの型に応じた処理
         if isinstance(request_data, list):
@@ -183,22 +357,142 @@ async def handle_rpc(request: Request) -> Response:
             if response_data is None:
                 return Response(status_code=204)
         
-        # レスポンスの返却 - 修正部分: カスタムJSONエンコーダーを使用
-        return Response(
-            # str()とreplaceの代わりにカスタムエンコーダーを使用
-            content=json_dumps(response_data),
-            media_type="application/json"
-        )
+        return _encode_response(request, response_data)
     except Exception as e:
         # JSONパースエラーなど
-        logger.exception(f"Error processing RPC request: {str(e)}")
+        logger.exception("Error processing RPC request: %s", e)
         response_data = create_error_response(PARSE_ERROR, id=None)
-        # エラーレスポンスもカスタムエンコーダーを使用
+        return _encode_response(request, response_data)
+
+
+def _encode_response(request: Request, response_data: Any) -> Response:
+    """
+    レスポンスをクライアントの希望する形式にエンコードします。
+
+    Acceptヘッダーがapplication/x-msgpackを含み、msgpackが利用可能な
+    場合はMessagePackで返します。大きな範囲の値を受け取るクライアントは
+    JSON文字列化のコストとペイロードサイズを削減できます。それ以外は
+    カスタムエンコーダーによるJSONで返します。
+
+    Args:
+        request: FastAPIリクエストオブジェクト
+        response_data: エンコードするレスポンスデータ
+
+    Returns:
+        エンコード済みのResponse
+    """
+    if (
+        msgpack_available()
+        and "application/x-msgpack" in request.headers.get("accept", "")
+    ):
         return Response(
-            content=json_dumps(response_data),
+            content=msgpack_dumps(response_data),
+            media_type="application/x-msgpack"
+        )
+    return Response(
+        content=json_dumps(response_data),
+        media_type="application/json"
+    )
+
+
+@app.websocket("/rpc/ws")
+async def handle_rpc_ws(websocket: WebSocket) -> None:
+    """
+    JSON-RPC 2.0のWebSocketエンドポイント
+
+    1本の接続上で任意の数のリクエストを処理します。呼び出しごとの
+    TCPハンドシェイクとHTTPのパース・ヘッダー処理が不要になるため、
+    小さなペイロードを高頻度で送るクライアント (ポーリングUIや
+    ダッシュボードなど) の呼び出しあたりのコストが下がります。
+    フレームの中身は/rpcと同じJSON-RPC 2.0のリクエスト
+    (単一またはバッチ配列) で、テキスト・バイナリのどちらの
+    フレームでも受け付けます。
+
+    Args:
+        websocket: FastAPIのWebSocket接続
+    """
+    await websocket.accept()
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            raw = message.get("bytes")
+            if raw is None:
+                raw = message.get("text", "")
+
+            try:
+                request_data = json_loads(raw)
+            except Exception:
+                response_data = create_error_response(PARSE_ERROR, id=None)
+            else:
+                if isinstance(request_data, list):
+                    if not request_data:
+                        response_data = create_error_response(
+                            INVALID_REQUEST, id=None
+                        )
+                    else:
+                        response_data = await process_batch_request(request_data)
+                        # すべて通知の場合は何も返さない
+                        if not response_data:
+                            continue
+                else:
+                    response_data = await process_request(request_data)
+                    # 通知の場合は何も返さない
+                    if response_data is None:
+                        continue
+
+            # json_dumpsはstrを返すため、encode()で余計なコピーを作らず
+            # テキストフレームとしてそのまま送る
+            await websocket.send_text(json_dumps(response_data))
+    except WebSocketDisconnect:
+        pass
+
+
+@app.post("/rpc/stream/range.get_value")
+async def stream_range_value(request: Request) -> Response:
+    """
+    range.get_valueのストリーミング版エンドポイント
+
+    範囲の値を1行1JSONのNDJSON (application/x-ndjson) として
+    チャンク転送で返します。範囲全体をメモリ上で1つのJSON文字列に
+    組み立てないため、巨大な範囲でもピークメモリが行チャンク1つ分に
+    抑えられ、クライアントは最初の行から順に処理を始められます。
+    リクエストボディはrange.get_valueと同じパラメータオブジェクトです。
+
+    Args:
+        request: FastAPIリクエストオブジェクト
+            (ボディ: {"book", "sheet", "address", "pid"})
+
+    Returns:
+        NDJSONのストリーミングレスポンス
+        (範囲を解決できない場合はHTTP 400のエラーレスポンス)
+    """
+    try:
+        params = json_loads(await request.body())
+        rows = RangeMethods.iter_value(params)
+        # 最初の行を先に取得し、範囲の解決エラーをストリーム開始前に
+        # HTTPエラーとして返せるようにする
+        try:
+            first = await anext(rows)
+        except StopAsyncIteration:
+            first = None
+    except Exception as e:
+        logger.exception("Error processing streaming request: %s", e)
+        return Response(
+            content=json_dumps({"error": str(e)}),
+            status_code=400,
             media_type="application/json"
         )
 
+    async def ndjson():
+        if first is not None:
+            yield json_dumps(first).encode() + b"\n"
+            async for row in rows:
+                yield json_dumps(row).encode() + b"\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
 
 @app.get("/health")
 async def health_check() -> Dict[str, str]:
@@ -211,15 +505,38 @@ async def health_check() -> Dict[str, str]:
     return {"status": "ok"}
 
 
-def start_server(host: str = "127.0.0.1", port: int = 8000):
+def start_server(host: str = "127.0.0.1", port: int = 8000, keep_alive: int = 75):
     """
     サーバーを起動します。
-    
+
+    利用可能であればuvloop(C実装のイベントループ)とhttptools(C実装の
+    HTTPパーサー)を使用します。uvloopが使えない環境 (Windowsなど) では
+    標準のイベントループにフォールバックします。
+
     Args:
         host: ホストアドレス
         port: ポート番号
+        keep_alive: アイドル接続を維持する秒数 (デフォルト: 75)
     """
-    uvicorn.run(app, host=host, port=port)
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "auto"
+
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "auto"
+
+    # keep-aliveを長めに取り、クライアントが一連の呼び出しを1本の
+    # TCP接続で使い回せるようにする (接続確立のコストはJSON-RPCの
+    # 呼び出しコストの中で大きな割合を占める)
+    uvicorn.run(
+        app, host=host, port=port, loop=loop, http=http,
+        timeout_keep_alive=keep_alive
+    )
 
 
 if __name__ == "__main__":
@@ -228,6 +545,15 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="xlwings-rpc server")
     parser.add_argument("--host", default="127.0.0.1", help="Host address to bind")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind")
-    
+    parser.add_argument("--keep-alive", type=int, default=75,
+                        help="Seconds to keep idle connections open")
+    parser.add_argument("--range-cache", action="store_true",
+                        help="Reuse resolved Range handles across calls "
+                             "(faster polling, but stale handles are "
+                             "possible if Excel is edited externally)")
+
     args = parser.parse_args()
-    start_server(args.host, args.port)
+    if args.range_cache:
+        from xlwings_rpc.adapters._resolve import enable_range_cache
+        enable_range_cache()
+    start_server(args.host, args.port, args.keep_alive)
@@ -4,8 +4,11 @@
 xlwingsのオブジェクトとJSON-RPC間でのデータ変換を行います。
 """
 from typing import Any, Dict, List, Union, Optional
+from dataclasses import dataclass
+import contextvars
 import datetime
 import logging
+import sys
 import xlwings as xw
 import numpy as np
 import pandas as pd
@@ -14,237 +17,772 @@ import pandas as pd
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# リクエスト (またはバッチ) 単位のシリアライズ結果メモ
+# バッチ内では同じBookやSheetが複数のメソッドから繰り返し
+# シリアライズされるため、App/Book/Sheetの結果をIDキーで記憶して
+# 重複するCOM読み取りをバッチにつき1回に抑える。リクエストの外では
+# Noneのままで、メモは一切働かない
+_serialize_memo: "contextvars.ContextVar[Optional[Dict[tuple, Any]]]" = \
+    contextvars.ContextVar("_serialize_memo", default=None)
+
+
+def begin_request_memo() -> Optional["contextvars.Token"]:
+    """
+    リクエスト処理用のシリアライズメモを開始します。
+
+    既にメモが有効な場合 (バッチ内の個別リクエストなど) は何もせず、
+    Noneを返します。サーバーのリクエスト処理の入り口から呼び出します。
+
+    Returns:
+        end_request_memo()に渡すトークン、開始不要だった場合はNone
+    """
+    if _serialize_memo.get() is None:
+        return _serialize_memo.set({})
+    return None
+
+
+def end_request_memo(token: Optional["contextvars.Token"]) -> None:
+    """
+    リクエスト処理用のシリアライズメモを終了します。
+
+    Args:
+        token: begin_request_memo()が返したトークン
+    """
+    if token is not None:
+        _serialize_memo.reset(token)
+
+
+def clear_request_memo() -> None:
+    """
+    有効なシリアライズメモの内容を破棄します。
+
+    変更系メソッドの実行後に呼び出します。バッチ内の後続の読み取りが
+    書き込み前のApp/Book/Sheetスナップショットを返さないよう、共有
+    されている辞書そのものを空にします (contextvarの差し替えでは
+    バッチの他タスクに波及しません)。
+    """
+    memo = _serialize_memo.get()
+    if memo is not None:
+        memo.clear()
+
+
+def _memoized_serialize(obj: Any, key: tuple, serializer: Any) -> Any:
+    """
+    メモが有効ならシリアライズ結果をキー単位で再利用します。
+
+    Args:
+        obj: シリアライズするオブジェクト
+        key: メモのキー (種別名とオブジェクトの識別子)
+        serializer: ミス時に呼び出すシリアライザー
+
+    Returns:
+        シリアライズ結果
+    """
+    memo = _serialize_memo.get()
+    if memo is None:
+        return serializer(obj)
+    result = memo.get(key)
+    if result is None:
+        result = serializer(obj)
+        memo[key] = result
+    return result
+
+
+def _serialize_identity(obj: Any) -> Any:
+    """そのままシリアライズ可能な値を返します。"""
+    return obj
+
+
+def _serialize_isoformat(obj: Any) -> str:
+    """日付型をISO 8601文字列に変換します。"""
+    return obj.isoformat()
+
+
+def _serialize_sequence(obj: Any) -> List[Any]:
+    """リスト・タプルを再帰的に変換します。"""
+    return [to_serializable(item) for item in obj]
+
+
+def _serialize_dict(obj: Dict[Any, Any]) -> Dict[Any, Any]:
+    """辞書を再帰的に変換します。"""
+    return {k: to_serializable(v) for k, v in obj.items()}
+
+
+def _serialize_ndarray(obj: "np.ndarray") -> Any:
+    """
+    NumPy配列を変換します。
+
+    数値・真偽値のdtypeではtolist()が既にPythonの組み込み型を返す
+    ため、要素ごとの再帰変換を省いて1回の変換で済ませます。
+    object配列や日付配列は従来どおり再帰的に変換します。
+    """
+    if obj.dtype.kind in "fiub":
+        return obj.tolist()
+    return to_serializable(obj.tolist())
+
+
+def _serialize_index(index: "pd.Index", compact: bool = False) -> Any:
+    """
+    Pandasのインデックス (または列名) を変換します。
+
+    compact=Trueの場合、既定のRangeIndexはN要素のリストを作らず、
+    O(1)の{"_range": [start, stop, step]}記述子として送ります。
+    from_json_value側で同じ形からRangeIndexを復元します。既定では
+    従来どおりリストに展開します (既存クライアントの応答形式を
+    変えないため、記述子はクライアントのオプトイン)。
+
+    Args:
+        index: 変換するインデックス
+        compact: RangeIndexを記述子として送るかどうか
+
+    Returns:
+        リストまたはRangeIndex記述子
+    """
+    if compact and type(index) is pd.RangeIndex:
+        return {"_range": [index.start, index.stop, index.step]}
+    return to_serializable(index.tolist())
+
+
+def dataframe_payload(obj: "pd.DataFrame", compact_index: bool = False) -> Dict[str, Any]:
+    """
+    Pandas DataFrameをレスポンス形式の辞書に変換します。
+
+    データ部が数値・真偽値のdtypeの場合は要素ごとの再帰変換を
+    省きます (インデックスと列名は小さいため常に再帰変換します)。
+    compact_index=Trueの場合は既定のRangeIndexをリストに展開せず
+    記述子として送ります (range.get_as_dataframeのcompact_index
+    パラメータから渡されます)。
+
+    Args:
+        obj: 変換するDataFrame
+        compact_index: RangeIndexを記述子として送るかどうか
+
+    Returns:
+        DataFrame情報の辞書
+    """
+    values = obj.values
+    if values.dtype.kind in "fiub":
+        data = values.tolist()
+    else:
+        data = to_serializable(values.tolist())
+    return {
+        "type": "dataframe",
+        "index": _serialize_index(obj.index, compact=compact_index),
+        "columns": _serialize_index(obj.columns, compact=compact_index),
+        "data": data
+    }
+
+
+def _serialize_dataframe(obj: "pd.DataFrame") -> Dict[str, Any]:
+    """Pandas DataFrameを既定の形式で変換します。"""
+    return dataframe_payload(obj)
+
+
+def _serialize_series(obj: "pd.Series") -> Dict[str, Any]:
+    """
+    Pandas Seriesを変換します。
+
+    DataFrameと同様、数値・真偽値のdtypeでは要素ごとの再帰変換を
+    省きます。
+    """
+    values = obj.values
+    if values.dtype.kind in "fiub":
+        data = values.tolist()
+    else:
+        data = to_serializable(values.tolist())
+    return {
+        "type": "series",
+        "index": _serialize_index(obj.index),
+        "data": data
+    }
+
+
+def _safe_attrs(obj: Any, spec: tuple, kind: str) -> Dict[str, Any]:
+    """
+    属性読み取りをtry/exceptで包みながら辞書を組み立てます。
+
+    xlwingsオブジェクトの各シリアライザーが繰り返していた
+    「読み取り→失敗したら既定値と警告ログ」の定型を1箇所にまとめます。
+
+    Args:
+        obj: 読み取るオブジェクト
+        spec: (キー, 読み取り関数, 既定値) のタプルの並び
+        kind: ログメッセージ用のオブジェクト種別名
+
+    Returns:
+        読み取った値の辞書
+    """
+    out = {}
+    for key, getter, default in spec:
+        try:
+            out[key] = getter(obj)
+        except Exception as e:
+            out[key] = default
+            logger.warning("Error getting %s %s: %s", kind, key, e)
+    return out
+
+
+# 属性ごとの読み取り仕様 (キー, 読み取り関数, 失敗時の既定値)
+_APP_ATTR_SPEC = (
+    ("version", lambda obj: obj.version, "unknown"),
+    ("visible", lambda obj: obj.visible, None),
+    ("screen_updating", lambda obj: obj.screen_updating, None),
+    ("display_alerts", lambda obj: obj.display_alerts, None),
+)
+_BOOK_ATTR_SPEC = (
+    ("name", lambda obj: obj.name, "unknown"),
+    ("fullname", lambda obj: obj.fullname, None),
+    ("path", lambda obj: obj.fullname, None),
+    ("app_id", lambda obj: obj.app.pid if obj.app else None, None),
+    ("sheets", lambda obj: [sheet.name for sheet in obj.sheets], []),
+)
+_SHEET_ATTR_SPEC = (
+    ("name", lambda obj: obj.name, "unknown"),
+    ("book_name", lambda obj: obj.book.name, None),
+    ("index", lambda obj: obj.index, None),
+    ("used_range", lambda obj: str(obj.used_range.address), None),
+)
+_RANGE_ATTR_SPEC = (
+    ("address", lambda obj: obj.address, "unknown"),
+    ("sheet_name", lambda obj: obj.sheet.name, None),
+    ("book_name", lambda obj: obj.sheet.book.name, None),
+    ("value", lambda obj: to_serializable(obj.value), None),
+    ("formula", lambda obj: to_serializable(obj.formula), None),
+    ("shape", lambda obj: obj.shape, None),
+    ("row", lambda obj: obj.row, None),
+    ("column", lambda obj: obj.column, None),
+    ("row_height", lambda obj: obj.row_height, None),
+    ("column_width", lambda obj: obj.column_width, None),
+)
+_CHART_ATTR_SPEC = (
+    ("name", lambda obj: obj.name, "unknown"),
+    ("chart_type", lambda obj: str(obj.chart_type), None),
+    ("sheet_name", lambda obj: obj.parent.name, None),
+    ("left", lambda obj: obj.left, None),
+    ("top", lambda obj: obj.top, None),
+    ("width", lambda obj: obj.width, None),
+    ("height", lambda obj: obj.height, None),
+)
+
+
+def _serialize_app(obj: "xw.App") -> Dict[str, Any]:
+    """xlwings Appオブジェクトを変換します。"""
+    # WindowsではCOMハンドルを1度だけ取得してまとめて読み取り、
+    # 失敗時のみ属性ごとの読み取りにフォールバックする
+    if sys.platform == 'win32':
+        try:
+            return _app_bulk_read(obj)
+        except Exception as e:
+            logger.warning("Bulk app read failed, falling back to per-attribute read: %s", e)
+
+    app_data = {"id": obj.pid}
+    app_data.update(_safe_attrs(obj, _APP_ATTR_SPEC, "app"))
+
+    # MacOS の k.missing_value エラーに対応
+    try:
+        app_data["calculation"] = str(obj.calculation)
+    except KeyError as e:
+        # MacOS では計算モードが取得できない場合がある
+        if "k.missing_value" in str(e):
+            app_data["calculation"] = "unknown"
+            logger.warning("MacOS specific error: Unable to get calculation mode due to k.missing_value")
+        else:
+            raise
+    except Exception as e:
+        app_data["calculation"] = "unknown"
+        logger.warning("Error getting app calculation mode: %s", e)
+
+    return app_data
+
+
+def _serialize_book(obj: "xw.Book") -> Dict[str, Any]:
+    """xlwings Bookオブジェクトを変換します。"""
+    if sys.platform == 'win32':
+        try:
+            return _book_bulk_read(obj)
+        except Exception as e:
+            logger.warning("Bulk book read failed, falling back to per-attribute read: %s", e)
+
+    return _safe_attrs(obj, _BOOK_ATTR_SPEC, "book")
+
+
+def _serialize_sheet(obj: "xw.Sheet") -> Dict[str, Any]:
+    """xlwings Sheetオブジェクトを変換します。"""
+    if sys.platform == 'win32':
+        try:
+            return _sheet_bulk_read(obj)
+        except Exception as e:
+            logger.warning("Bulk sheet read failed, falling back to per-attribute read: %s", e)
+
+    return _safe_attrs(obj, _SHEET_ATTR_SPEC, "sheet")
+
+
+def _serialize_range(obj: "xw.Range") -> Dict[str, Any]:
+    """xlwings Rangeオブジェクトを変換します。"""
+    if sys.platform == 'win32':
+        try:
+            return _range_bulk_read(obj)
+        except Exception as e:
+            logger.warning("Bulk range read failed, falling back to per-attribute read: %s", e)
+
+    return _safe_attrs(obj, _RANGE_ATTR_SPEC, "range")
+
+
+def _serialize_chart(obj: "xw.Chart") -> Dict[str, Any]:
+    """xlwings Chartオブジェクトを変換します。"""
+    # WindowsではCOMハンドルを1度だけ取得してまとめて読み取り、
+    # 失敗時のみ属性ごとの読み取りにフォールバックする
+    if sys.platform == 'win32':
+        try:
+            return _chart_bulk_read(obj)
+        except Exception as e:
+            logger.warning("Bulk chart read failed, falling back to per-attribute read: %s", e)
+
+    return _safe_attrs(obj, _CHART_ATTR_SPEC, "chart")
+
+
+# 具象型からハンドラーへの変換テーブル
+# セル値1つごとに長いisinstanceの連鎖をたどる代わりに、type(obj)の
+# 辞書引き1回でハンドラーを引き当てる。サブクラスはここにヒット
+# しないため、to_serializable本体のisinstanceフォールバックで拾う
+_TYPE_HANDLERS = {
+    type(None): _serialize_identity,
+    bool: _serialize_identity,
+    int: _serialize_identity,
+    float: _serialize_identity,
+    str: _serialize_identity,
+    datetime.datetime: _serialize_isoformat,
+    datetime.date: _serialize_isoformat,
+    list: _serialize_sequence,
+    tuple: _serialize_sequence,
+    dict: _serialize_dict,
+    np.ndarray: _serialize_ndarray,
+    pd.DataFrame: _serialize_dataframe,
+    pd.Series: _serialize_series,
+    # NumPyスカラーはPythonの組み込み型に変換する (np.int64はintの
+    # サブクラスではないため、変換しないと最終手段のstr()に落ちる)
+    np.int8: int,
+    np.int16: int,
+    np.int32: int,
+    np.int64: int,
+    np.uint8: int,
+    np.uint16: int,
+    np.uint32: int,
+    np.uint64: int,
+    np.float16: float,
+    np.float32: float,
+    np.float64: float,
+    np.bool_: bool,
+}
+
 
 def to_serializable(obj: Any) -> Any:
     """
     オブジェクトをJSONシリアライズ可能な形式に変換します。
 
+    具象型は_TYPE_HANDLERSの辞書引き1回でハンドラーに直行します。
+    テーブルにない型 (組み込み型のサブクラスやxlwingsのオブジェクト)
+    はisinstanceで判定します。xlwings型の判定は呼び出し頻度の高い
+    順 (Rangeが先頭) に並べています。
+
     Args:
         obj: 変換するオブジェクト
 
     Returns:
         JSONシリアライズ可能なオブジェクト
     """
-    # 基本型はそのまま返す
+    handler = _TYPE_HANDLERS.get(type(obj))
+    if handler is not None:
+        return handler(obj)
+
+    # 基本型のサブクラス (np.float64など)
     if obj is None or isinstance(obj, (bool, int, float, str)):
         return obj
-    
-    # 日付型の変換
     if isinstance(obj, datetime.datetime):
         return obj.isoformat()
     if isinstance(obj, datetime.date):
         return obj.isoformat()
-    
-    # リストの変換（再帰的に変換）
     if isinstance(obj, (list, tuple)):
-        return [to_serializable(item) for item in obj]
-    
-    # 辞書の変換（再帰的に変換）
+        return _serialize_sequence(obj)
     if isinstance(obj, dict):
-        return {k: to_serializable(v) for k, v in obj.items()}
-    
-    # NumPy配列の変換
+        return _serialize_dict(obj)
     if isinstance(obj, np.ndarray):
-        return to_serializable(obj.tolist())
-    
-    # Pandas DataFrameの変換
+        return _serialize_ndarray(obj)
+    if isinstance(obj, np.generic):
+        # テーブルにない残りのNumPyスカラー (np.datetime64など) は
+        # item()でPythonの値に変換してから再帰的に処理する
+        return to_serializable(obj.item())
     if isinstance(obj, pd.DataFrame):
-        return {
-            "type": "dataframe",
-            "index": to_serializable(obj.index.tolist()),
-            "columns": to_serializable(obj.columns.tolist()),
-            "data": to_serializable(obj.values.tolist())
-        }
-    
-    # Pandas Seriesの変換
+        return _serialize_dataframe(obj)
     if isinstance(obj, pd.Series):
-        return {
-            "type": "series",
-            "index": to_serializable(obj.index.tolist()),
-            "data": to_serializable(obj.values.tolist())
-        }
-    
-    # xlwings App オブジェクトの変換
-    if isinstance(obj, xw.App):
-        app_data = {"id": obj.pid}
-        
-        # 各プロパティを個別に try-except で囲む
-        try:
-            app_data["version"] = obj.version
-        except Exception as e:
-            app_data["version"] = "unknown"
-            logger.warning(f"Error getting app version: {str(e)}")
-        
-        try:
-            app_data["visible"] = obj.visible
-        except Exception as e:
-            app_data["visible"] = None
-            logger.warning(f"Error getting app visibility: {str(e)}")
-        
-        # MacOS の k.missing_value エラーに対応
-        try:
-            app_data["calculation"] = str(obj.calculation)
-        except KeyError as e:
-            # MacOS では計算モードが取得できない場合がある
-            if "k.missing_value" in str(e):
-                app_data["calculation"] = "unknown"
-                logger.warning("MacOS specific error: Unable to get calculation mode due to k.missing_value")
-            else:
-                raise
-        except Exception as e:
-            app_data["calculation"] = "unknown"
-            logger.warning(f"Error getting app calculation mode: {str(e)}")
-        
-        try:
-            app_data["screen_updating"] = obj.screen_updating
-        except Exception as e:
-            app_data["screen_updating"] = None
-            logger.warning(f"Error getting app screen_updating: {str(e)}")
-        
-        try:
-            app_data["display_alerts"] = obj.display_alerts
-        except Exception as e:
-            app_data["display_alerts"] = None
-            logger.warning(f"Error getting app display_alerts: {str(e)}")
-        
-        return app_data
-    
-    # xlwings Book オブジェクトの変換
-    if isinstance(obj, xw.Book):
-        book_data = {}
-        
-        try:
-            book_data["name"] = obj.name
-        except Exception as e:
-            book_data["name"] = "unknown"
-            logger.warning(f"Error getting book name: {str(e)}")
-        
-        try:
-            book_data["fullname"] = obj.fullname
-        except Exception as e:
-            book_data["fullname"] = None
-            logger.warning(f"Error getting book fullname: {str(e)}")
-        
-        try:
-            book_data["path"] = obj.fullname
-        except Exception as e:
-            book_data["path"] = None
-            logger.warning(f"Error getting book path: {str(e)}")
-        
-        try:
-            book_data["app_id"] = obj.app.pid if obj.app else None
-        except Exception as e:
-            book_data["app_id"] = None
-            logger.warning(f"Error getting book app_id: {str(e)}")
-        
-        try:
-            book_data["sheets"] = [sheet.name for sheet in obj.sheets]
-        except Exception as e:
-            book_data["sheets"] = []
-            logger.warning(f"Error getting book sheets: {str(e)}")
-        
-        return book_data
-    
-    # xlwings Sheet オブジェクトの変換
-    if isinstance(obj, xw.Sheet):
-        sheet_data = {}
-        
-        try:
-            sheet_data["name"] = obj.name
-        except Exception as e:
-            sheet_data["name"] = "unknown"
-            logger.warning(f"Error getting sheet name: {str(e)}")
-        
-        try:
-            sheet_data["book_name"] = obj.book.name
-        except Exception as e:
-            sheet_data["book_name"] = None
-            logger.warning(f"Error getting sheet book_name: {str(e)}")
-        
-        try:
-            sheet_data["index"] = obj.index
-        except Exception as e:
-            sheet_data["index"] = None
-            logger.warning(f"Error getting sheet index: {str(e)}")
-        
-        try:
-            sheet_data["used_range"] = str(obj.used_range.address)
-        except Exception as e:
-            sheet_data["used_range"] = None
-            logger.warning(f"Error getting sheet used_range: {str(e)}")
-        
-        return sheet_data
-    
-    # xlwings Range オブジェクトの変換
+        return _serialize_series(obj)
+
+    # xlwings型 (頻度順)。Rangeは呼び出しごとにほぼ一意なためメモの
+    # 対象外とし、バッチ内で繰り返し現れるApp/Book/Sheetのみメモする
     if isinstance(obj, xw.Range):
-        range_data = {}
-        
-        try:
-            range_data["address"] = obj.address
-        except Exception as e:
-            range_data["address"] = "unknown"
-            logger.warning(f"Error getting range address: {str(e)}")
-        
-        try:
-            range_data["sheet_name"] = obj.sheet.name
-        except Exception as e:
-            range_data["sheet_name"] = None
-            logger.warning(f"Error getting range sheet_name: {str(e)}")
-        
-        try:
-            range_data["book_name"] = obj.sheet.book.name
-        except Exception as e:
-            range_data["book_name"] = None
-            logger.warning(f"Error getting range book_name: {str(e)}")
-        
-        try:
-            range_data["value"] = to_serializable(obj.value)
-        except Exception as e:
-            range_data["value"] = None
-            logger.warning(f"Error getting range value: {str(e)}")
-        
-        try:
-            range_data["formula"] = to_serializable(obj.formula)
-        except Exception as e:
-            range_data["formula"] = None
-            logger.warning(f"Error getting range formula: {str(e)}")
-        
-        try:
-            range_data["shape"] = obj.shape
-        except Exception as e:
-            range_data["shape"] = None
-            logger.warning(f"Error getting range shape: {str(e)}")
-        
-        try:
-            range_data["row"] = obj.row
-        except Exception as e:
-            range_data["row"] = None
-            logger.warning(f"Error getting range row: {str(e)}")
-        
+        return _serialize_range(obj)
+    if isinstance(obj, xw.Sheet):
         try:
-            range_data["column"] = obj.column
-        except Exception as e:
-            range_data["column"] = None
-            logger.warning(f"Error getting range column: {str(e)}")
-        
+            key = ("sheet", obj.book.name, obj.name)
+        except Exception:
+            return _serialize_sheet(obj)
+        return _memoized_serialize(obj, key, _serialize_sheet)
+    if isinstance(obj, xw.Book):
         try:
-            range_data["row_height"] = obj.row_height
-        except Exception as e:
-            range_data["row_height"] = None
-            logger.warning(f"Error getting range row_height: {str(e)}")
-        
+            key = ("book", obj.fullname)
+        except Exception:
+            return _serialize_book(obj)
+        return _memoized_serialize(obj, key, _serialize_book)
+    if isinstance(obj, xw.App):
         try:
-            range_data["column_width"] = obj.column_width
-        except Exception as e:
-            range_data["column_width"] = None
-            logger.warning(f"Error getting range column_width: {str(e)}")
-        
-        return range_data
-    
+            key = ("app", obj.pid)
+        except Exception:
+            return _serialize_app(obj)
+        return _memoized_serialize(obj, key, _serialize_app)
+    if isinstance(obj, xw.Chart):
+        return _serialize_chart(obj)
+
     # その他のオブジェクトは文字列に変換
     return str(obj)
 
 
+@dataclass(slots=True)
+class BookInfo:
+    """
+    ワークブック情報のレコード
+
+    シリアライズのホットループでは辞書の代わりにこのレコードを組み立て、
+    as_dict()で最終的な形に変換します。__slots__により項目ごとの
+    辞書リサイズとハッシュ計算を避けます。
+    """
+    name: str
+    fullname: Optional[str]
+    path: Optional[str]
+    app_id: Optional[int]
+    sheets: List[str]
+
+    @classmethod
+    def from_book(cls, book: "xw.Book") -> "BookInfo":
+        """
+        Bookハンドルからレコードを構築します。
+
+        WindowsではCOMオブジェクトを1度だけ取得してまとめて読み取り、
+        それ以外のプラットフォームや失敗時は属性ごとの読み取りに
+        フォールバックします。
+
+        Args:
+            book: Bookハンドル
+
+        Returns:
+            BookInfoレコード
+        """
+        if sys.platform == 'win32':
+            try:
+                return cls(**_book_bulk_read(book))
+            except Exception as e:
+                logger.warning("Bulk book read failed, falling back to per-attribute read: %s", e)
+
+        data = to_serializable(book)
+        return cls(
+            name=data.get("name"),
+            fullname=data.get("fullname"),
+            path=data.get("path"),
+            app_id=data.get("app_id"),
+            sheets=data.get("sheets", []),
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """to_serializable(book)と同じ形の辞書を返します。"""
+        return {
+            "name": self.name,
+            "fullname": self.fullname,
+            "path": self.path,
+            "app_id": self.app_id,
+            "sheets": self.sheets,
+        }
+
+
+@dataclass(slots=True)
+class SheetInfo:
+    """
+    シート情報のレコード
+
+    BookInfoと同様、ホットループでの辞書組み立てを置き換えます。
+    """
+    name: str
+    book_name: Optional[str]
+    index: Optional[int]
+    used_range: Optional[str]
+
+    @classmethod
+    def from_sheet(cls, sheet: "xw.Sheet") -> "SheetInfo":
+        """
+        Sheetハンドルからレコードを構築します。
+
+        Args:
+            sheet: Sheetハンドル
+
+        Returns:
+            SheetInfoレコード
+        """
+        data = to_serializable(sheet)
+        return cls(
+            name=data.get("name"),
+            book_name=data.get("book_name"),
+            index=data.get("index"),
+            used_range=data.get("used_range"),
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """to_serializable(sheet)と同じ形の辞書を返します。"""
+        return {
+            "name": self.name,
+            "book_name": self.book_name,
+            "index": self.index,
+            "used_range": self.used_range,
+        }
+
+
+# WindowsのXlCalculation定数 → xlwings相当のモード名
+_CALCULATION_NAMES = {
+    -4105: 'automatic',
+    -4135: 'manual',
+    2: 'semiautomatic',
+}
+
+
+def _app_bulk_read(app: "xw.App") -> Dict[str, Any]:
+    """
+    アプリケーション情報を1つのCOMハンドル経由でまとめて読み取ります。
+
+    Windows専用。apiハンドルを1度だけ取得し、各プロパティを属性ごとの
+    ラッパー経由ではなくそのハンドルから連続して読み取ります。
+
+    Args:
+        app: Appハンドル
+
+    Returns:
+        to_serializable(app)と同じ形の辞書
+    """
+    api = app.api
+    calculation = api.Calculation
+    return {
+        "id": app.pid,
+        "version": str(api.Version),
+        "visible": bool(api.Visible),
+        "calculation": _CALCULATION_NAMES.get(calculation, str(calculation)),
+        "screen_updating": bool(api.ScreenUpdating),
+        "display_alerts": bool(api.DisplayAlerts),
+    }
+
+
+def _book_com_read(wb: Any, app_id: Optional[int]) -> Dict[str, Any]:
+    """
+    生のCOM Workbookオブジェクトからワークブック情報を読み取ります。
+
+    Windows専用。Bookハンドル経由の_book_bulk_readと、アダプター側の
+    Workbooksコレクション走査の両方から使われます。
+
+    Args:
+        wb: COMのWorkbookオブジェクト
+        app_id: 属するアプリケーションのPID
+
+    Returns:
+        to_serializable(book)と同じ形の辞書
+    """
+    fullname = str(wb.FullName)
+    return {
+        "name": str(wb.Name),
+        "fullname": fullname,
+        "path": fullname,
+        "app_id": app_id,
+        "sheets": [ws.Name for ws in wb.Worksheets],
+    }
+
+
+def _book_bulk_read(book: "xw.Book") -> Dict[str, Any]:
+    """
+    ワークブック情報を1つのCOMハンドル経由でまとめて読み取ります。
+
+    Windows専用。BookInfo.from_bookと_serialize_bookの両方から
+    使われます。
+
+    Args:
+        book: Bookハンドル
+
+    Returns:
+        to_serializable(book)と同じ形の辞書
+    """
+    return _book_com_read(book.api, book.app.pid if book.app else None)
+
+
+def _sheet_com_read(ws: Any, book_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    生のCOM Worksheetオブジェクトからシート情報を読み取ります。
+
+    Windows専用。Sheetハンドル経由の_sheet_bulk_readと、アダプター側の
+    Worksheetsコレクション走査の両方から使われます。
+
+    Args:
+        ws: COMのWorksheetオブジェクト
+        book_name: 属するブック名 (省略時はws.Parentから読み取る)
+
+    Returns:
+        to_serializable(sheet)と同じ形の辞書
+    """
+    try:
+        used_range = str(ws.UsedRange.Address)
+    except Exception:
+        used_range = None
+    return {
+        "name": str(ws.Name),
+        "book_name": book_name if book_name is not None else str(ws.Parent.Name),
+        "index": int(ws.Index),
+        "used_range": used_range,
+    }
+
+
+def _sheet_bulk_read(sheet: "xw.Sheet") -> Dict[str, Any]:
+    """
+    シート情報を1つのCOMハンドル経由でまとめて読み取ります。
+
+    Windows専用。
+
+    Args:
+        sheet: Sheetハンドル
+
+    Returns:
+        to_serializable(sheet)と同じ形の辞書
+    """
+    return _sheet_com_read(sheet.api)
+
+
+def _range_bulk_read(rng: "xw.Range") -> Dict[str, Any]:
+    """
+    範囲情報を1つのCOMハンドル経由でまとめて読み取ります。
+
+    Windows専用。位置・サイズなどのメタデータはapiハンドルから連続で
+    読み取ります。値と数式は日付などの型変換をxlwingsに任せるため、
+    従来どおりラッパー経由で読み取ります。
+
+    Args:
+        rng: Rangeハンドル
+
+    Returns:
+        to_serializable(range)と同じ形の辞書
+    """
+    api = rng.api
+    sheet = rng.sheet
+    return {
+        "address": str(api.Address),
+        "sheet_name": sheet.name,
+        "book_name": sheet.book.name,
+        "value": to_serializable(rng.value),
+        "formula": to_serializable(rng.formula),
+        "shape": (api.Rows.Count, api.Columns.Count),
+        "row": api.Row,
+        "column": api.Column,
+        "row_height": api.RowHeight,
+        "column_width": api.ColumnWidth,
+    }
+
+
+def _chart_bulk_read(chart: "xw.Chart", sheet_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    チャート情報を1つのCOMハンドル経由でまとめて読み取ります。
+
+    Windows専用。chart.apiは(ChartObject, Chart)のタプルを返すため、
+    ChartObjectを1度だけ取得し、位置・サイズをそのハンドルから
+    連続して読み取ります。
+
+    Args:
+        chart: Chartハンドル
+        sheet_name: チャートが属するシート名 (省略時はchart.parentから取得)
+
+    Returns:
+        to_serializable(chart)と同じ形の辞書
+    """
+    chart_object = chart.api[0]
+    return {
+        "name": str(chart_object.Name),
+        "chart_type": str(chart.chart_type),
+        "sheet_name": sheet_name if sheet_name is not None else chart.parent.name,
+        "left": chart_object.Left,
+        "top": chart_object.Top,
+        "width": chart_object.Width,
+        "height": chart_object.Height,
+    }
+
+
+def to_serializable_many(charts: Any, sheet_name: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    チャートコレクションを一括でシリアライズします。
+
+    to_serializable(chart)はチャートごとに属性単位のクロスプロセス
+    呼び出しを繰り返すため、Windowsではチャート1つにつきCOMハンドルを
+    1度だけ取得して位置・サイズをまとめて読み取ります。シート名は
+    呼び出し側が既に知っているため引数で受け取り、チャートごとの
+    parent.name往復を省きます。
+
+    Args:
+        charts: Chartのコレクション (またはリスト)
+        sheet_name: チャートが属するシート名 (オプション)
+
+    Returns:
+        チャート情報のリスト
+    """
+    if sys.platform != 'win32':
+        results = [to_serializable(chart) for chart in charts]
+        if sheet_name is not None:
+            for data in results:
+                data["sheet_name"] = sheet_name
+        return results
+
+    results = []
+    for chart in charts:
+        try:
+            results.append(_chart_bulk_read(chart, sheet_name))
+        except Exception as e:
+            logger.warning("Bulk chart read failed, falling back to per-attribute read: %s", e)
+            results.append(to_serializable(chart))
+    return results
+
+
+def book_snapshot_fast(book: "xw.Book") -> Dict[str, Any]:
+    """
+    ワークブック情報を一括で読み取ってシリアライズします。
+
+    to_serializable(book)は属性ごとにクロスプロセス呼び出しを行い、
+    さらに各属性をtry/exceptで包むため、BookInfo経由の一括読み取りに
+    委譲します。返す辞書の形はto_serializable(book)と同一です。
+
+    Args:
+        book: Bookハンドル
+
+    Returns:
+        ワークブック情報
+    """
+    return BookInfo.from_book(book).as_dict()
+
+
+def _index_from_json(value: Any) -> Any:
+    """
+    JSON化されたインデックスを復元します。
+
+    _serialize_indexが送るRangeIndex記述子はRangeIndexに戻し、
+    それ以外はそのままpandasに渡します。
+
+    Args:
+        value: リストまたはRangeIndex記述子
+
+    Returns:
+        復元されたインデックス値
+    """
+    if isinstance(value, dict) and "_range" in value:
+        return pd.RangeIndex(*value["_range"])
+    return value
+
+
 def from_json_value(value: Any) -> Any:
     """
     JSON値をPythonオブジェクトに変換します。
@@ -270,15 +808,15 @@ def from_json_value(value: Any) -> Any:
         if value.get("type") == "dataframe" and all(k in value for k in ["data", "columns", "index"]):
             return pd.DataFrame(
                 data=value["data"],
-                index=value["index"],
-                columns=value["columns"]
+                index=_index_from_json(value["index"]),
+                columns=_index_from_json(value["columns"])
             )
-        
+
         # Seriesの復元
         if value.get("type") == "series" and all(k in value for k in ["data", "index"]):
             return pd.Series(
                 data=value["data"],
-                index=value["index"]
+                index=_index_from_json(value["index"])
             )
         
         # 通常の辞書は再帰的に変換
@@ -41,6 +41,19 @@ ERROR_MESSAGES = {
 }
 
 
+# 例外クラス → (エラーコード, メッセージ生成関数) の変換テーブル
+# isinstanceの連鎖を毎回たどる代わりに、type(exception)の辞書引き
+# 1回で引き当てる。定義順はサブクラスのフォールバック判定の
+# 優先順位を兼ねる
+_EXCEPTION_TABLE: Dict[Type[Exception], tuple] = {
+    xw.XlwingsError: (EXCEL_ERROR, str),
+    ConnectionError: (EXCEL_NOT_FOUND, lambda e: "Failed to connect to Excel"),
+    FileNotFoundError: (WORKBOOK_NOT_FOUND, lambda e: f"File not found: {str(e)}"),
+    ValueError: (INVALID_PARAMS, str),
+    PermissionError: (PERMISSION_ERROR, str),
+    TimeoutError: (TIMEOUT_ERROR, lambda e: "Operation timed out"),
+}
+
 def create_error_response(
     code: int, 
     message: Optional[str] = None, 
@@ -95,35 +108,29 @@ def handle_exception(
     Returns:
         JSON-RPC 2.0形式のエラーレスポンス
     """
-    # xlwings固有の例外を処理
-    if isinstance(exception, xw.XlwingsError):
-        code = EXCEL_ERROR
-        message = str(exception)
-    elif isinstance(exception, ConnectionError):
-        code = EXCEL_NOT_FOUND
-        message = "Failed to connect to Excel"
-    elif isinstance(exception, FileNotFoundError):
-        code = WORKBOOK_NOT_FOUND
-        message = f"File not found: {str(exception)}"
-    elif isinstance(exception, ValueError):
-        code = INVALID_PARAMS
-        message = str(exception)
-    elif isinstance(exception, PermissionError):
-        code = PERMISSION_ERROR
-        message = str(exception)
-    elif isinstance(exception, TimeoutError):
-        code = TIMEOUT_ERROR
-        message = "Operation timed out"
+    # 具象型の変換テーブルを先に引き、ヒットしなければ
+    # サブクラスのためにisinstanceで引き当てる (テーブルの定義順)
+    entry = _EXCEPTION_TABLE.get(type(exception))
+    if entry is None:
+        for exc_type, candidate in _EXCEPTION_TABLE.items():
+            if isinstance(exception, exc_type):
+                entry = candidate
+                break
+
+    if entry is not None:
+        code = entry[0]
+        message = entry[1](exception)
     else:
         # その他の例外はInternal Errorとして処理
         code = INTERNAL_ERROR
         message = f"Internal error: {str(exception)}"
 
-    # 追加データにトレースバックを含める
+    # 追加データにトレースバックを含める (フレーム数を抑えて
+    # 整形コストとペイロードサイズを有界にする)
     data = None
     if include_traceback:
         data = {
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc(limit=10)
         }
 
     return create_error_response(code, message, data, id)
@@ -0,0 +1,110 @@
+"""
+Excel呼び出し用エグゼキュータ
+
+ブロッキングするxlwings呼び出し(COM/AppleScript)をイベントループの外の
+スレッドで実行するためのヘルパーを提供します。
+
+WindowsのCOMはアパートメントスレッディングの制約があるため、
+PIDごとに1スレッドのエグゼキュータを割り当て、同じExcelプロセスへの
+呼び出しが常に同じスレッドから行われるようにします。
+"""
+from typing import Any, Callable, Dict, Optional
+import sys
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+
+if sys.platform == 'win32':
+    try:
+        import pythoncom
+
+        def _init_com_thread():
+            """ワーカースレッドでCOMを初期化します。"""
+            pythoncom.CoInitialize()
+    except ImportError:
+        def _init_com_thread():
+            """pythoncomが利用できない場合は何もしません。"""
+            pass
+else:
+    def _init_com_thread():
+        """Windows以外では初期化は不要です。"""
+        pass
+
+
+# PIDに紐づかない呼び出し用の共有エグゼキュータ
+_DEFAULT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=4,
+    thread_name_prefix="xlwings-rpc",
+    initializer=_init_com_thread
+)
+
+# PIDごとの1スレッドエグゼキュータ
+_PID_EXECUTORS: Dict[int, ThreadPoolExecutor] = {}
+
+
+def _get_executor(pid: Optional[int] = None) -> ThreadPoolExecutor:
+    """
+    指定されたPIDに対応するエグゼキュータを取得します。
+
+    Args:
+        pid: ExcelアプリケーションのプロセスID (Noneの場合は共有エグゼキュータ)
+
+    Returns:
+        エグゼキュータ
+    """
+    if pid is None:
+        return _DEFAULT_EXECUTOR
+
+    executor = _PID_EXECUTORS.get(pid)
+    if executor is None:
+        executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=f"xlwings-rpc-pid-{pid}",
+            initializer=_init_com_thread
+        )
+        _PID_EXECUTORS[pid] = executor
+    return executor
+
+
+async def run_in_excel_executor(
+    func: Callable[..., Any],
+    *args: Any,
+    pid: Optional[int] = None,
+    **kwargs: Any
+) -> Any:
+    """
+    ブロッキングするxlwings呼び出しをエグゼキュータで実行します。
+
+    Args:
+        func: 実行する同期関数
+        *args: 関数に渡す位置引数
+        pid: 対象ExcelアプリケーションのプロセスID (オプション)
+        **kwargs: 関数に渡すキーワード引数
+
+    Returns:
+        関数の戻り値
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(pid),
+        functools.partial(func, *args, **kwargs)
+    )
+
+
+def shutdown_pid_executor(pid: int) -> None:
+    """
+    指定されたPIDのエグゼキュータを破棄します。
+
+    Excelアプリケーションの終了後に呼び出します。
+
+    Args:
+        pid: ExcelアプリケーションのプロセスID
+    """
+    executor = _PID_EXECUTORS.pop(pid, None)
+    if executor is not None:
+        executor.shutdown(wait=False)
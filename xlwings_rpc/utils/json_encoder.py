@@ -6,16 +6,44 @@ Python標準のJSONEncoderを拡張し、xlwingsの特殊なオブジェクト
 """
 import json
 from typing import Any
+import orjson
 import xlwings as xw
 import numpy as np
 import pandas as pd
 import datetime
 import logging
-from xlwings_rpc.utils.converters import to_serializable
+from xlwings_rpc.utils.converters import to_serializable, _serialize_index
+
+# msgpackはオプション依存。無ければJSONのみで応答する
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# 具象型からハンドラーへの変換テーブル
+# isinstanceでNumPyの抽象基底クラスを毎回たどる代わりに、
+# type(obj)の辞書引き1回で変換する
+_TYPE_HANDLERS = {
+    np.int8: int,
+    np.int16: int,
+    np.int32: int,
+    np.int64: int,
+    np.uint8: int,
+    np.uint16: int,
+    np.uint32: int,
+    np.uint64: int,
+    np.float16: float,
+    np.float32: float,
+    np.float64: float,
+    np.bool_: bool,
+    np.ndarray: lambda o: o.tolist(),
+    datetime.datetime: lambda o: o.isoformat(),
+    datetime.date: lambda o: o.isoformat(),
+}
+
 
 class XlwingsRpcJSONEncoder(json.JSONEncoder):
     """
@@ -35,53 +63,160 @@ class XlwingsRpcJSONEncoder(json.JSONEncoder):
         Returns:
             JSONシリアライズ可能なオブジェクト
         """
-        # 既存のto_serializable関数を利用
+        # 具象型の変換テーブルを先に引く（ヒットすれば1回の辞書引きで済む）
+        handler = _TYPE_HANDLERS.get(type(obj))
+        if handler is not None:
+            return handler(obj)
+
+        # 既存のto_serializable関数を利用。日付・NumPyスカラー・
+        # VersionNumberなどはすべてここで変換される
         result = to_serializable(obj)
-        
-        # to_serializable関数で変換した結果がオブジェクトと同一の場合
-        # （変換されなかった場合）は追加の変換処理を試みる
+
+        # to_serializableが素通しするのは基本型とそのサブクラスのみで、
+        # それらは通常defaultに到達しない。念のため標準の処理に委ね、
+        # 最終手段として文字列化する
         if result is obj:
-            # 日付型の変換
-            if isinstance(obj, datetime.datetime):
-                return obj.isoformat()
-            if isinstance(obj, datetime.date):
-                return obj.isoformat()
-            
-            # xlwings特有のVersionNumberクラスの処理
-            if hasattr(obj, '__class__') and obj.__class__.__name__ == 'VersionNumber':
-                return str(obj)
-            
-            # NumPy型の変換
-            if isinstance(obj, (np.integer, np.int64, np.int32)):
-                return int(obj)
-            if isinstance(obj, (np.floating, np.float64, np.float32)):
-                return float(obj)
-            if isinstance(obj, np.bool_):
-                return bool(obj)
-            
-            # 複合型の場合、通常のJSONEncoderのdefault処理を試みる
             try:
                 return super().default(obj)
             except TypeError:
-                # 最終手段として文字列化
                 return str(obj)
-        
+
         return result
 
 
+def _orjson_fallback(obj: Any) -> Any:
+    """
+    orjsonが直接扱えないオブジェクトを変換します。
+
+    Args:
+        obj: 変換するオブジェクト
+
+    Returns:
+        JSONシリアライズ可能なオブジェクト
+    """
+    # Pandas DataFrame / Seriesの変換
+    if isinstance(obj, pd.DataFrame):
+        values = obj.to_numpy(copy=False)
+        if values.dtype == np.dtype(object):
+            # 混合型はPythonのリストに展開する
+            data = values.tolist()
+        else:
+            # 数値のみのDataFrameはndarrayのまま渡し、
+            # OPT_SERIALIZE_NUMPYにC側で変換させる
+            data = values
+        return {
+            "type": "dataframe",
+            "index": _serialize_index(obj.index),
+            "columns": _serialize_index(obj.columns),
+            "data": data
+        }
+    if isinstance(obj, pd.Series):
+        return {
+            "type": "series",
+            "index": _serialize_index(obj.index),
+            "data": obj.values.tolist()
+        }
+
+    # xlwingsのオブジェクトなどは既存の変換関数に委譲
+    result = to_serializable(obj)
+    if result is obj:
+        # 変換されなかった場合は最終手段として文字列化
+        return str(obj)
+    return result
+
+
+def msgpack_available() -> bool:
+    """
+    msgpackエンコードが利用可能かどうかを返します。
+
+    Returns:
+        msgpackがインストールされている場合はTrue
+    """
+    return msgpack is not None
+
+
+def _msgpack_fallback(obj: Any) -> Any:
+    """
+    msgpackが直接扱えないオブジェクトを変換します。
+
+    Args:
+        obj: 変換するオブジェクト
+
+    Returns:
+        msgpackでシリアライズ可能なオブジェクト
+    """
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return _orjson_fallback(obj)
+
+
+def msgpack_dumps(obj: Any) -> bytes:
+    """
+    オブジェクトをMessagePackのバイト列に変換します。
+
+    大きな2次元配列のレスポンスではJSONの文字列化より小さく速い
+    バイナリ表現になります。クライアントがAcceptヘッダーで
+    application/x-msgpackを指定した場合に使われます。
+
+    Args:
+        obj: 変換するオブジェクト
+
+    Returns:
+        MessagePackのバイト列
+    """
+    return msgpack.packb(obj, use_bin_type=True, default=_msgpack_fallback)
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    JSONバイト列をPythonオブジェクトに変換します。
+
+    標準ライブラリのjsonではなくorjson (C実装) でパースします。
+    大きな2次元配列を含むリクエストボディのデコードが数倍速くなります。
+
+    Args:
+        data: JSONのバイト列または文字列
+
+    Returns:
+        パースされたオブジェクト
+
+    Raises:
+        orjson.JSONDecodeError: 不正なJSONの場合
+    """
+    return orjson.loads(data)
+
+
 def json_dumps(obj: Any) -> str:
     """
     オブジェクトをJSON文字列に変換します。
-    
+
+    NumPy配列・スカラーや日付型はorjsonがネイティブに(C実装で)
+    シリアライズし、それ以外は_orjson_fallbackで変換します。
+
     Args:
         obj: 変換するオブジェクト
-        
+
     Returns:
         JSON文字列
     """
     try:
-        return json.dumps(obj, cls=XlwingsRpcJSONEncoder)
+        # JSONプリミティブのみの場合はフォールバック無しの高速パスで完結する
+        # (orjsonは非プリミティブに当たった時だけTypeErrorを投げる)
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass
+
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=_orjson_fallback
+        ).decode()
     except Exception as e:
-        logger.error(f"JSONシリアライズエラー: {str(e)}")
+        logger.error("JSONシリアライズエラー: %s", e)
         # 最終手段として、通常のJSON変換を試みる
         return json.dumps({"error": f"シリアライズエラー: {str(e)}"})